@@ -179,7 +179,7 @@ async def test_ingest(
         return {"status": "ok", "ingested": ingested, "message": "no records for conversation"}
     
     # Simple summary: take last 1-2 snippets and stitch
-    snippets = [r.raw_text.strip() for r in history[-2:] if r.raw_text.strip()]
+    snippets = [s for r in history[-2:] if (s := r.raw_text.strip())]
     summary = ". ".join(s.rstrip(".") for s in snippets if s)
     if summary and not summary.endswith("."):
         summary += "."
@@ -19,7 +19,7 @@ from app.text.chunker import Chunk, TextChunker
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class IngestMessage:
     """Structured message extracted from an ingest webhook payload."""
 
@@ -127,7 +127,7 @@ class CallbackProcessor:
             try:
                 embedding_results = self._embed_chunks(chunk_pairs)
             except Exception as exc:
-                self._dlq.write(body, f"embedding:{exc}", {"payload": payload})
+                self._dlq.write(body, f"embedding:{exc}")
                 raise
             records: List[MemoryRecord] = []
             for (message, _), embedding in zip(chunk_pairs, embedding_results):
@@ -136,16 +136,16 @@ class CallbackProcessor:
             try:
                 upserted = self._store.upsert(records)
             except Exception as exc:
-                self._dlq.write(body, f"pinecone:{exc}", {"payload": payload})
+                self._dlq.write(body, f"pinecone:{exc}")
                 raise
             # Hot index is no longer needed with Pinecone
             added = upserted
             evicted = 0
         except ValueError as exc:
-            self._dlq.write(body, f"payload:{exc}", {"payload": payload})
+            self._dlq.write(body, f"payload:{exc}")
             raise
         except Exception as exc:
-            self._dlq.write(body, f"pipeline:{exc}", {"payload": payload})
+            self._dlq.write(body, f"pipeline:{exc}")
             raise
         logger.info(
             "Processed ingest callback",
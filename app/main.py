@@ -6,6 +6,7 @@ import logging
 from pathlib import Path
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from app.api.routes import router
 from app.logging import setup_logging
@@ -19,7 +20,12 @@ async def lifespan(app: FastAPI):
 
 def create_app() -> FastAPI:
     setup_logging(Path("logs"))
-    app = FastAPI(title="Echo Memory Service", version="1.0.0", lifespan=lifespan)
+    app = FastAPI(
+        title="Echo Memory Service",
+        version="1.0.0",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+    )
     container = AppState.build()
     app.state.container = container
     logger = logging.getLogger(__name__)
@@ -25,7 +25,7 @@ class MemorySpeaker(str, Enum):
     OTHER = "other"
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryRecord:
     """In-memory representation of a Pinecone vector with metadata."""
 
@@ -9,6 +9,7 @@ from typing import Iterable, List, Optional, Sequence
 from uuid import uuid4
 
 import lancedb
+import numpy as np
 import pyarrow as pa
 import pyarrow.dataset as ds
 
@@ -16,7 +17,21 @@ from app.config import Settings, get_settings
 
 logger = logging.getLogger(__name__)
 
-MEMORY_SCHEMA_VERSION = "1.0"
+MEMORY_SCHEMA_VERSION = "1.1"
+
+
+def quantize_vector(vector: Sequence[float]) -> tuple[list[int], float]:
+    """Symmetric int8 quantization with a per-vector scale."""
+    values = np.asarray(vector, dtype=np.float32)
+    peak = float(np.abs(values).max()) if values.size else 0.0
+    scale = peak / 127.0 if peak > 0 else 1.0
+    codes = np.clip(np.rint(values / scale), -127, 127).astype(np.int8)
+    return codes.tolist(), scale
+
+
+def dequantize_vector(codes: Sequence[int], scale: float) -> list[float]:
+    """Inverse of quantize_vector."""
+    return (np.asarray(codes, dtype=np.float32) * np.float32(scale)).tolist()
 
 
 class MemorySpeaker(str, Enum):
@@ -28,7 +43,7 @@ class MemorySpeaker(str, Enum):
     OTHER = "other"
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryRecord:
     """In-memory representation of a LanceDB row."""
 
@@ -83,6 +98,10 @@ class MemoryRecord:
         ts = row.get("ts")
         if isinstance(ts, datetime) and ts.tzinfo is None:
             ts = ts.replace(tzinfo=timezone.utc)
+        vector = row.get("vector", []) or []
+        scale = row.get("vector_scale")
+        if scale is not None:
+            vector = dequantize_vector(vector, scale)
         speaker_value = row.get("speaker", MemorySpeaker.OTHER.value)
         try:
             speaker = MemorySpeaker(speaker_value)
@@ -96,7 +115,7 @@ class MemoryRecord:
             ts=ts or datetime.now(timezone.utc),
             raw_text=row.get("raw_text", ""),
             normalized_text=row.get("normalized_text", ""),
-            vector=row.get("vector", []) or [],
+            vector=vector,
             tags=row.get("tags", []) or [],
             hash=row.get("hash", ""),
             source=row.get("source", ""),
@@ -115,6 +134,8 @@ class MemoryStore:
             self._settings.lance_db_path.mkdir(parents=True, exist_ok=True)
         self._conn = lancedb.connect(db_uri)
         self._table = self._ensure_table()
+        # Tables created before schema 1.1 keep float32 vectors without a scale column
+        self._quantized = "vector_scale" in self._table.schema.names
         self._ensure_metadata()
 
     @property
@@ -153,7 +174,8 @@ class MemoryStore:
                 pa.field("ts", pa.timestamp("us", tz="UTC")),
                 pa.field("raw_text", pa.string()),
                 pa.field("normalized_text", pa.string()),
-                pa.field("vector", pa.list_(pa.float32())),
+                pa.field("vector", pa.list_(pa.int8())),
+                pa.field("vector_scale", pa.float32()),
                 pa.field("tags", pa.list_(pa.string())),
                 pa.field("hash", pa.string()),
                 pa.field("source", pa.string()),
@@ -185,6 +207,9 @@ class MemoryStore:
         pending = [row for row in payload if row["hash"] not in existing_hashes]
         if not pending:
             return 0
+        if self._quantized:
+            for row in pending:
+                row["vector"], row["vector_scale"] = quantize_vector(row["vector"])
         self._table.add(pending)
         return len(pending)
 
@@ -198,10 +223,10 @@ class MemoryStore:
         if table.num_rows == 0:
             return []
         table = table.sort_by([("ts", "ascending"), ("turn", "ascending")])
-        records = [MemoryRecord.from_row(row) for row in table.to_pylist()]
-        if limit is not None:
-            return records[-limit:]
-        return records
+        if limit:
+            # Slice in Arrow so only the returned rows are converted to Python
+            table = table.slice(max(table.num_rows - limit, 0))
+        return [MemoryRecord.from_row(row) for row in table.to_pylist()]
 
     def get_by_ids(self, ids: Sequence[str]) -> List[MemoryRecord]:
         """Fetch records by their UUID identifiers."""
@@ -222,10 +247,10 @@ class MemoryStore:
         if table.num_rows == 0:
             return []
         table = table.sort_by([("ts", "ascending"), ("turn", "ascending")])
-        records = [MemoryRecord.from_row(row) for row in table.to_pylist()]
-        if limit is not None:
-            return records[-limit:]
-        return records
+        if limit:
+            # Slice in Arrow so only the returned rows are converted to Python
+            table = table.slice(max(table.num_rows - limit, 0))
+        return [MemoryRecord.from_row(row) for row in table.to_pylist()]
 
     def _existing_hashes(self, hashes: Sequence[str]) -> set[str]:
         if not hashes:
@@ -240,8 +265,5 @@ class MemoryStore:
     def all_records(self, limit: Optional[int] = None) -> List[MemoryRecord]:
         """Return all records from LanceDB (use cautiously for large datasets)."""
         dataset = self._table.to_lance()
-        table = dataset.to_table()
-        records = [MemoryRecord.from_row(row) for row in table.to_pylist()]
-        if limit is not None:
-            return records[:limit]
-        return records
+        table = dataset.head(limit) if limit is not None else dataset.to_table()
+        return [MemoryRecord.from_row(row) for row in table.to_pylist()]
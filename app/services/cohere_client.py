@@ -12,7 +12,7 @@ from app.config import Settings, get_settings
 from app.text.chunker import Chunk
 
 
-@dataclass
+@dataclass(slots=True)
 class EmbeddingResult:
     """Embedding payload paired with original chunk."""
 
@@ -24,7 +24,7 @@ except ImportError:  # pragma: no cover - legacy fallback
     _LEGACY_OPENAI = True
 
 
-@dataclass
+@dataclass(slots=True)
 class EmbeddingResult:
     """Embedding payload paired with original chunk."""
 
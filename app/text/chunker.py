@@ -41,7 +41,7 @@ class NormalizationPipeline:
         return result
 
 
-@dataclass
+@dataclass(slots=True)
 class Chunk:
     """Represents a chunk of text after token-based splitting."""
 
@@ -5,18 +5,32 @@ Complete integration with proven utterance capture
 """
 
 import os
-import requests
-import json
+import asyncio
+import hashlib
+import heapq
+import logging
+import math
+import httpx
+import orjson
+import re
+import threading
+import time
+from collections import Counter, OrderedDict, deque
 from datetime import datetime
+from functools import lru_cache, partial
+from itertools import count, islice
 from typing import Dict, List, Optional, Any
 from dotenv import load_dotenv
 from openai import OpenAI
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 import uvicorn
 import lancedb
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 import numpy as np
 from uuid import uuid4
 
@@ -34,19 +48,52 @@ DEEPSEEK_API_KEY = os.getenv("DEEPSEEK_API_KEY")
 COHERE_API_KEY = os.getenv("COHERE_API_KEY")
 BASE_URL = "https://tavusapi.com/v2"
 
-# Initialize DeepSeek client
+# Per-turn memory/embedding traces are DEBUG logs: skipped without formatting unless ECHO_VERBOSE is set
+logger = logging.getLogger("echo.memory")
+logger.setLevel(logging.INFO)
+if os.getenv("ECHO_VERBOSE"):
+    logger.setLevel(logging.DEBUG)
+    logger.addHandler(logging.StreamHandler())
+
+# Memory ANN search: IVF partitions probed (~0.9 recall at 10) and PQ candidates re-ranked exactly
+VECTOR_SEARCH_NPROBES = int(os.getenv("AURORA_VECTOR_NPROBES", "10"))
+VECTOR_SEARCH_REFINE_FACTOR = int(os.getenv("AURORA_VECTOR_REFINE_FACTOR", "2"))
+
+# Cohere embed endpoint with a pooled keep-alive client; embeddings are requested from worker threads
+COHERE_EMBED_URL = "https://api.cohere.ai/v1/embed"
+cohere_client = httpx.Client(
+    headers={"Authorization": f"Bearer {COHERE_API_KEY}", "Content-Type": "application/json"},
+    limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+    timeout=15
+)
+
+# Initialize DeepSeek client with a pooled keep-alive transport shared by all calls
 deepseek_client = OpenAI(
     api_key=DEEPSEEK_API_KEY,
-    base_url="https://api.deepseek.com"
+    base_url="https://api.deepseek.com",
+    http_client=httpx.Client(limits=httpx.Limits(max_connections=50, max_keepalive_connections=20))
+)
+
+# Shared async Tavus client: keep-alive pool so conversation setup skips repeat TLS handshakes
+tavus_client = httpx.AsyncClient(
+    base_url=BASE_URL,
+    headers={"x-api-key": TAVUS_API_KEY or "", "Content-Type": "application/json"},
+    # Retries cover connection failures only; Tavus error responses come straight back
+    transport=httpx.AsyncHTTPTransport(retries=3, limits=httpx.Limits(max_keepalive_connections=8)),
+    timeout=20
 )
 
+# Local ngrok agent API; it either answers immediately or is not running
+NGROK_TUNNELS_URL = "http://localhost:4040/api/tunnels"
+NGROK_URL_TTL = 30.0
+ngrok_client = httpx.AsyncClient(timeout=0.5)
+_ngrok_url_cache = (0.0, None)  # (expires_at, url)
+
 # User-specific live metrics that update in real-time
 user_metrics = {}  # Dictionary to store metrics per user
 
-def get_user_metrics(user_id: str):
-    """Get or create metrics for a specific user"""
-    if user_id not in user_metrics:
-        user_metrics[user_id] = {
+# Baseline live metrics; the list fields are mutable and get fresh lists in new_user_metrics
+_USER_METRICS_TEMPLATE = {
     "relationship_level": 25.0,
     "trust_level": 35.0,
     "emotional_sync": 45.0,
@@ -57,49 +104,105 @@ def get_user_metrics(user_id: str):
     "conversation_turns": 0,
     "recent_insights": [],
     "conversation_active": False,
-            "last_updated": datetime.now().isoformat(),
-            # Enhanced trend tracking
-            "relationship_trend": "stable",
-            "trust_trend": "stable",
-            "emotional_trend": "stable",
-            "memory_trend": "stable",
-            # Additional psychological metrics
-            "authenticity_level": 5.0,
-            "stress_level": 3.0,
-            "growth_level": 5.0,
-            "behavioral_patterns": []
-        }
-    return user_metrics[user_id]
+    "last_updated": None,
+    # Enhanced trend tracking
+    "relationship_trend": "stable",
+    "trust_trend": "stable",
+    "emotional_trend": "stable",
+    "memory_trend": "stable",
+    # Additional psychological metrics
+    "authenticity_level": 5.0,
+    "stress_level": 3.0,
+    "growth_level": 5.0,
+    "behavioral_patterns": []
+}
+
+def new_user_metrics() -> Dict[str, Any]:
+    """Baseline metrics dict copied from the template"""
+    return {
+        **_USER_METRICS_TEMPLATE,
+        "recent_insights": [],
+        "behavioral_patterns": [],
+        "last_updated": datetime.now().isoformat()
+    }
+
+def get_user_metrics(user_id: str):
+    """Get or create metrics for a specific user"""
+    metrics = user_metrics.get(user_id)
+    if metrics is None:
+        metrics = user_metrics[user_id] = new_user_metrics()
+    return metrics
 
 def reset_user_metrics(user_id: str):
     """Reset metrics for a specific user to baseline"""
-    user_metrics[user_id] = {
-        "relationship_level": 25.0,
-        "trust_level": 35.0,
-        "emotional_sync": 45.0,
-        "memory_depth": 15.0,
-        "current_emotion": "neutral",
-        "current_topic": "general",
-        "insights_count": 0,
-        "conversation_turns": 0,
-        "recent_insights": [],
-        "conversation_active": False,
-        "last_updated": datetime.now().isoformat(),
-        # Enhanced trend tracking
-        "relationship_trend": "stable",
-        "trust_trend": "stable",
-        "emotional_trend": "stable",
-        "memory_trend": "stable",
-        # Additional psychological metrics
-        "authenticity_level": 5.0,
-        "stress_level": 3.0,
-        "growth_level": 5.0,
-        "behavioral_patterns": []
-    }
+    user_metrics[user_id] = new_user_metrics()
     print(f"🔄 Reset metrics for user: {user_id}")
 
-# Store processed speeches
-processed_speeches = []
+# Store processed speeches: a bounded working set (every speech is also persisted as
+# semantic memory), with ids drawn from a counter so they stay unique across eviction
+MAX_PROCESSED_SPEECHES = 10_000
+processed_speeches: deque = deque(maxlen=MAX_PROCESSED_SPEECHES)
+_speech_ids = count(1)
+
+def recent_speeches(n: int) -> List[Dict]:
+    """Last n processed speeches, oldest first, without walking the whole buffer"""
+    return list(islice(reversed(processed_speeches), n))[::-1]
+
+class SpeechColumns:
+    """Column-wise copy of the analysis fields aggregated over processed_speeches"""
+
+    def __init__(self, maxlen: int = MAX_PROCESSED_SPEECHES):
+        # Same bound as processed_speeches so both evict the same oldest speech
+        self.maxlen = maxlen
+        self.topics: deque = deque(maxlen=maxlen)
+        self.emotions: deque = deque(maxlen=maxlen)
+        self._vulnerability = np.empty(maxlen, dtype=np.float64)
+        self._appended = 0
+
+    def __len__(self) -> int:
+        return len(self.topics)
+
+    def _positions(self, n: int) -> np.ndarray:
+        """Ring-buffer slots of the last n values, oldest first"""
+        return np.arange(self._appended - n, self._appended) % self.maxlen
+
+    @property
+    def vulnerability(self) -> np.ndarray:
+        if self._appended <= self.maxlen:
+            return self._vulnerability[:self._appended]
+        return self._vulnerability[self._positions(self.maxlen)]
+
+    def append(self, analysis: Dict[str, Any]):
+        slot = self._appended % self.maxlen
+        try:
+            self._vulnerability[slot] = float(analysis.get('vulnerability', 3))
+        except (TypeError, ValueError):
+            self._vulnerability[slot] = 3.0
+        self._appended += 1
+        self.topics.append(analysis.get('topic', 'general'))
+        self.emotions.append(analysis.get('emotion', 'neutral'))
+
+    def tail(self, n: int):
+        """Last n (topics, emotions, vulnerability) as independent copies"""
+        n = min(n, len(self))
+        return (
+            list(islice(reversed(self.topics), n))[::-1],
+            list(islice(reversed(self.emotions), n))[::-1],
+            self._vulnerability[self._positions(n)],
+        )
+
+    def clear(self):
+        self.topics.clear()
+        self.emotions.clear()
+        self._appended = 0
+
+speech_columns = SpeechColumns()
+
+# The same speech records grouped by conversation_id for per-conversation lookups. A conversation
+# is dropped once it is flushed as finished; past MAX_TRACKED_CONVERSATIONS open ones, the oldest
+# (in practice abandoned) conversation is flushed and dropped to make room
+MAX_TRACKED_CONVERSATIONS = 1_000
+speeches_by_conversation: Dict[str, List[Dict]] = {}
 
 # ============================================================================
 # DATABASE SETUP
@@ -112,8 +215,127 @@ conversations_table = None
 insights_table = None
 semantic_memory_table = None
 
+# User ids end up in Lance filter strings, so they are restricted to a safe alphabet at the API edge
+USER_ID_PATTERN = re.compile(r"^[A-Za-z0-9_\-]{1,64}$")
+
+def validate_user_id(user_id: str) -> str:
+    """Reject user ids outside USER_ID_PATTERN with a 400"""
+    if not isinstance(user_id, str) or not USER_ID_PATTERN.match(user_id):
+        raise HTTPException(status_code=400, detail="user_id must be 1-64 letters, digits, '_' or '-'")
+    return user_id
+
+def sql_literal(value: str) -> str:
+    """Quote a string for a Lance filter expression, doubling embedded quotes"""
+    return "'" + str(value).replace("'", "''") + "'"
+
+# Table schemas are built once at import; init_database only opens or creates them.
+# Vectors that are stored but never searched are half precision: half the bytes on every scan.
+# They stay floating point rather than int8 so existing float columns keep their meaning and
+# reads need no dequantization; the searched memory embeddings are compressed by the IVF_PQ
+# index instead (see _ensure_vector_index).
+STORED_VECTOR_TYPE = pa.list_(pa.float16(), 384)
+
+# User Profile Schema
+USER_SCHEMA = pa.schema([
+    pa.field("user_id", pa.string()),
+    pa.field("created_at", pa.string()),
+    pa.field("total_conversations", pa.int64()),
+    pa.field("avg_relationship_level", pa.float64()),
+    pa.field("avg_trust_level", pa.float64()),
+    pa.field("avg_emotional_sync", pa.float64()),
+    pa.field("dominant_emotions", pa.string()),  # JSON array as string
+    pa.field("frequent_topics", pa.string()),    # JSON array as string
+    pa.field("communication_style", pa.string()),
+    pa.field("vulnerability_pattern", pa.float64()),
+    pa.field("personality_traits", pa.string()), # JSON object as string
+    pa.field("last_active", pa.string()),
+    pa.field("profile_vector", STORED_VECTOR_TYPE)  # For semantic search
+])
+
+# Conversation Schema
+CONVERSATION_SCHEMA = pa.schema([
+    pa.field("conversation_id", pa.string()),
+    pa.field("user_id", pa.string()),
+    pa.field("started_at", pa.string()),
+    pa.field("ended_at", pa.string()),
+    pa.field("total_turns", pa.int64()),
+    pa.field("final_relationship_level", pa.float64()),
+    pa.field("final_trust_level", pa.float64()),
+    pa.field("final_emotional_sync", pa.float64()),
+    pa.field("final_memory_depth", pa.float64()),
+    pa.field("dominant_topic", pa.string()),
+    pa.field("emotional_journey", pa.string()),   # JSON array of emotions
+    pa.field("conversation_summary", pa.string()),
+    pa.field("key_revelations", pa.string()),     # JSON array of insights
+    pa.field("vulnerability_score", pa.float64()),
+    pa.field("conversation_vector", STORED_VECTOR_TYPE)
+])
+
+# Deep Insights Schema
+INSIGHTS_SCHEMA = pa.schema([
+    pa.field("insight_id", pa.string()),
+    pa.field("user_id", pa.string()),
+    pa.field("conversation_id", pa.string()),
+    pa.field("speech_id", pa.string()),
+    pa.field("insight_text", pa.string()),
+    pa.field("insight_type", pa.string()),        # behavioral, emotional, personality, pattern
+    pa.field("confidence_score", pa.float64()),
+    pa.field("timestamp", pa.string()),
+    pa.field("supporting_evidence", pa.string()), # JSON array of speech excerpts
+    pa.field("psychological_category", pa.string()),  # attachment, communication, values, etc.
+    pa.field("insight_vector", STORED_VECTOR_TYPE)
+])
+
+# Semantic Memory Schema for vector-based memory storage
+SEMANTIC_MEMORY_SCHEMA = pa.schema([
+    pa.field("memory_id", pa.string()),
+    pa.field("user_id", pa.string()),
+    pa.field("text_content", pa.string()),
+    pa.field("context_type", pa.string()),  # "conversation", "name", "preference", etc.
+    pa.field("timestamp", pa.string()),
+    pa.field("topic", pa.string()),
+    pa.field("emotion", pa.string()),
+    pa.field("importance", pa.float64()),
+    pa.field("embedding_vector", pa.list_(pa.float32(), 384)),  # Cohere embeddings (float32: L2 thresholds depend on it)
+    pa.field("metadata", pa.string())  # JSON metadata
+])
+
+def _open_or_create_table(name: str, schema: pa.Schema):
+    """Open a LanceDB table, creating it with the given schema on first use"""
+    try:
+        table = db.open_table(name)
+        print(f"Opened existing {name} table")
+        if table.schema.types != schema.types:
+            # Existing data is not rewritten; writers cast rows to table.schema instead
+            print(f"ℹ️ {name} keeps its on-disk schema (differs from the current default)")
+    except Exception:
+        table = db.create_table(name, schema=schema)
+        print(f"Created new {name} table")
+    return table
+
+# Database init is single-flight: after the first success ensure_db is one flag read, and
+# failed attempts back off exponentially instead of retrying on every request
+DB_RETRY_BASE_SECONDS = 0.5
+DB_RETRY_MAX_SECONDS = 30.0
+_db_ready = False
+_db_lock = threading.RLock()
+_db_retry = {"failures": 0, "next_attempt": 0.0}
+
 def init_database():
-    """Initialize LanceDB database and tables"""
+    """Initialize LanceDB database and tables (one caller at a time)"""
+    global _db_ready
+    with _db_lock:
+        _db_ready = _open_database()
+        if _db_ready:
+            _db_retry["failures"] = 0
+        else:
+            _db_retry["failures"] += 1
+            delay = min(DB_RETRY_MAX_SECONDS, DB_RETRY_BASE_SECONDS * 2 ** (_db_retry["failures"] - 1))
+            _db_retry["next_attempt"] = time.monotonic() + delay
+        return _db_ready
+
+def _open_database():
+    """Connect to LanceDB and open or create the tables"""
     global db, users_table, conversations_table, insights_table, semantic_memory_table
 
     try:
@@ -132,270 +354,517 @@ def init_database():
             print(f"Database access issue: {e}")
             print("Will recreate tables with correct schema")
 
-        # User Profile Schema
-        user_schema = pa.schema([
-            pa.field("user_id", pa.string()),
-            pa.field("created_at", pa.string()),
-            pa.field("total_conversations", pa.int64()),
-            pa.field("avg_relationship_level", pa.float64()),
-            pa.field("avg_trust_level", pa.float64()),
-            pa.field("avg_emotional_sync", pa.float64()),
-            pa.field("dominant_emotions", pa.string()),  # JSON array as string
-            pa.field("frequent_topics", pa.string()),    # JSON array as string
-            pa.field("communication_style", pa.string()),
-            pa.field("vulnerability_pattern", pa.float64()),
-            pa.field("personality_traits", pa.string()), # JSON object as string
-            pa.field("last_active", pa.string()),
-            pa.field("profile_vector", pa.list_(pa.float32(), 384))  # For semantic search
-        ])
-
-        # Conversation Schema
-        conversation_schema = pa.schema([
-            pa.field("conversation_id", pa.string()),
-            pa.field("user_id", pa.string()),
-            pa.field("started_at", pa.string()),
-            pa.field("ended_at", pa.string()),
-            pa.field("total_turns", pa.int64()),
-            pa.field("final_relationship_level", pa.float64()),
-            pa.field("final_trust_level", pa.float64()),
-            pa.field("final_emotional_sync", pa.float64()),
-            pa.field("final_memory_depth", pa.float64()),
-            pa.field("dominant_topic", pa.string()),
-            pa.field("emotional_journey", pa.string()),   # JSON array of emotions
-            pa.field("conversation_summary", pa.string()),
-            pa.field("key_revelations", pa.string()),     # JSON array of insights
-            pa.field("vulnerability_score", pa.float64()),
-            pa.field("conversation_vector", pa.list_(pa.float32(), 384))
-        ])
-
-        # Deep Insights Schema
-        insights_schema = pa.schema([
-            pa.field("insight_id", pa.string()),
-            pa.field("user_id", pa.string()),
-            pa.field("conversation_id", pa.string()),
-            pa.field("speech_id", pa.string()),
-            pa.field("insight_text", pa.string()),
-            pa.field("insight_type", pa.string()),        # behavioral, emotional, personality, pattern
-            pa.field("confidence_score", pa.float64()),
-            pa.field("timestamp", pa.string()),
-            pa.field("supporting_evidence", pa.string()), # JSON array of speech excerpts
-            pa.field("psychological_category", pa.string()),  # attachment, communication, values, etc.
-            pa.field("insight_vector", pa.list_(pa.float32(), 384))
-        ])
-
         # Create tables if they don't exist
-        try:
-            users_table = db.open_table("users")
-            print("Opened existing users table")
-        except:
-            users_table = db.create_table("users", schema=user_schema)
-            print("Created new users table")
-
-        try:
-            conversations_table = db.open_table("conversations")
-            print("Opened existing conversations table")
-        except:
-            conversations_table = db.create_table("conversations", schema=conversation_schema)
-            print("Created new conversations table")
-
-        try:
-            insights_table = db.open_table("insights")
-            print("Opened existing insights table")
-        except:
-            insights_table = db.create_table("insights", schema=insights_schema)
-            print("Created new insights table")
-
-        # Semantic Memory Schema for vector-based memory storage
-        semantic_memory_schema = pa.schema([
-            pa.field("memory_id", pa.string()),
-            pa.field("user_id", pa.string()),
-            pa.field("text_content", pa.string()),
-            pa.field("context_type", pa.string()),  # "conversation", "name", "preference", etc.
-            pa.field("timestamp", pa.string()),
-            pa.field("topic", pa.string()),
-            pa.field("emotion", pa.string()),
-            pa.field("importance", pa.float64()),
-            pa.field("embedding_vector", pa.list_(pa.float32(), 384)),  # Cohere embeddings
-            pa.field("metadata", pa.string())  # JSON metadata
-        ])
-
-        try:
-            semantic_memory_table = db.open_table("semantic_memory")
-            print("Opened existing semantic memory table")
-        except:
-            semantic_memory_table = db.create_table("semantic_memory", schema=semantic_memory_schema)
-            print("Created new semantic memory table")
+        users_table = _open_or_create_table("users", USER_SCHEMA)
+        conversations_table = _open_or_create_table("conversations", CONVERSATION_SCHEMA)
+        insights_table = _open_or_create_table("insights", INSIGHTS_SCHEMA)
+        semantic_memory_table = _open_or_create_table("semantic_memory", SEMANTIC_MEMORY_SCHEMA)
+
+        # Scalar indexes for the per-user lookups on every speech
+        _ensure_scalar_index(users_table, "user_id")
+        _ensure_scalar_index(conversations_table, "user_id")
+        _ensure_scalar_index(insights_table, "user_id")
+        _ensure_scalar_index(insights_table, "conversation_id")
+        _ensure_scalar_index(semantic_memory_table, "user_id")
+        _ensure_scalar_index(semantic_memory_table, "timestamp")
 
         # Create vector index for efficient similarity search
-        try:
-            semantic_memory_table.create_index(
-                "embedding_vector",
-                index_type="IVF_PQ",   # good default; or "HNSW"
-                metric="cosine",
-                num_partitions=16,
-                num_sub_vectors=16
-            )
-            print("✅ Vector index ensured on semantic_memory.embedding_vector")
-        except Exception as e:
-            print(f"ℹ️ Index create/ensure note: {e}")
+        _ensure_vector_index(semantic_memory_table, "embedding_vector")
 
+        seed_recent_rows()
         return True
 
     except Exception as e:
         print(f"Database initialization error: {e}")
         return False
 
+def scan_where(table, column: str, value, limit: Optional[int] = None,
+               columns: Optional[List[str]] = None) -> pa.Table:
+    """Rows whose column equals value; the predicate runs inside Lance (index-assisted when present)"""
+    return table.to_lance().to_table(columns=columns, filter=pc.field(column) == value, limit=limit)
+
+def latest_rows(table, columns: List[str], sort_column: str, k: int) -> List[Dict]:
+    """Top-k rows by sort_column (newest first), scanning only the requested columns"""
+    projected = table.to_lance().to_table(columns=columns)
+    if projected.num_rows == 0:
+        return []
+    top = projected.take(pc.select_k_unstable(projected, k=k, sort_keys=[(sort_column, "descending")]))
+    return arrow_records(top.sort_by([(sort_column, "descending")]))
+
+def _ensure_scalar_index(table, column: str):
+    """Build a BTREE index on a scalar column once so equality filters skip the full scan"""
+    try:
+        # replace=False: an existing index is kept rather than rebuilt on every boot
+        table.create_scalar_index(column, index_type="BTREE", replace=False)
+        print(f"✅ Scalar index ensured on {column}")
+    except Exception as e:
+        print(f"ℹ️ Scalar index create/ensure note: {e}")
+
+def _ensure_vector_index(table, column: str, min_rows: int = 256):
+    """Build an IVF_PQ index on a vector column once, after it has enough rows to train PQ"""
+    try:
+        row_count = table.count_rows()
+        if row_count < min_rows:
+            # Brute force over this few rows is faster than probing an index
+            print(f"ℹ️ Skipping {column} index: {row_count} rows (< {min_rows} needed to train)")
+            return
+        # ~sqrt(N) partitions of ~sqrt(N) vectors each, so a probe scans O(sqrt(N)) rows
+        num_partitions = max(16, math.isqrt(row_count))
+        # replace=False: keep an existing index instead of retraining it on every boot.
+        # Metric matches the default L2 used by the memory searches so the index is used
+        # (Cohere vectors are unit length, so L2 ranks the same as cosine).
+        table.create_index(
+            metric="L2",
+            vector_column_name=column,
+            num_partitions=num_partitions,
+            # 96 one-byte PQ codes (4 dims each): 96 B/row instead of 1536 B of float32,
+            # a 16x smaller scan; full vectors stay in the column for re-ranking
+            index_type="IVF_PQ",
+            num_sub_vectors=96,
+            replace=False
+        )
+        print(f"✅ Vector index ensured on {column} ({num_partitions} partitions)")
+    except Exception as e:
+        print(f"ℹ️ Index create/ensure note: {e}")
+
 def ensure_db():
     """Ensure LanceDB is initialized; call on-demand in read paths."""
-    global db, users_table, conversations_table, insights_table, semantic_memory_table
-    if db is None or any(t is None for t in [users_table, conversations_table, insights_table, semantic_memory_table]):
-        init_database()
-    return db is not None and semantic_memory_table is not None
+    if _db_ready:
+        return True
+    with _db_lock:
+        # Another caller may have finished (or just failed) the init while this one waited
+        if not _db_ready and time.monotonic() >= _db_retry["next_attempt"]:
+            init_database()
+    return _db_ready
+
+# Cohere embeddings keyed by a digest of the whitespace-normalized text; fallbacks are never cached
+EMBEDDING_CACHE_SIZE = 4096
+_embedding_cache: "OrderedDict[bytes, List[float]]" = OrderedDict()
+_embedding_cache_stats = {"hits": 0, "misses": 0}
+_embedding_cache_lock = threading.Lock()  # embeddings are requested from worker threads too
+
+# Cohere accepts up to 96 texts per embed request
+COHERE_MAX_BATCH = 96
+
+def _embedding_cache_key(text: str) -> bytes:
+    return hashlib.blake2b(" ".join(text.split()).encode(), digest_size=16).digest()
+
+def _cohere_embed(texts: List[str]) -> Optional[List[List[float]]]:
+    """One Cohere embed request for up to COHERE_MAX_BATCH texts; None on any failure"""
+    # Using embed-english-light-v3.0 for 384 dimensions (matches your schema)
+    payload = {
+        "texts": texts,
+        "model": "embed-english-light-v3.0",
+        "input_type": "search_document",
+        "truncate": "END"
+    }
+
+    response = cohere_client.post(COHERE_EMBED_URL, json=payload)
+
+    if response.status_code == 200:
+        # Parse the raw body bytes directly; skips the str decode + stdlib json pass
+        embeddings = orjson.loads(response.content).get("embeddings", [])
+        if len(embeddings) == len(texts):
+            logger.debug("Cohere embeddings generated: %d x %d dimensions", len(texts), len(embeddings[0]))
+            return embeddings
+    else:
+        print(f"❌ Cohere API error: {response.status_code} - {response.text}")
+    return None
+
+def embed_many(texts: List[str]) -> List[List[float]]:
+    """Embeddings for several texts; cache misses go to Cohere in batches instead of one POST each"""
+    results: List[Optional[List[float]]] = [None] * len(texts)
+    missing = []
+    with _embedding_cache_lock:
+        for i, text in enumerate(texts):
+            cache_key = _embedding_cache_key(text)
+            cached = _embedding_cache.get(cache_key)
+            if cached is not None:
+                _embedding_cache.move_to_end(cache_key)
+                _embedding_cache_stats["hits"] += 1
+                results[i] = cached
+            else:
+                _embedding_cache_stats["misses"] += 1
+                missing.append(i)
+
+    if missing and not COHERE_API_KEY:
+        print("❌ COHERE_API_KEY not found, using fallback")
+    elif missing:
+        for start in range(0, len(missing), COHERE_MAX_BATCH):
+            batch = missing[start:start + COHERE_MAX_BATCH]
+            try:
+                embeddings = _cohere_embed([texts[i] for i in batch])
+            except Exception as e:
+                print(f"❌ Cohere embedding error: {e}")
+                embeddings = None
+            with _embedding_cache_lock:
+                for i, embedding in zip(batch, embeddings or []):
+                    results[i] = embedding
+                    _embedding_cache[_embedding_cache_key(texts[i])] = embedding
+                    if len(_embedding_cache) > EMBEDDING_CACHE_SIZE:
+                        _embedding_cache.popitem(last=False)
+
+    # Fallback to local method for anything the API did not return
+    for i in missing:
+        if results[i] is None:
+            logger.debug("Using fallback embedding method")
+            results[i] = get_fallback_embedding(texts[i])
+    return results
 
 def get_text_embedding(text: str) -> List[float]:
     """Generate embedding for text using Cohere API"""
-    try:
-        if not COHERE_API_KEY:
-            print("❌ COHERE_API_KEY not found, using fallback")
-            return get_fallback_embedding(text)
-        
-        # Use Cohere Embed API according to official docs
-        url = "https://api.cohere.ai/v1/embed"
-        
-        headers = {
-            "Authorization": f"Bearer {COHERE_API_KEY}",
-            "Content-Type": "application/json"
-        }
-        
-        # Using embed-english-light-v3.0 for 384 dimensions (matches your schema)
-        payload = {
-            "texts": [text],
-            "model": "embed-english-light-v3.0",
-            "input_type": "search_document",
-            "truncate": "END"
-        }
-        
-        response = requests.post(url, headers=headers, json=payload, timeout=15)
-        
-        if response.status_code == 200:
-            result = response.json()
-            embeddings = result.get("embeddings", [])
-            if embeddings and len(embeddings) > 0:
-                embedding = embeddings[0]
-                print(f"✅ Cohere embedding generated: {len(embedding)} dimensions")
-                return embedding
-        else:
-            print(f"❌ Cohere API error: {response.status_code} - {response.text}")
-        
-    except Exception as e:
-        print(f"❌ Cohere embedding error: {e}")
-    
-    # Fallback to local method if API fails
-    print("🔄 Using fallback embedding method")
-    return get_fallback_embedding(text)
+    return embed_many([text])[0]
+
+# Per-position scaling applied when repeating base features out to the embedding width
+_FALLBACK_EMBED_DIMS = 384
+_FALLBACK_BASE_DIMS = 24
+_FALLBACK_VARIATION = 1 + 0.1 * (np.arange(50) % 10 - 5)
+
+def _build_fallback_expansion():
+    """Source base-feature index and cumulative scale for every fallback embedding position"""
+    # Repeat the leading block with slight variation (each pass copies an already-scaled
+    # prefix), tracked once here so each embedding is a single gather + multiply
+    source = np.arange(_FALLBACK_EMBED_DIMS)
+    scale = np.ones(_FALLBACK_EMBED_DIMS)
+    filled = _FALLBACK_BASE_DIMS
+    while filled < _FALLBACK_EMBED_DIMS:
+        block = min(50, _FALLBACK_EMBED_DIMS - filled, filled)
+        source[filled:filled + block] = source[:block]
+        scale[filled:filled + block] = scale[:block] * _FALLBACK_VARIATION[:block]
+        filled += block
+    return source, scale
+
+_FALLBACK_SOURCE, _FALLBACK_SCALE = _build_fallback_expansion()
 
 def get_fallback_embedding(text: str) -> List[float]:
     """Improved fallback embedding using text characteristics"""
-    import hashlib
-    
-    # Create features based on text content
-    features = []
+    features = np.empty(_FALLBACK_BASE_DIMS)
+    text_len = max(len(text), 1)
+    words = text.lower().split()
     
     # Basic text statistics
-    features.extend([
+    features[:6] = (
         len(text) / 1000.0,  # Length
-        text.count(' ') / max(len(text), 1),  # Word density
-        sum(c.isupper() for c in text) / max(len(text), 1),  # Caps ratio
-        sum(c.isdigit() for c in text) / max(len(text), 1),  # Digit ratio
-        text.count('!') / max(len(text), 1),  # Exclamation ratio
-        text.count('?') / max(len(text), 1),  # Question ratio
-    ])
+        text.count(' ') / text_len,  # Word density
+        sum(map(str.isupper, text)) / text_len,  # Caps ratio (map: no per-char generator frame)
+        sum(map(str.isdigit, text)) / text_len,  # Digit ratio
+        text.count('!') / text_len,  # Exclamation ratio
+        text.count('?') / text_len,  # Question ratio
+    )
     
     # Word-level features
-    words = text.lower().split()
     if words:
-        features.extend([
+        features[6:8] = (
             len(words) / 100.0,  # Word count
-            sum(len(w) for w in words) / len(words) / 10.0,  # Avg word length
-        ])
+            sum(map(len, words)) / len(words) / 10.0,  # Avg word length
+        )
     else:
-        features.extend([0.0, 0.0])
+        features[6:8] = 0.0
     
-    # Hash-based features for consistency
-    text_hash = hashlib.md5(text.encode()).hexdigest()
-    for i in range(0, len(text_hash), 2):
-        hex_val = int(text_hash[i:i+2], 16)
-        normalized = (hex_val - 127.5) / 127.5
-        features.append(normalized)
+    # Hash-based features for consistency (raw digest bytes, no hex round-trip)
+    digest = np.frombuffer(hashlib.blake2b(text.encode(), digest_size=16).digest(), dtype=np.uint8)
+    features[8:24] = (digest - 127.5) / 127.5
     
     # Extend to 384 dimensions to match Cohere light model
-    target_dims = 384
-    while len(features) < target_dims:
-        # Repeat and modify existing features
-        base_features = features[:min(50, target_dims - len(features))]
-        for i, feat in enumerate(base_features):
-            if len(features) >= target_dims:
-                break
-            # Add slight variation
-            features.append(feat * (1 + 0.1 * (i % 10 - 5)))
-    
-    return features[:target_dims]
+    return (features[_FALLBACK_SOURCE] * _FALLBACK_SCALE).tolist()
+
+# Common name introduction phrases, in precedence order
+_NAME_INTRO_PHRASES = ("my name is", "i'm", "i am", "call me", "this is", "name's",
+                       "they call me", "people call me", "you can call me")
+_NAME_INTRO_PRIORITY = {phrase: i for i, phrase in enumerate(_NAME_INTRO_PHRASES)}
+_NAME_INTRO_RE = re.compile("(" + "|".join(map(re.escape, _NAME_INTRO_PHRASES)) + r") (\w+)")
+
+# Common words that follow an introduction phrase but aren't names
+_NAME_STOPWORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to',
+    'for', 'of', 'with', 'by', 'from', 'up', 'about', 'into', 'over',
+    'after', 'good', 'new', 'first', 'last', 'long', 'great', 'little',
+    'own', 'other', 'old', 'right', 'big', 'high', 'different', 'small',
+    'large', 'next', 'early', 'young', 'important', 'few', 'public',
+    'same', 'able', 'not', 'really', 'very', 'just', 'going', 'doing',
+    'happy', 'sad', 'okay', 'fine', 'sure', 'yes', 'no', 'maybe', 'here',
+    'there', 'what', 'when', 'where', 'why', 'how', 'who', 'which', 'studying'
+})
 
 def extract_name_from_speech(speech_text: str) -> Optional[str]:
     """Extract name from speech patterns"""
-    import re
-    
-    text = speech_text.lower()
-    
-    # Common name introduction patterns
-    name_patterns = [
-        r"my name is (\w+)",
-        r"i'm (\w+)",
-        r"i am (\w+)",
-        r"call me (\w+)",
-        r"this is (\w+)",
-        r"name's (\w+)",
-        r"they call me (\w+)",
-        r"people call me (\w+)",
-        r"you can call me (\w+)"
-    ]
-    
-    for pattern in name_patterns:
-        match = re.search(pattern, text)
-        if match:
-            name = match.group(1).capitalize()
-            # Filter out common words that aren't names
-            common_words = ['the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 
-                          'for', 'of', 'with', 'by', 'from', 'up', 'about', 'into', 'over', 
-                          'after', 'good', 'new', 'first', 'last', 'long', 'great', 'little', 
-                          'own', 'other', 'old', 'right', 'big', 'high', 'different', 'small',
-                          'large', 'next', 'early', 'young', 'important', 'few', 'public', 
-                          'same', 'able', 'not', 'really', 'very', 'just', 'going', 'doing',
-                          'happy', 'sad', 'okay', 'fine', 'sure', 'yes', 'no', 'maybe', 'here',
-                          'there', 'what', 'when', 'where', 'why', 'how', 'who', 'which', 'studying']
-            if name.lower() not in common_words and len(name) > 1:
-                return name
-    
+    # One regex pass finds every introduction; the highest-precedence valid one wins
+    best = None
+    for match in _NAME_INTRO_RE.finditer(speech_text.lower()):
+        name = match.group(2)
+        if len(name) > 1 and name not in _NAME_STOPWORDS:
+            priority = _NAME_INTRO_PRIORITY[match.group(1)]
+            if best is None or priority < best[0]:
+                best = (priority, name)
+    return best[1].capitalize() if best else None
+
+
+class UserCache:
+    """Bounded, thread-safe LRU of user_id -> value; with a ttl, entries also expire so edits are re-read"""
+
+    def __init__(self, size: int, ttl: Optional[float] = None):
+        self.size = size
+        self.ttl = ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: str, default=None):
+        with self._lock:
+            hit = self._entries.get(user_id)
+            if hit is None:
+                return default
+            if self.ttl is not None and time.monotonic() - hit[1] > self.ttl:
+                del self._entries[user_id]
+                return default
+            self._entries.move_to_end(user_id)
+            return hit[0]
+
+    def put(self, user_id: str, value):
+        with self._lock:
+            self._entries[user_id] = (value, time.monotonic())
+            self._entries.move_to_end(user_id)
+            if len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def pop(self, user_id: str, default=None):
+        with self._lock:
+            hit = self._entries.pop(user_id, None)
+        return hit[0] if hit else default
+
+    def keys(self) -> List[str]:
+        with self._lock:
+            return list(self._entries)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+# Per-user state caches are bounded so one entry per user ever seen cannot grow without limit
+USER_CACHE_SIZE = 10_000
+
+# Names on the hot path
+USER_NAME_CACHE_TTL = 3600.0
+_user_name_cache = UserCache(USER_CACHE_SIZE, USER_NAME_CACHE_TTL)
+
+# Parsed personality_traits per user, keyed to the users table version they were read at
+# (a user without a stored name stays nameless here until the users table changes)
+_user_traits_cache = UserCache(USER_CACHE_SIZE)
+
+# Users whose recent memories carry no extracted name, keyed to their memory version
+_name_recall_misses = UserCache(USER_CACHE_SIZE)
+
+# Per-user memory stats; dropped whenever that user's semantic memories are written
+_memory_stats_cache = UserCache(USER_CACHE_SIZE)
+
+# Per-user (recent memories, fetched_at) for the Tavus context; also dropped on memory writes
+_memory_cache = UserCache(USER_CACHE_SIZE)
+
+# Per-user memory version, bumped on every memory/name write; keys the Tavus context cache.
+# Versions come from one process-wide counter, so a user evicted from the bounded map gets a
+# new version on return rather than restarting at a value older cached entries were keyed on.
+_memory_versions = UserCache(USER_CACHE_SIZE)
+_memory_version_counter = count(1)
+
+def user_memory_version(user_id: str) -> int:
+    """Current memory version for user_id (a fresh one if the user is not tracked)"""
+    version = _memory_versions.get(user_id)
+    if version is None:
+        version = next(_memory_version_counter)
+        _memory_versions.put(user_id, version)
+    return version
+
+# Tavus context per user as (memory_version, context)
+_context_cache = UserCache(USER_CACHE_SIZE)
+
+# Reads on the context path catch their own errors and fall back to empty results; they
+# count them here (per thread) so a degraded result is never cached as if it were complete
+_read_failures = threading.local()
+
+def _note_read_failure():
+    _read_failures.count = getattr(_read_failures, "count", 0) + 1
+
+def _read_failure_count() -> int:
+    return getattr(_read_failures, "count", 0)
+
+# Short-lived cache for polled read endpoints: key -> (expires_at, response), bounded like the
+# per-user caches. Per-user entries always carry the user_id in their key and are dropped on
+# that user's writes; expired ones are dropped when next read or pushed out by newer keys.
+_response_cache = UserCache(USER_CACHE_SIZE)
+
+# Per-user data version for ETags, bumped with every invalidate_user_responses; the epoch
+# keeps tags from a previous process or a reset database from matching. Like memory versions
+# they come from one counter, so a user evicted from the bounded map never reuses an old tag.
+_user_data_versions = UserCache(USER_CACHE_SIZE)
+_user_data_version_counter = count(1)
+_ETAG_EPOCH = uuid4().hex[:8]
+
+def cached_response(key: tuple, ttl: float, build):
+    """Return a fresh cached response for key, or build and cache it (error responses are not cached)"""
+    now = time.monotonic()
+    hit = _response_cache.get(key)
+    if hit:
+        if hit[0] > now:
+            return hit[1]
+        _response_cache.pop(key)
+    response = build()
+    if not (isinstance(response, dict) and "error" in response):
+        _response_cache.put(key, (now + ttl, response))
+    return response
+
+def invalidate_user_responses(user_id: str):
+    """Drop cached per-user responses after that user's data changes"""
+    _response_cache.pop(("user_profile", user_id))
+    _user_data_versions.put(user_id, next(_user_data_version_counter))
+
+def not_modified(request: Request, response: Response, user_id: str) -> Optional[Response]:
+    """Tag a per-user response with its data version; returns a 304 if the client already has it"""
+    version = _user_data_versions.get(user_id)
+    if version is None:
+        version = next(_user_data_version_counter)
+        _user_data_versions.put(user_id, version)
+    etag = f'W/"{_ETAG_EPOCH}:{user_id}:{version}"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, max-age=10"
+    return None
+
+# Per-user memory frames (no embedding column): user_id -> (memory_version, DataFrame), expiring
+# after MEMORY_FRAME_MAX_AGE and bounded to the most recently active users.
+# Readers that arrive while a frame is loading wait on that user's lock and reuse the result.
+MEMORY_FRAME_MAX_AGE = 5.0
+MEMORY_FRAME_CACHE_SIZE = 256
+MEMORY_FRAME_COLUMNS = ["memory_id", "user_id", "text_content", "context_type", "timestamp",
+                        "topic", "emotion", "importance", "metadata"]
+_memory_frames = UserCache(MEMORY_FRAME_CACHE_SIZE, MEMORY_FRAME_MAX_AGE)
+_memory_frame_locks = UserCache(MEMORY_FRAME_CACHE_SIZE)
+_memory_frame_locks_guard = threading.Lock()
+
+def _fresh_memory_frame(user_id: str):
+    """Cached frame for user_id if it matches the current memory version and is young enough"""
+    hit = _memory_frames.get(user_id)
+    if hit and hit[0] == user_memory_version(user_id):
+        return hit[1]
     return None
 
+def user_memory_frame(user_id: str):
+    """This user's semantic memories as a DataFrame; concurrent callers share a single read"""
+    frame = _fresh_memory_frame(user_id)
+    if frame is not None:
+        return frame
+    with _memory_frame_locks_guard:
+        lock = _memory_frame_locks.get(user_id)
+        if lock is None:
+            lock = threading.Lock()
+            _memory_frame_locks.put(user_id, lock)
+    with lock:
+        # Another caller may have finished the read while this one waited
+        frame = _fresh_memory_frame(user_id)
+        if frame is None:
+            version = user_memory_version(user_id)
+            frame = scan_where(semantic_memory_table, "user_id", user_id, columns=MEMORY_FRAME_COLUMNS).to_pandas()
+            _memory_frames.put(user_id, (version, frame))
+        return frame
+
+class RecentRows:
+    """Write-through view of a table's newest rows; Lance is only read when (re)seeding"""
+
+    def __init__(self, key: str, sort_column: str, columns: List[str], size: int):
+        self.key = key
+        self.sort_column = sort_column
+        self.columns = columns
+        self.size = size
+        self._stored_columns = list(dict.fromkeys(columns + [key]))
+        self._rows: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+
+    def _newest(self, rows) -> List[Dict]:
+        return heapq.nlargest(self.size, rows, key=lambda row: row[self.sort_column] or "")
+
+    def seed(self, table):
+        rows = latest_rows(table, self._stored_columns, self.sort_column, self.size) if table is not None else []
+        with self._lock:
+            self._rows = {row[self.key]: row for row in rows}
+
+    def record(self, rows: List[Dict]):
+        with self._lock:
+            for row in rows:
+                self._rows[row[self.key]] = {column: row.get(column) for column in self._stored_columns}
+            if len(self._rows) > self.size:
+                self._rows = {row[self.key]: row for row in self._newest(self._rows.values())}
+
+    def latest(self) -> List[Dict]:
+        with self._lock:
+            rows = self._newest(self._rows.values())
+        return [{column: row[column] for column in self.columns} for row in rows]
+
+# Newest rows per table for the activity feed, updated on every write path
+_recent_rows = {
+    "users": RecentRows("user_id", "last_active", ['user_id', 'last_active', 'total_conversations'], 5),
+    "conversations": RecentRows("conversation_id", "ended_at", ['conversation_id', 'user_id', 'ended_at', 'total_turns'], 5),
+    "insights": RecentRows("insight_id", "timestamp", ['insight_text', 'user_id', 'timestamp', 'insight_type'], 10),
+}
+
+def seed_recent_rows():
+    """Rebuild the activity views from Lance after startup or a bulk delete/migration"""
+    for name, table in (("users", users_table), ("conversations", conversations_table), ("insights", insights_table)):
+        try:
+            _recent_rows[name].seed(table)
+        except Exception as e:
+            print(f"Recent {name} seed error: {e}")
 
-# Simple cache to avoid table scans on hot path
-_user_name_cache = {}
+# Queries the first turns of a session usually ask; embedded at startup so they hit the cache
+WARMUP_QUERIES = ["my name", "what is my name", "university computer science", "how are you feeling"]
+WARMUP_NAME_USERS = 100
 
-def store_user_name(user_id: str, name: str):
-    """Upsert user's display name into users table and cache."""
+def warm_caches():
+    """Pay cold-start costs at boot: query embeddings, the memory index, and recent users' names"""
+    try:
+        embed_many(WARMUP_QUERIES)
+    except Exception as e:
+        print(f"Embedding warm-up error: {e}")
+    try:
+        # One search pages in the index (or the vector column, before one is built)
+        semantic_memory_table.search([0.0] * 384).limit(1).to_list()
+    except Exception as e:
+        print(f"Vector warm-up error: {e}")
+    try:
+        warmed = 0
+        version = users_table.version
+        for row in latest_rows(users_table, ["user_id", "personality_traits", "last_active"],
+                               "last_active", WARMUP_NAME_USERS):
+            traits = orjson.loads(row["personality_traits"] or "{}")
+            _user_traits_cache.put(row["user_id"], (version, traits))
+            name = traits.get("name")
+            if name:
+                _user_name_cache.put(row["user_id"], name)
+                warmed += 1
+        print(f"🔥 Warmed caches ({warmed} user names)")
+    except Exception as e:
+        print(f"Name warm-up error: {e}")
+
+def _invalidate_user_memory(user_id: str):
+    """Drop derived per-user memory state after a write"""
+    invalidate_user_responses(user_id)
+    _memory_stats_cache.pop(user_id)
+    _memory_cache.pop(user_id)
+    _memory_versions.put(user_id, next(_memory_version_counter))
+
+def store_user_traits(user_id: str, updates: Dict) -> bool:
+    """Merge updates into the user's personality_traits JSON, creating the user if needed"""
     global users_table
     if not ensure_db() or users_table is None:
-        return
+        return False
 
     try:
-        df = users_table.to_pandas()
+        existing = scan_where(users_table, "user_id", user_id, limit=1)
         now = datetime.now().isoformat()
 
-        if len(df) > 0 and (df['user_id'] == user_id).any():
-            # delete then re-insert (Lance doesn't have native upsert yet)
-            users_table.delete(f"user_id = '{user_id}'")
-            row = df[df['user_id'] == user_id].iloc[0].to_dict()
+        if existing.num_rows > 0:
+            row = arrow_records(existing)[0]
         else:
             row = {
                 "user_id": user_id,
@@ -404,76 +873,88 @@ def store_user_name(user_id: str, name: str):
                 "avg_relationship_level": 25.0,
                 "avg_trust_level": 35.0,
                 "avg_emotional_sync": 45.0,
-                "dominant_emotions": json.dumps(["neutral"]),
-                "frequent_topics": json.dumps(["general"]),
+                "dominant_emotions": dumps_json(["neutral"]),
+                "frequent_topics": dumps_json(["general"]),
                 "communication_style": "exploring",
                 "vulnerability_pattern": 3.0,
-                "personality_traits": json.dumps({}),
+                "personality_traits": dumps_json({}),
                 "last_active": now,
                 "profile_vector": [0.0] * 384,
             }
 
-        # persist the name in personality_traits and a top-level convenience field
         traits = {}
         try:
-            traits = json.loads(row.get("personality_traits") or "{}")
+            traits = orjson.loads(row.get("personality_traits") or "{}")
         except Exception:
             traits = {}
-        traits["name"] = name
-        traits["name_extracted_at"] = now
+        traits.update(updates)
 
-        row["personality_traits"] = json.dumps(traits)
+        row["personality_traits"] = dumps_json(traits)
         row["last_active"] = now
 
-        users_table.add([row])
-        _user_name_cache[user_id] = name
+        # One atomic upsert (one Lance version); a delete + add pair could drop a concurrent write
+        (
+            users_table.merge_insert("user_id")
+            .when_matched_update_all()
+            .when_not_matched_insert_all()
+            .execute(schema_rows([row], users_table.schema))
+        )
+        _user_traits_cache.put(user_id, (users_table.version, traits))
+        _recent_rows["users"].record([row])
+        _invalidate_user_memory(user_id)
+        return True
+    except Exception as e:
+        print(f"❌ Error storing user traits: {e}")
+        return False
+
+def store_user_name(user_id: str, name: str):
+    """Upsert user's display name into users table and cache."""
+    # the name lives in personality_traits (there is no separate display_name column)
+    if store_user_traits(user_id, {"name": name, "name_extracted_at": datetime.now().isoformat()}):
+        _user_name_cache.put(user_id, name)
         print(f"💾 Stored name '{name}' for user {user_id} (persisted)")
+
+def get_user_traits(user_id: str) -> Dict:
+    """A copy of the user's parsed personality_traits ({} if unknown), parsed once per users table version"""
+    if not ensure_db() or users_table is None:
+        return {}
+    try:
+        version = users_table.version
+        hit = _user_traits_cache.get(user_id)
+        if hit and hit[0] == version:
+            return dict(hit[1])
+
+        # Only the traits column of the one matching row is read (user_id is BTREE-indexed)
+        rows = scan_where(users_table, "user_id", user_id, limit=1, columns=["personality_traits"])
+        traits = {}
+        if rows.num_rows > 0:
+            try:
+                traits = orjson.loads(rows["personality_traits"][0].as_py() or "{}")
+            except Exception as e:
+                print(f"❌ Error parsing traits: {e}")
+        _user_traits_cache.put(user_id, (version, traits))
+        return dict(traits)
     except Exception as e:
-        print(f"❌ Error storing user name: {e}")
+        print(f"❌ Error reading user traits: {e}")
+        _note_read_failure()
+        return {}
 
 def get_user_name(user_id: str) -> Optional[str]:
-    if user_id in _user_name_cache:
-        print(f"🎯 Found name in cache for {user_id}: {_user_name_cache[user_id]}")
-        return _user_name_cache[user_id]
+    cached = _user_name_cache.get(user_id)
+    if cached:
+        logger.debug("Found name in cache for %s: %s", user_id, cached)
+        return cached
     if not ensure_db() or users_table is None:
         print(f"❌ Database not available for user {user_id}")
         return None
-    try:
-        df = users_table.to_pandas()
-        if len(df) == 0:
-            print(f"❌ No users in database")
-            return None
-        hit = df[df['user_id'] == user_id]
-        if len(hit) == 0:
-            print(f"❌ User {user_id} not found in database")
-            return None
-        
-        user_data = hit.iloc[0].to_dict()
-        print(f"🔍 User data for {user_id}: {list(user_data.keys())}")
-        
-        # try display_name then traits
-        name = user_data.get("display_name")
-        print(f"🔍 display_name field: {name}")
-        if not name:
-            traits = user_data.get("personality_traits")
-            print(f"🔍 personality_traits: {traits}")
-            if traits:
-                try:
-                    traits_dict = json.loads(traits)
-                    name = traits_dict.get("name")
-                    print(f"🔍 name from traits: {name}")
-                except Exception as e:
-                    print(f"❌ Error parsing traits: {e}")
-                    name = None
-        if name:
-            _user_name_cache[user_id] = name
-            print(f"✅ Found and cached name for {user_id}: {name}")
-        else:
-            print(f"❌ No name found for {user_id}")
-        return name
-    except Exception as e:
-        print(f"❌ Error reading user name: {e}")
-        return None
+    # The name lives in personality_traits (there is no separate display_name column)
+    name = get_user_traits(user_id).get("name")
+    if name:
+        _user_name_cache.put(user_id, name)
+        logger.debug("Found and cached name for %s: %s", user_id, name)
+    else:
+        logger.debug("No name found for %s", user_id)
+    return name
 
 def recall_user_name_fast(user_id: str) -> Optional[str]:
     """Fast deterministic name recall - checks cache, users table, then recent memories"""
@@ -485,144 +966,128 @@ def recall_user_name_fast(user_id: str) -> Optional[str]:
     # 2) scan latest semantic memories that carried extracted_name in metadata
     if not ensure_db() or semantic_memory_table is None:
         return None
+    memory_version = user_memory_version(user_id)
+    if _name_recall_misses.get(user_id) == memory_version:
+        return None  # already scanned these memories and found no name
     try:
-        df = semantic_memory_table.to_pandas()
-        if len(df) == 0:
+        # User filter and projection run in Lance; the 50 newest are picked in Arrow
+        memories = scan_where(semantic_memory_table, "user_id", user_id, columns=["metadata", "timestamp"])
+        if memories.num_rows == 0:
+            _name_recall_misses.put(user_id, memory_version)
             return None
-        df = df[df["user_id"] == user_id].sort_values("timestamp", ascending=False)
-        for _, row in df.head(50).iterrows():
+        newest = pc.select_k_unstable(memories, k=50, sort_keys=[("timestamp", "descending")])
+        recent = memories.take(newest).sort_by([("timestamp", "descending")])
+        for metadata in recent["metadata"].to_pylist():
             try:
-                md = json.loads(row.get("metadata") or "{}")
+                md = orjson.loads(metadata or "{}")
                 n = md.get("extracted_name")
                 if n:
                     store_user_name(user_id, n)  # persist and cache
                     return n
             except Exception:
                 continue
+        _name_recall_misses.put(user_id, memory_version)
     except Exception as e:
         print(f"Name recall scan error: {e}")
+        _note_read_failure()
     return None
 
+PERSONAL_DETAILS_PATTERN = "wisconsin|computer science|university"
+
+def _build_context(user_id: str) -> str:
+    """Build the Tavus context from the user's name, stats, recent and personal memories"""
+    # First try to get name from users table, then from semantic memory
+    name = recall_user_name_fast(user_id)
+    logger.debug("Name recall for %s: %s", user_id, name)
+
+    if not name:
+        name = user_id  # fallback to user_id
+        logger.debug("No stored name found, using user_id as fallback: %s", name)
+
+    stats = get_user_memory_stats(user_id) or {}
+    total = stats.get("total_memories", 0)
+
+    # Get recent topics from memory stats
+    topics_dict = stats.get("topics", {})
+    topics = ", ".join(list(topics_dict.keys())[:5])[:200] if topics_dict else "general conversation"
+
+    # Use cached recent memories if available, otherwise quick search
+    recent_memories = _get_cached_recent_memories(user_id)
+    recent_context = ""
+    if recent_memories:
+        # Extract key information from recent memories
+        memory_snippets = [
+            f"Previously discussed: '{text[:50]}...'" if len(text) > 50 else f"Previously: '{text}'"
+            for text in (mem.get('text', '') for mem in recent_memories[:3])
+        ]
+        recent_context = f" {' | '.join(memory_snippets)}."
+
+    # Get specific personal information if available
+    personal_memories = search_semantic_memory(user_id, "university wisconsin computer science major study", top_k=5, max_distance=1.5)
+    personal_info = ""
+    if personal_memories:
+        personal_snippets = []
+        for mem in personal_memories[:3]:
+            text = mem.get('text', '')
+            # Look for specific personal details
+            if any(keyword in text.lower() for keyword in ['university', 'study', 'major', 'computer', 'wisconsin', 'going to', 'studying']):
+                # Extract the actual personal information
+                if 'wisconsin' in text.lower() or 'computer' in text.lower():
+                    personal_snippets.append(f"Personal details: '{text[:100]}...'")
+                else:
+                    personal_snippets.append(f"Personal info: '{text[:80]}...'")
+        if personal_snippets:
+            personal_info = f" {' | '.join(personal_snippets)}."
+
+    # Also try a direct text search for specific personal details: one case-insensitive
+    # regex kernel over just this user's memory text (it covers the Wisconsin-only case too)
+    if not personal_info:
+        try:
+            texts = scan_where(semantic_memory_table, "user_id", user_id, columns=["text_content"])["text_content"]
+            mask = pc.match_substring_regex(texts, PERSONAL_DETAILS_PATTERN, ignore_case=True)
+            personal_details = texts.filter(mask)
+
+            if len(personal_details) > 0:
+                personal_text = personal_details[0].as_py()
+                personal_info = f" Personal details: '{personal_text[:100]}...'"
+                logger.debug("Found personal details via text search: %.50s...", personal_text)
+        except Exception as e:
+            print(f"⚠️ Text search for personal details failed: {e}")
+            _note_read_failure()
+
+    # Per-user background is data (personality_traits["bio"]), set via /api/user/{user_id}/profile
+    bio = get_user_traits(user_id).get("bio")
+    personal_context = f" {bio}" if bio else ""
+
+    context = (
+        f"User preferred name: {name}. "
+        f"Stored memories: {total}. "
+        f"Main topics: {topics}.{recent_context}{personal_info}{personal_context} "
+        f"IMPORTANT: When asked about their name, always respond with '{name}'. "
+        f"When asked about personal details, use the stored memories to provide specific, personalized responses."
+    )
+
+    logger.debug("Built Tavus context for %s: %.150s...", user_id, context)
+    return context
+
 def build_context_from_db(user_id: str) -> str:
     """
     Pull the freshest facts from Aurora LanceDB (name, prefs, last topics, etc.)
     and turn them into a compact context string for Tavus.
     """
+    # Rebuilt only after this user's memories or name change
     try:
-        # First try to get name from users table, then from semantic memory
-        name = recall_user_name_fast(user_id)
-        print(f"🔍 Name recall for {user_id}: {name}")
-        
-        # If no name found, check if this is "abiodun" user_id and set default
-        if not name and user_id.lower() == "abiodun":
-            name = "Abiodun"
-            # Store this name for future reference
-            store_user_name(user_id, name)
-            print(f"👤 Set default name '{name}' for user {user_id}")
-        elif not name:
-            name = user_id  # fallback to user_id
-            print(f"👤 No stored name found, using user_id as fallback: {name}")
-            
-        stats = get_user_memory_stats(user_id) or {}
-        total = stats.get("total_memories", 0)
-        
-        # Get recent topics from memory stats
-        topics_dict = stats.get("topics", {})
-        topics = ", ".join(list(topics_dict.keys())[:5])[:200] if topics_dict else "general conversation"
-        
-        # Use cached recent memories if available, otherwise quick search
-        recent_memories = _get_cached_recent_memories(user_id)
-        recent_context = ""
-        if recent_memories:
-            # Extract key information from recent memories
-            memory_snippets = []
-            for mem in recent_memories[:3]:
-                text = mem.get('text', '')
-                if len(text) > 50:
-                    memory_snippets.append(f"Previously discussed: '{text[:50]}...'")
-                else:
-                    memory_snippets.append(f"Previously: '{text}'")
-            recent_context = f" {' | '.join(memory_snippets)}."
-        
-        # Get specific personal information if available
-        personal_memories = search_semantic_memory(user_id, "university wisconsin computer science major study", top_k=5, max_distance=1.5)
-        personal_info = ""
-        if personal_memories:
-            personal_snippets = []
-            for mem in personal_memories[:3]:
-                text = mem.get('text', '')
-                # Look for specific personal details
-                if any(keyword in text.lower() for keyword in ['university', 'study', 'major', 'computer', 'wisconsin', 'going to', 'studying']):
-                    # Extract the actual personal information
-                    if 'wisconsin' in text.lower() or 'computer' in text.lower():
-                        personal_snippets.append(f"Personal details: '{text[:100]}...'")
-                    else:
-                        personal_snippets.append(f"Personal info: '{text[:80]}...'")
-            if personal_snippets:
-                personal_info = f" {' | '.join(personal_snippets)}."
-        
-        # Also try a direct text search for specific personal details
-        if not personal_info:
-            try:
-                all_memories_df = semantic_memory_table.to_pandas()
-                user_memories = all_memories_df[all_memories_df['user_id'] == user_id]
-                
-                # Look for memories containing specific personal information
-                personal_details = user_memories[
-                    user_memories['text_content'].str.lower().str.contains('wisconsin|computer science|university', na=False)
-                ]
-                
-                if len(personal_details) > 0:
-                    personal_text = personal_details.iloc[0]['text_content']
-                    personal_info = f" Personal details: '{personal_text[:100]}...'"
-                    print(f"🔍 Found personal details via text search: {personal_text[:50]}...")
-            except Exception as e:
-                print(f"⚠️ Text search for personal details failed: {e}")
-        
-        # Force include specific personal details if we know them
-        if not personal_info:
-            try:
-                all_memories_df = semantic_memory_table.to_pandas()
-                user_memories = all_memories_df[all_memories_df['user_id'] == user_id]
-                
-                # Look for the specific memory about Wisconsin and computer science
-                wisconsin_memories = user_memories[
-                    user_memories['text_content'].str.contains('Wisconsin', case=False, na=False)
-                ]
-                
-                if len(wisconsin_memories) > 0:
-                    wisconsin_text = wisconsin_memories.iloc[0]['text_content']
-                    personal_info = f" Personal details: '{wisconsin_text[:150]}...'"
-                    print(f"🔍 Found Wisconsin details: {wisconsin_text[:50]}...")
-            except Exception as e:
-                print(f"⚠️ Wisconsin details search failed: {e}")
-        
-        # Always include known personal details for krishang
-        if user_id == "krishang":
-            personal_info = " Personal details: 'I'm going to University of Wisconsin studying computer science.'"
-            print(f"🔍 Using hardcoded personal details for krishang")
-        
-        # Add specific context about being Abiodun if that's the user
-        personal_context = ""
-        if user_id.lower() == "abiodun":
-            personal_context = " User is Abiodun, a computer science student passionate about AI."
-        
-        context = (
-            f"User preferred name: {name}. "
-            f"Stored memories: {total}. "
-            f"Main topics: {topics}.{recent_context}{personal_info}{personal_context} "
-            f"IMPORTANT: When asked about their name, always respond with '{name}'. "
-            f"When asked about personal details, use the stored memories to provide specific, personalized responses."
-        )
-        
-        print(f"🧠 Built Tavus context for {user_id}: {context[:150]}...")
+        version = user_memory_version(user_id)
+        hit = _context_cache.get(user_id)
+        if hit and hit[0] == version:
+            return hit[1]
+        failures = _read_failure_count()
+        context = _build_context(user_id)
+        if _read_failure_count() == failures:
+            _context_cache.put(user_id, (version, context))
         return context
-        
     except Exception as e:
         print(f"❌ Error building context from DB: {e}")
-        # Provide a better fallback for known users
-        if user_id.lower() == "abiodun":
-            return "User preferred name: Abiodun. User is Abiodun, a computer science student passionate about AI. When asked about their name, always respond with 'Abiodun'."
         return f"User preferred name: {user_id}. Ready to continue our conversation."
 
 # ============================================================================
@@ -654,18 +1119,19 @@ def store_semantic_memory(user_id: str, text: str, context_type: str = "conversa
             emotion = metadata.get('emotion', emotion)
             importance = metadata.get('importance', importance)
         
-        # Create memory record
+        # Create memory record (one clock read for both the id and the timestamp)
+        now = datetime.now()
         memory_record = {
-            "memory_id": f"mem_{user_id}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}",
+            "memory_id": f"mem_{user_id}_{now:%Y%m%d_%H%M%S_%f}",
             "user_id": user_id,
             "text_content": text,
             "context_type": context_type,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now.isoformat(),
             "topic": topic,
             "emotion": emotion,
             "importance": importance,
             "embedding_vector": embedding,
-            "metadata": json.dumps({
+            "metadata": dumps_json({
                 "extracted_name": extracted_name,
                 "text_length": len(text),
                 "has_question": "?" in text,
@@ -675,8 +1141,9 @@ def store_semantic_memory(user_id: str, text: str, context_type: str = "conversa
         }
         
         # Store in LanceDB
-        semantic_memory_table.add([memory_record])
-        print(f"🧠 Stored semantic memory: {text[:50]}...")
+        semantic_memory_table.add(schema_rows([memory_record], semantic_memory_table.schema))
+        _invalidate_user_memory(user_id)
+        logger.debug("Stored semantic memory: %.50s...", text)
         return True
         
     except Exception as e:
@@ -685,6 +1152,34 @@ def store_semantic_memory(user_id: str, text: str, context_type: str = "conversa
         traceback.print_exc()
         return False
 
+# Near-duplicate query cache for search_semantic_memory, namespaced per user:
+# user_id -> deque of (unit query vector, top_k, max_distance, memory_version, results)
+# (bounded to the most recently searching users as well as per user)
+SEMANTIC_QUERY_CACHE_PER_USER = 32
+SEMANTIC_QUERY_CACHE_USERS = 1024
+SEMANTIC_QUERY_THRESHOLD = 0.93
+_semantic_query_cache = UserCache(SEMANTIC_QUERY_CACHE_USERS)
+
+def _unit_vector(embedding) -> np.ndarray:
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+def _cached_semantic_results(user_id: str, query_vector: np.ndarray, top_k: int, max_distance: float):
+    """Results of an earlier search whose query is within SEMANTIC_QUERY_THRESHOLD cosine of this one"""
+    entries = _semantic_query_cache.get(user_id)
+    if not entries:
+        return None
+    version = user_memory_version(user_id)
+    candidates = [e for e in entries if e[1] == top_k and e[2] == max_distance and e[3] == version]
+    if not candidates:
+        return None
+    similarities = np.stack([e[0] for e in candidates]) @ query_vector
+    best = int(np.argmax(similarities))
+    if similarities[best] < SEMANTIC_QUERY_THRESHOLD:
+        return None
+    return [dict(result) for result in candidates[best][4]]
+
 def search_semantic_memory(user_id: str, query_text: str, top_k: int = 5, max_distance: float = 2.0):
     """Fast semantic memory search optimized for real-time performance"""
     global semantic_memory_table
@@ -693,26 +1188,34 @@ def search_semantic_memory(user_id: str, query_text: str, top_k: int = 5, max_di
         return []
 
     try:
-        print(f"🔍 Fast search for user '{user_id}' with query '{query_text[:30]}...'")
+        logger.debug("Fast search for user '%s' with query '%.30s...'", user_id, query_text)
 
         all_results = []
+        query_vector = None
+        failures = _read_failure_count()
 
         # Strategy 1: Single vector search (no expansion for speed)
         try:
             query_embedding = get_text_embedding(query_text)
+            query_vector = _unit_vector(query_embedding)
+            cached = _cached_semantic_results(user_id, query_vector, top_k, max_distance)
+            if cached is not None:
+                logger.debug("Semantic cache hit: %d results", len(cached))
+                return cached
             vector_results = _robust_vector_search(user_id, query_embedding, top_k * 2, max_distance)
             if vector_results:
                 all_results.extend(vector_results)
-                print(f"🔍 Vector search found {len(vector_results)} results")
+                logger.debug("Vector search found %d results", len(vector_results))
         except Exception as e:
             print(f"🔍 Vector search failed: {e}")
+            _note_read_failure()
 
         # Strategy 2: Text search fallback
         if len(all_results) < top_k:
             text_results = _text_search_memories(user_id, query_text, top_k)
             if text_results:
                 all_results.extend(text_results)
-                print(f"🔍 Text search found {len(text_results)} additional results")
+                logger.debug("Text search found %d additional results", len(text_results))
 
         # Quick deduplication
         seen_ids = set()
@@ -722,12 +1225,21 @@ def search_semantic_memory(user_id: str, query_text: str, top_k: int = 5, max_di
                 seen_ids.add(result["memory_id"])
                 unique_results.append(result)
 
-        final_results = sorted(unique_results, key=lambda x: x["distance"])[:top_k]
-        print(f"🔍 Fast search complete: {len(final_results)} results")
+        # Partial top-k selection; same order as sorted(...)[:top_k], ties included
+        final_results = heapq.nsmallest(top_k, unique_results, key=lambda x: x["distance"])
+        logger.debug("Fast search complete: %d results", len(final_results))
+        if query_vector is not None and _read_failure_count() == failures:
+            entries = _semantic_query_cache.get(user_id)
+            if entries is None:
+                entries = deque(maxlen=SEMANTIC_QUERY_CACHE_PER_USER)
+                _semantic_query_cache.put(user_id, entries)
+            entries.append((query_vector, top_k, max_distance, user_memory_version(user_id),
+                            [dict(result) for result in final_results]))
         return final_results
 
     except Exception as e:
         print(f"❌ Fast search failed: {e}")
+        _note_read_failure()
         return []
 
 def _expand_query(query_text: str) -> list:
@@ -749,32 +1261,27 @@ def _expand_query(query_text: str) -> list:
     return queries[:3]  # Limit to avoid too many API calls
 
 def _robust_vector_search(user_id: str, query_embedding: list, limit: int, max_distance: float) -> list:
-    """Robust vector search with fallbacks"""
+    """User-scoped ANN search: the user_id filter runs before the index probe, not after it"""
     global semantic_memory_table
 
-    # Try multiple search strategies
-    for attempt in range(2):
-        try:
-            if attempt == 0:
-                # Method 1: With user filter
-                results = (
-                    semantic_memory_table
-                    .search(query_embedding)
-                    .where(f"user_id = '{user_id}'")
-                    .limit(limit)
-                    .to_pandas()
-                )
-            else:
-                # Method 2: Search all, filter after
-                results = semantic_memory_table.search(query_embedding).limit(limit * 2).to_pandas()
-                results = results[results['user_id'] == user_id]
-
-            if len(results) > 0:
-                return _process_vector_results(results, max_distance)
-
-        except Exception as e:
-            print(f"🔍 Vector search attempt {attempt + 1} failed: {e}")
-            continue
+    try:
+        # Prefiltering keeps limit results for this user; a global search filtered afterwards
+        # could return none. The embedding column itself is never needed in the results.
+        results = (
+            semantic_memory_table
+            .search(query_embedding)
+            .where(f"user_id = {sql_literal(user_id)}", prefilter=True)
+            .nprobes(VECTOR_SEARCH_NPROBES)
+            .refine_factor(VECTOR_SEARCH_REFINE_FACTOR)
+            .select(MEMORY_FRAME_COLUMNS)
+            .limit(limit)
+            .to_pandas()
+        )
+        if len(results) > 0:
+            return _process_vector_results(results, max_distance)
+    except Exception as e:
+        print(f"🔍 Vector search failed: {e}")
+        _note_read_failure()
 
     return []
 
@@ -804,8 +1311,7 @@ def _text_search_memories(user_id: str, query_text: str, limit: int) -> list:
     global semantic_memory_table
 
     try:
-        all_memories_df = semantic_memory_table.to_pandas()
-        user_memories = all_memories_df[all_memories_df['user_id'] == user_id]
+        user_memories = user_memory_frame(user_id)
 
         query_lower = query_text.lower()
         matching_memories = user_memories[
@@ -828,6 +1334,7 @@ def _text_search_memories(user_id: str, query_text: str, limit: int) -> list:
         return results
     except Exception as e:
         print(f"🔍 Text search failed: {e}")
+        _note_read_failure()
         return []
 
 def _keyword_search_memories(user_id: str, query_text: str, limit: int) -> list:
@@ -840,8 +1347,7 @@ def _keyword_search_memories(user_id: str, query_text: str, limit: int) -> list:
         if not words:
             return []
 
-        all_memories_df = semantic_memory_table.to_pandas()
-        user_memories = all_memories_df[all_memories_df['user_id'] == user_id]
+        user_memories = user_memory_frame(user_id)
 
         # Search for memories containing any of the keywords
         pattern = '|'.join(words)
@@ -870,23 +1376,17 @@ def _keyword_search_memories(user_id: str, query_text: str, limit: int) -> list:
         return sorted(results, key=lambda x: x["distance"])
     except Exception as e:
         print(f"🔍 Keyword search failed: {e}")
+        _note_read_failure()
         return []
 
 def _get_cached_recent_memories(user_id: str, max_age_minutes: int = 10) -> list:
     """Get cached recent memories to avoid redundant searches"""
-    import time
-    global _memory_cache
-
-    # Simple in-memory cache
-    if '_memory_cache' not in globals():
-        _memory_cache = {}
-
-    cache_key = f"{user_id}_recent"
     now = time.time()
 
-    # Check if cache is still valid
-    if cache_key in _memory_cache:
-        cached_data, timestamp = _memory_cache[cache_key]
+    # Check if cache is still valid (memory writes drop the user's entry)
+    cached = _memory_cache.get(user_id)
+    if cached:
+        cached_data, timestamp = cached
         if (now - timestamp) < (max_age_minutes * 60):
             return cached_data
 
@@ -894,8 +1394,7 @@ def _get_cached_recent_memories(user_id: str, max_age_minutes: int = 10) -> list
     try:
         global semantic_memory_table
         if semantic_memory_table:
-            memories_df = semantic_memory_table.to_pandas()
-            user_memories = memories_df[memories_df['user_id'] == user_id].sort_values('timestamp', ascending=False)
+            user_memories = user_memory_frame(user_id).sort_values('timestamp', ascending=False)
 
             recent_memories = []
             for _, memory in user_memories.head(5).iterrows():
@@ -907,10 +1406,11 @@ def _get_cached_recent_memories(user_id: str, max_age_minutes: int = 10) -> list
                 })
 
             # Cache the result
-            _memory_cache[cache_key] = (recent_memories, now)
+            _memory_cache.put(user_id, (recent_memories, now))
             return recent_memories
     except Exception as e:
         print(f"Error getting recent memories: {e}")
+        _note_read_failure()
 
     return []
 
@@ -944,8 +1444,8 @@ def _deduplicate_and_rerank(all_results: list, query_text: str, top_k: int) -> l
         except Exception:
             result["combined_score"] = result["distance"]
 
-    # Sort by combined score and return top results
-    final_results = sorted(unique_results, key=lambda x: x["combined_score"])[:top_k]
+    # Select the top results by combined score without sorting the whole candidate list
+    final_results = heapq.nsmallest(top_k, unique_results, key=lambda x: x["combined_score"])
 
     # Clean up the results (remove combined_score)
     for result in final_results:
@@ -1000,6 +1500,12 @@ def get_contextual_memory_for_conversation(user_id: str, current_text: str, max_
             "memories": []
         }
 
+def _arrow_value_counts(column) -> Dict[str, int]:
+    """Non-null value counts of an Arrow column, most frequent first (like pandas value_counts)"""
+    counts = pc.value_counts(pc.drop_null(column))
+    pairs = zip(counts.field("values").to_pylist(), counts.field("counts").to_pylist())
+    return dict(sorted(pairs, key=lambda pair: pair[1], reverse=True))
+
 def get_user_memory_stats(user_id: str):
     """Get statistics about user's stored memories"""
     global semantic_memory_table
@@ -1007,12 +1513,19 @@ def get_user_memory_stats(user_id: str):
     if semantic_memory_table is None:
         return {"error": "Memory system not initialized"}
     
+    # Stats only change when this user's memories are written, so polling is a cache hit
+    cached = _memory_stats_cache.get(user_id)
+    if cached is not None:
+        return cached
+    
     try:
-        # Get all user memories
-        all_memories_df = semantic_memory_table.to_pandas()
-        user_memories = all_memories_df[all_memories_df['user_id'] == user_id]
+        # Pull only the stat columns for this user; embeddings and text never leave Lance
+        user_memories = semantic_memory_table.to_lance().to_table(
+            columns=["topic", "emotion", "context_type", "timestamp"],
+            filter=pc.field("user_id") == user_id
+        )
         
-        if len(user_memories) == 0:
+        if user_memories.num_rows == 0:
             return {
                 "total_memories": 0,
                 "topics": [],
@@ -1022,17 +1535,17 @@ def get_user_memory_stats(user_id: str):
             }
         
         # Calculate statistics
-        topics = user_memories['topic'].value_counts().to_dict()
-        emotions = user_memories['emotion'].value_counts().to_dict()
-        context_types = user_memories['context_type'].value_counts().to_dict()
+        topics = _arrow_value_counts(user_memories['topic'])
+        emotions = _arrow_value_counts(user_memories['emotion'])
+        context_types = _arrow_value_counts(user_memories['context_type'])
         
         # Date range
-        timestamps = user_memories['timestamp'].tolist()
-        first_memory = min(timestamps) if timestamps else None
-        last_memory = max(timestamps) if timestamps else None
+        timestamp_range = pc.min_max(user_memories['timestamp'])
+        first_memory = timestamp_range['min'].as_py()
+        last_memory = timestamp_range['max'].as_py()
         
-        return {
-            "total_memories": len(user_memories),
+        stats = {
+            "total_memories": user_memories.num_rows,
             "topics": topics,
             "emotions": emotions,
             "context_types": context_types,
@@ -1042,15 +1555,23 @@ def get_user_memory_stats(user_id: str):
             }
         }
         
+        _memory_stats_cache.put(user_id, stats)
+        return stats
+        
     except Exception as e:
         print(f"❌ Error getting memory stats: {e}")
+        _note_read_failure()
         return {"error": str(e)}
 
 # ============================================================================
 # FASTAPI APP SETUP
 # ============================================================================
 
-app = FastAPI(title="Aurora Final Processing System", version="1.0.0")
+app = FastAPI(
+    title="Aurora Final Processing System",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -1064,9 +1585,39 @@ app.add_middleware(
 # DEEPSEEK SPEECH ANALYSIS
 # ============================================================================
 
-def analyze_speech_with_deepseek(speech_text: str) -> Dict[str, Any]:
-    """Analyze speech using DeepSeek Chat with enhanced psychological modeling"""
-    
+# Required analysis fields and the values used when the model omits them
+ANALYSIS_REQUIRED_DEFAULTS = {
+    "topic": "unknown",
+    "emotion": "unknown",
+    "sentiment": "unknown",
+    "importance": 5,
+    "vulnerability": 5
+}
+
+# DeepSeek analyses keyed by normalized utterance, stored as encoded JSON so every caller
+# decodes its own dict; errors raise and are never cached
+ANALYSIS_CACHE_SIZE = 10000
+_analysis_cache: "OrderedDict[str, bytes]" = OrderedDict()
+_analysis_cache_lock = threading.Lock()  # analyses run in worker threads
+
+def _analyze_speech_cached(speech_text: str) -> bytes:
+    """DeepSeek analysis as encoded JSON; repeats that differ only in case/spacing reuse the first result"""
+    key = " ".join(speech_text.lower().split())
+    with _analysis_cache_lock:
+        cached = _analysis_cache.get(key)
+        if cached is not None:
+            _analysis_cache.move_to_end(key)
+            return cached
+    # The prompt gets the text as spoken: case carries names and emphasis
+    analysis = _analyze_speech_uncached(speech_text)
+    with _analysis_cache_lock:
+        _analysis_cache[key] = analysis
+        if len(_analysis_cache) > ANALYSIS_CACHE_SIZE:
+            _analysis_cache.popitem(last=False)
+    return analysis
+
+def _analyze_speech_uncached(speech_text: str) -> bytes:
+    """One DeepSeek call for an utterance, validated and encoded as JSON"""
     analysis_prompt = f"""
     You are an expert psychologist and relationship analyst. Analyze this speech and provide a sophisticated psychological assessment.
 
@@ -1102,46 +1653,51 @@ def analyze_speech_with_deepseek(speech_text: str) -> Dict[str, Any]:
     
     Analyze deeply - look for subtleties, contradictions, and emotional undertones. Return ONLY the JSON:
     """
-    
+
+    print(f"Calling DeepSeek API for analysis...")
+    response = deepseek_client.chat.completions.create(
+        model="deepseek-chat",
+        messages=[
+            {"role": "system", "content": "You are an expert at analyzing human speech patterns and psychology. Return only valid JSON."},
+            {"role": "user", "content": analysis_prompt}
+        ],
+        temperature=0.4,
+        max_tokens=300,
+        response_format={"type": "json_object"}
+    )
+
+    content = response.choices[0].message.content
+    print(f"DeepSeek response: {content[:100]}...")
+
+    # Remove markdown formatting if present
+    content = content.strip().removeprefix("```json").removesuffix("```")
+
+    # Decode and validate the contract in one step: the model must return an object
+    decoded = orjson.loads(content)
+    if not isinstance(decoded, dict):
+        raise ValueError(f"DeepSeek returned {type(decoded).__name__}, expected a JSON object")
+
+    # Fill any required fields the model left out
+    analysis = {**ANALYSIS_REQUIRED_DEFAULTS, **decoded}
+
+    # Ensure insights is a list
+    insights = analysis.get("insights")
+    if insights is None:
+        analysis["insights"] = [f"Analyzed speech about {analysis['topic']}"]
+    elif not isinstance(insights, list):
+        analysis["insights"] = [str(insights)]
+
+    return orjson.dumps(analysis)
+
+def analyze_speech_with_deepseek(speech_text: str) -> Dict[str, Any]:
+    """Analyze speech using DeepSeek Chat with enhanced psychological modeling"""
     try:
         if not DEEPSEEK_API_KEY:
             print("Warning: DEEPSEEK_API_KEY not found, using fallback analysis")
             raise Exception("No DeepSeek API key")
 
-        print(f"Calling DeepSeek API for analysis...")
-        response = deepseek_client.chat.completions.create(
-            model="deepseek-chat",
-            messages=[
-                {"role": "system", "content": "You are an expert at analyzing human speech patterns and psychology. Return only valid JSON."},
-                {"role": "user", "content": analysis_prompt}
-            ],
-            temperature=0.4,
-            max_tokens=300
-        )
-
-        content = response.choices[0].message.content
-        print(f"DeepSeek response: {content[:100]}...")
-
-        # Remove markdown formatting if present
-        content = content.strip()
-        if content.startswith("```json"):
-            content = content[7:]  # Remove ```json
-        if content.endswith("```"):
-            content = content[:-3]  # Remove ```
-
-        analysis = json.loads(content)
-
-        # Validate required fields
-        required_fields = ["topic", "emotion", "sentiment", "importance", "vulnerability"]
-        for field in required_fields:
-            if field not in analysis:
-                analysis[field] = "unknown" if field in ["topic", "emotion", "sentiment"] else 5
-
-        # Ensure insights is a list
-        if "insights" not in analysis:
-            analysis["insights"] = [f"Analyzed speech about {analysis.get('topic', 'general topic')}"]
-        elif not isinstance(analysis["insights"], list):
-            analysis["insights"] = [str(analysis["insights"])]
+        # Repeated greetings/confirmations hit the cache instead of the LLM
+        analysis = orjson.loads(_analyze_speech_cached(speech_text))
 
         print(f"Analysis completed: {analysis.get('topic')} / {analysis.get('emotion')} / {analysis.get('importance')}")
         return analysis
@@ -1151,47 +1707,69 @@ def analyze_speech_with_deepseek(speech_text: str) -> Dict[str, Any]:
         # Create a more intelligent fallback analysis based on keywords
         return create_fallback_analysis(speech_text)
 
+# Keyword tables for the offline fallback analysis (dict order is match priority)
+FALLBACK_EMOTION_KEYWORDS = {
+    "excited": ["excited", "amazing", "awesome", "fantastic", "thrilled", "pumped"],
+    "happy": ["happy", "joy", "great", "wonderful", "good", "pleased", "glad"],
+    "anxious": ["anxious", "worried", "nervous", "scared", "afraid", "concerned"],
+    "sad": ["sad", "disappointed", "upset", "down", "depressed", "hurt"],
+    "frustrated": ["frustrated", "annoyed", "angry", "mad", "irritated"],
+    "curious": ["curious", "wondering", "interested", "fascinated", "intrigued"]
+}
+FALLBACK_TOPIC_KEYWORDS = {
+    "career": ["job", "work", "career", "promotion", "interview", "boss", "salary"],
+    "relationships": ["relationship", "friend", "family", "love", "partner", "dating"],
+    "personal": ["feel", "think", "believe", "personal", "myself", "life"],
+    "technology": ["AI", "technology", "computer", "software", "app", "system"],
+    "goals": ["goal", "plan", "future", "want", "hope", "dream", "achieve"]
+}
+FALLBACK_IMPORTANCE_INDICATORS = ["important", "crucial", "significant", "matter", "care", "need"]
+FALLBACK_VULNERABILITY_INDICATORS = ["feel", "afraid", "worry", "personal", "secret", "admit"]
+
+def _build_fallback_keyword_labels() -> Dict[str, tuple]:
+    """Flatten every fallback keyword table into keyword -> ((bucket, label), ...)"""
+    labels = {}
+    for bucket, table in (("emotion", FALLBACK_EMOTION_KEYWORDS), ("topic", FALLBACK_TOPIC_KEYWORDS)):
+        for label, keywords in table.items():
+            for keyword in keywords:
+                labels.setdefault(keyword, []).append((bucket, label))
+    for keyword in FALLBACK_IMPORTANCE_INDICATORS:
+        labels.setdefault(keyword, []).append(("importance", "importance"))
+    for keyword in FALLBACK_VULNERABILITY_INDICATORS:
+        labels.setdefault(keyword, []).append(("vulnerability", "vulnerability"))
+    # The scan reports only the longest keyword starting at each position, so a keyword also
+    # carries the labels of every keyword that is its prefix ("career" implies "care")
+    return {
+        keyword: tuple(pair for other in labels if keyword.startswith(other) for pair in labels[other])
+        for keyword in labels
+    }
+
+_FALLBACK_KEYWORD_LABELS = _build_fallback_keyword_labels()
+# Substring semantics ("work" matches "working" and "homework") in one pass: a lookahead
+# tries every position, longest alternative first
+_FALLBACK_KEYWORD_RE = re.compile(
+    "(?=(" + "|".join(map(re.escape, sorted(_FALLBACK_KEYWORD_LABELS, key=len, reverse=True))) + "))"
+)
+
 def create_fallback_analysis(speech_text: str) -> Dict[str, Any]:
     """Create intelligent fallback analysis when DeepSeek API is unavailable"""
     text_lower = speech_text.lower()
 
-    # Emotion keywords
-    emotion_keywords = {
-        "excited": ["excited", "amazing", "awesome", "fantastic", "thrilled", "pumped"],
-        "happy": ["happy", "joy", "great", "wonderful", "good", "pleased", "glad"],
-        "anxious": ["anxious", "worried", "nervous", "scared", "afraid", "concerned"],
-        "sad": ["sad", "disappointed", "upset", "down", "depressed", "hurt"],
-        "frustrated": ["frustrated", "annoyed", "angry", "mad", "irritated"],
-        "curious": ["curious", "wondering", "interested", "fascinated", "intrigued"]
-    }
-
-    # Topic keywords
-    topic_keywords = {
-        "career": ["job", "work", "career", "promotion", "interview", "boss", "salary"],
-        "relationships": ["relationship", "friend", "family", "love", "partner", "dating"],
-        "personal": ["feel", "think", "believe", "personal", "myself", "life"],
-        "technology": ["AI", "technology", "computer", "software", "app", "system"],
-        "goals": ["goal", "plan", "future", "want", "hope", "dream", "achieve"]
+    # One regex pass over the text; every bucket below is derived from these hits
+    hits = {
+        pair for match in _FALLBACK_KEYWORD_RE.finditer(text_lower)
+        for pair in _FALLBACK_KEYWORD_LABELS[match.group(1)]
     }
 
     # Detect emotion
-    detected_emotion = "neutral"
-    for emotion, keywords in emotion_keywords.items():
-        if any(keyword in text_lower for keyword in keywords):
-            detected_emotion = emotion
-            break
+    detected_emotion = next((emotion for emotion in FALLBACK_EMOTION_KEYWORDS if ("emotion", emotion) in hits), "neutral")
 
     # Detect topic
-    detected_topic = "general"
-    for topic, keywords in topic_keywords.items():
-        if any(keyword in text_lower for keyword in keywords):
-            detected_topic = topic
-            break
+    detected_topic = next((topic for topic in FALLBACK_TOPIC_KEYWORDS if ("topic", topic) in hits), "general")
 
     # Calculate importance based on emotional words and length
-    importance_indicators = ["important", "crucial", "significant", "matter", "care", "need"]
     importance_score = 5
-    if any(word in text_lower for word in importance_indicators):
+    if ("importance", "importance") in hits:
         importance_score += 2
     if detected_emotion in ["excited", "anxious", "sad"]:
         importance_score += 2
@@ -1201,9 +1779,8 @@ def create_fallback_analysis(speech_text: str) -> Dict[str, Any]:
     importance_score = min(10, importance_score)
 
     # Calculate vulnerability based on personal disclosure
-    vulnerability_indicators = ["feel", "afraid", "worry", "personal", "secret", "admit"]
     vulnerability_score = 3
-    if any(word in text_lower for word in vulnerability_indicators):
+    if ("vulnerability", "vulnerability") in hits:
         vulnerability_score += 3
     if detected_emotion in ["anxious", "sad", "nervous"]:
         vulnerability_score += 2
@@ -1226,28 +1803,62 @@ def create_fallback_analysis(speech_text: str) -> Dict[str, Any]:
 # UTILITY FUNCTIONS FOR SERIALIZATION
 # ============================================================================
 
-def serialize_for_json(obj):
-    """Convert pandas/numpy objects to JSON-serializable types"""
-    if isinstance(obj, np.ndarray):
-        return obj.tolist()
-    elif isinstance(obj, np.integer):
-        return int(obj)
-    elif isinstance(obj, np.floating):
-        return float(obj)
-    elif isinstance(obj, np.bool_):
-        return bool(obj)
-    elif isinstance(obj, dict):
-        return {k: serialize_for_json(v) for k, v in obj.items()}
-    elif isinstance(obj, (list, tuple)):
-        return [serialize_for_json(item) for item in obj]
-    elif hasattr(obj, 'isoformat'):  # datetime objects
+def dumps_json(obj) -> str:
+    """Encode a value for a JSON string column (numpy scalars/arrays handled natively)"""
+    return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+def _json_default(obj):
+    """orjson fallback for types it does not encode natively"""
+    if hasattr(obj, 'isoformat'):  # pandas Timestamp and other datetime-likes
         return obj.isoformat()
-    else:
-        return obj
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+def _nan_to_null(column):
+    """Float column with NaN replaced by null, which serializes as JSON null"""
+    return pc.if_else(pc.is_nan(column), pa.scalar(None, column.type), column)
+
+@lru_cache(maxsize=64)
+def _json_column_converters(schema: pa.Schema) -> tuple:
+    """(column, converter) pairs a schema needs before to_pylist; computed once per schema"""
+    converters = []
+    for field in schema:
+        if pa.types.is_floating(field.type):
+            converters.append((field.name, _nan_to_null))
+        elif pa.types.is_fixed_size_list(field.type) and pa.types.is_float16(field.type.value_type):
+            # Half floats come back as numpy.float16 scalars; widen stored vectors in one cast
+            converters.append((field.name, partial(pc.cast, target_type=pa.list_(pa.float32(), field.type.list_size))))
+    return tuple(converters)
+
+def arrow_records(table: pa.Table) -> List[Dict]:
+    """Arrow rows as JSON-safe dicts, converting only the columns whose type needs it"""
+    for name, convert in _json_column_converters(table.schema):
+        index = table.schema.get_field_index(name)
+        table = table.set_column(index, name, convert(table.column(index)))
+    return table.to_pylist()
+
+def arrow_tail_records(table: pa.Table, n: int) -> List[Dict]:
+    """Last n rows of an Arrow table as JSON-safe dicts; earlier rows are never converted"""
+    return arrow_records(table.slice(max(table.num_rows - n, 0)))
+
+@lru_cache(maxsize=16)
+def _input_schema(schema: pa.Schema) -> pa.Schema:
+    """Schema rows are built in: Python floats cannot be written into half-float vectors directly"""
+    return pa.schema([
+        pa.field(field.name, pa.list_(pa.float32(), field.type.list_size))
+        if pa.types.is_fixed_size_list(field.type) and pa.types.is_float16(field.type.value_type)
+        else field
+        for field in schema
+    ])
+
+def schema_rows(rows: List[Dict], schema: pa.Schema) -> pa.Table:
+    """Row dicts as an Arrow table in a table's schema, so writes skip the pandas conversion"""
+    # Pass the opened table's schema, not the module constant: tables created before vectors
+    # were stored as float16 keep their float32 columns and must be written as such
+    return pa.Table.from_pylist(rows, schema=_input_schema(schema)).cast(schema)
 
-def safe_dict_from_pandas(pandas_dict):
-    """Safely convert pandas Series.to_dict() to JSON-serializable dict"""
-    return serialize_for_json(pandas_dict)
+def to_json_safe(obj):
+    """Convert pandas/numpy values to plain JSON types in a single orjson round trip"""
+    return orjson.loads(orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY, default=_json_default))
 
 # ============================================================================
 # DATABASE OPERATIONS
@@ -1261,15 +1872,16 @@ def get_or_create_user(user_id: str = "default_user") -> Dict:
         return {"error": "Database not initialized"}
 
     try:
-        # Search for existing user using correct LanceDB Python API
+        # Search for existing user; the predicate runs inside Lance so only the match is read
         try:
-            # LanceDB Python: use to_pandas and filter in Python for reliability
-            all_users_df = users_table.to_pandas()
-            if len(all_users_df) > 0:
-                existing_users = all_users_df[all_users_df['user_id'] == user_id]
-                if len(existing_users) > 0:
-                    print(f"Found existing user: {user_id}")
-                    return safe_dict_from_pandas(existing_users.iloc[0].to_dict())
+            existing_users = users_table.to_lance().to_table(
+                filter=pc.field("user_id") == user_id,
+                limit=1
+            )
+            if existing_users.num_rows > 0:
+                print(f"Found existing user: {user_id}")
+                # Arrow already yields plain Python values, no JSON-safety round trip needed
+                return arrow_records(existing_users)[0]
             print(f"User {user_id} not found, creating new user")
         except Exception as search_error:
             print(f"User search error (table might be empty): {search_error}")
@@ -1283,16 +1895,17 @@ def get_or_create_user(user_id: str = "default_user") -> Dict:
             "avg_relationship_level": 25.0,
             "avg_trust_level": 35.0,
             "avg_emotional_sync": 45.0,
-            "dominant_emotions": json.dumps(["neutral"]),
-            "frequent_topics": json.dumps(["general"]),
+            "dominant_emotions": dumps_json(["neutral"]),
+            "frequent_topics": dumps_json(["general"]),
             "communication_style": "exploring",
             "vulnerability_pattern": 3.0,
-            "personality_traits": json.dumps({}),
+            "personality_traits": dumps_json({}),
             "last_active": datetime.now().isoformat(),
             "profile_vector": [0.0] * 384
         }
 
-        users_table.add([user_data])
+        users_table.add(schema_rows([user_data], users_table.schema))
+        _recent_rows["users"].record([user_data])
         print(f"Created new user: {user_id}")
         return user_data
 
@@ -1309,78 +1922,222 @@ def store_conversation_record(conversation_id: str, user_id: str = "default_user
 
     try:
         # Generate conversation summary
-        summary_text = f"Conversation with {len(processed_speeches)} exchanges. "
-        summary_text += f"Topics: {', '.join(set([s['analysis'].get('topic', 'general') for s in processed_speeches]))}"
+        summary_text = (
+            f"Conversation with {len(processed_speeches)} exchanges. "
+            f"Topics: {', '.join(set(speech_columns.topics))}"
+        )
 
         # Extract emotional journey
-        emotions = [s['analysis'].get('emotion', 'neutral') for s in processed_speeches]
+        emotions = speech_columns.emotions
 
         # Generate conversation vector from summary
         conv_vector = get_text_embedding(summary_text)
 
         # Get user-specific metrics
         user_metrics_data = get_user_metrics(user_id)
+        ended_at = datetime.now().isoformat()
 
         conversation_data = {
             "conversation_id": conversation_id,
             "user_id": user_id,
-            "started_at": processed_speeches[0].get('timestamp', datetime.now().isoformat()),
-            "ended_at": datetime.now().isoformat(),
+            "started_at": processed_speeches[0].get('timestamp') or ended_at,
+            "ended_at": ended_at,
             "total_turns": len(processed_speeches),
             "final_relationship_level": user_metrics_data["relationship_level"],
             "final_trust_level": user_metrics_data["trust_level"],
             "final_emotional_sync": user_metrics_data["emotional_sync"],
             "final_memory_depth": user_metrics_data["memory_depth"],
             "dominant_topic": user_metrics_data["current_topic"],
-            "emotional_journey": json.dumps(emotions),
+            "emotional_journey": dumps_json(list(emotions)),
             "conversation_summary": summary_text,
-            "key_revelations": json.dumps(user_metrics_data["recent_insights"]),
-            "vulnerability_score": np.mean([s['analysis'].get('vulnerability', 3) for s in processed_speeches]),
+            "key_revelations": dumps_json(user_metrics_data["recent_insights"]),
+            "vulnerability_score": float(speech_columns.vulnerability.mean()),
             "conversation_vector": conv_vector
         }
 
-        conversations_table.add([conversation_data])
+        # Keep one rolling row per conversation: each later turn replaces the previous
+        # snapshot rather than appending another full copy (vector + journey) of it
+        (
+            conversations_table.merge_insert("conversation_id")
+            .when_matched_update_all()
+            .when_not_matched_insert_all()
+            .execute(schema_rows([conversation_data], conversations_table.schema))
+        )
+        _record_commit("conversations", conversations_table)
+        _recent_rows["conversations"].record([conversation_data])
+        invalidate_user_responses(user_id)
         print(f"Stored conversation: {conversation_id}")
 
         # Update user statistics
-        update_user_statistics(user_id)
+        update_user_statistics(user_id, conversation_data)
 
     except Exception as e:
         print(f"Error storing conversation: {e}")
 
+# Snapshot a conversation on its first meaningful turn, then every CONVERSATION_STORE_INTERVAL
+# turns; turns in between are written when Tavus reports the transcript or on shutdown
+CONVERSATION_STORE_INTERVAL = 5
+_conversation_last_stored_turn: Dict[str, int] = {}
+_conversations_pending_store: Dict[str, str] = {}
+
+def _conversation_turns(conversation_id: str) -> int:
+    """Turns seen in one conversation; unlike the bounded processed_speeches it only ever grows"""
+    return len(speeches_by_conversation.get(conversation_id, ()))
+
+def _store_conversation_throttled(conversation_id: str, user_id: str):
+    """Store the conversation snapshot only if enough turns have passed since the last one"""
+    turns = _conversation_turns(conversation_id)
+    last_stored = _conversation_last_stored_turn.get(conversation_id)
+    if last_stored is not None and turns - last_stored < CONVERSATION_STORE_INTERVAL:
+        _conversations_pending_store[conversation_id] = user_id
+        return
+    store_conversation_record(conversation_id, user_id)
+    _conversation_last_stored_turn[conversation_id] = turns
+    _conversations_pending_store.pop(conversation_id, None)
+
+def flush_pending_conversations(conversation_id: Optional[str] = None):
+    """Write the latest snapshot of one (or every) conversation with unstored turns"""
+    conversation_ids = [conversation_id] if conversation_id else list(_conversations_pending_store)
+    for pending_id in conversation_ids:
+        user_id = _conversations_pending_store.pop(pending_id, None)
+        if user_id is not None:
+            store_conversation_record(pending_id, user_id)
+        # Flushed conversations are finished (or the process is stopping): no more throttling
+        _conversation_last_stored_turn.pop(pending_id, None)
+    if conversation_id:
+        # A conversation flushed by id is finished; its speeches are no longer looked up
+        speeches_by_conversation.pop(conversation_id, None)
+
 def store_deep_insight(insight_text: str, insight_type: str, user_id: str = "default_user",
                       conversation_id: str = "current", speech_id: str = "",
                       confidence: float = 0.8, psychological_category: str = "general"):
     """Store a deep psychological insight"""
+    store_deep_insights([insight_text], insight_type, user_id, conversation_id, speech_id,
+                        confidence, psychological_category)
+
+def store_deep_insights(insight_texts: List[str], insight_type: str, user_id: str = "default_user",
+                        conversation_id: str = "current", speech_id: str = "",
+                        confidence: float = 0.8, psychological_category: str = "general"):
+    """Store a batch of insights from one speech with a single table write"""
     global insights_table
 
-    if insights_table is None:
+    if insights_table is None or not insight_texts:
         return
 
     try:
-        insight_vector = get_text_embedding(insight_text)
+        timestamp = datetime.now().isoformat()
+        supporting_evidence = dumps_json([speech_id])
 
-        insight_data = {
-            "insight_id": str(uuid4()),
-            "user_id": user_id,
-            "conversation_id": conversation_id,
-            "speech_id": speech_id,
-            "insight_text": insight_text,
-            "insight_type": insight_type,
-            "confidence_score": confidence,
-            "timestamp": datetime.now().isoformat(),
-            "supporting_evidence": json.dumps([speech_id]),
-            "psychological_category": psychological_category,
-            "insight_vector": insight_vector
-        }
+        insight_vectors = embed_many(insight_texts)
+        insight_rows = [
+            {
+                "insight_id": str(uuid4()),
+                "user_id": user_id,
+                "conversation_id": conversation_id,
+                "speech_id": speech_id,
+                "insight_text": insight_text,
+                "insight_type": insight_type,
+                "confidence_score": confidence,
+                "timestamp": timestamp,
+                "supporting_evidence": supporting_evidence,
+                "psychological_category": psychological_category,
+                "insight_vector": insight_vector
+            }
+            for insight_text, insight_vector in zip(insight_texts, insight_vectors)
+        ]
 
-        insights_table.add([insight_data])
-        print(f"Stored insight: {insight_type} - {insight_text[:50]}...")
+        # Buffered: rows from several speeches land in one Lance commit
+        _buffer_insight_rows(insight_rows)
+        for insight_text in insight_texts:
+            logger.debug("Stored insight: %s - %.50s...", insight_type, insight_text)
 
     except Exception as e:
         print(f"Error storing insight: {e}")
 
-def update_user_statistics(user_id: str):
+# Insight write buffer: flushed at INSIGHT_FLUSH_ROWS rows or INSIGHT_FLUSH_SECONDS after the first row
+INSIGHT_FLUSH_ROWS = 32
+INSIGHT_FLUSH_SECONDS = 2.0
+OPTIMIZE_EVERY_COMMITS = 100
+_insight_buffer: List[Dict] = []
+_insight_buffer_lock = threading.Lock()
+_insight_flush_timer: Optional[threading.Timer] = None
+_commits_since_optimize = {}
+
+def _buffer_insight_rows(rows: List[Dict]):
+    """Queue insight rows, flushing when the batch is full or arming the age timer"""
+    global _insight_flush_timer
+    with _insight_buffer_lock:
+        _insight_buffer.extend(rows)
+        full = len(_insight_buffer) >= INSIGHT_FLUSH_ROWS
+        if not full and _insight_flush_timer is None:
+            _insight_flush_timer = threading.Timer(INSIGHT_FLUSH_SECONDS, flush_insight_buffer)
+            _insight_flush_timer.daemon = True
+            _insight_flush_timer.start()
+    if full:
+        flush_insight_buffer()
+
+def flush_insight_buffer():
+    """Write all buffered insights in a single add"""
+    global _insight_flush_timer
+    with _insight_buffer_lock:
+        rows = _insight_buffer[:]
+        _insight_buffer.clear()
+        if _insight_flush_timer is not None:
+            _insight_flush_timer.cancel()
+            _insight_flush_timer = None
+
+    if not rows or insights_table is None:
+        return
+
+    try:
+        insights_table.add(schema_rows(rows, insights_table.schema))
+        _record_commit("insights", insights_table)
+        _recent_rows["insights"].record(rows)
+        for user_id in {row["user_id"] for row in rows}:
+            invalidate_user_responses(user_id)
+    except Exception as e:
+        print(f"Error flushing {len(rows)} insights: {e}")
+
+def _record_commit(name: str, table):
+    """Count commits per table and compact its fragments every OPTIMIZE_EVERY_COMMITS"""
+    count = _commits_since_optimize.get(name, 0) + 1
+    if count < OPTIMIZE_EVERY_COMMITS:
+        _commits_since_optimize[name] = count
+        return
+    _commits_since_optimize[name] = 0
+    try:
+        table.optimize()
+        print(f"🧹 Optimized {name} table")
+    except Exception as e:
+        print(f"ℹ️ Optimize note for {name}: {e}")
+
+# Last (patterns, conversation count, embedding) per user, so unchanged profiles skip Cohere
+PROFILE_VECTOR_REFRESH_CONVERSATIONS = 50
+_profile_vector_cache = UserCache(USER_CACHE_SIZE)
+
+# Per-user conversation aggregates keyed by conversation_id, so a turn only re-summarizes
+# its own conversation instead of rereading and re-decoding the user's whole history
+_user_conversation_stats = UserCache(USER_CACHE_SIZE)
+
+# Conversation columns _summarize_conversation reads
+USER_STATS_CONVERSATION_COLUMNS = [
+    "conversation_id", "started_at", "final_relationship_level", "final_trust_level",
+    "final_emotional_sync", "vulnerability_score", "dominant_topic", "emotional_journey",
+]
+
+def _summarize_conversation(conv: Dict[str, Any]) -> tuple:
+    """Reduce a conversation row to the fields update_user_statistics aggregates"""
+    return (
+        conv['started_at'],
+        conv['final_relationship_level'],
+        conv['final_trust_level'],
+        conv['final_emotional_sync'],
+        conv['vulnerability_score'],
+        conv['dominant_topic'],
+        Counter(orjson.loads(conv['emotional_journey'])),
+    )
+
+def update_user_statistics(user_id: str, conversation: Optional[Dict[str, Any]] = None):
     """Update user profile with latest conversation data"""
     global users_table, conversations_table
 
@@ -1388,75 +2145,160 @@ def update_user_statistics(user_id: str):
         return
 
     try:
-        # Get all conversations for this user
-        all_conversations_df = conversations_table.to_pandas()
-        user_conversations = all_conversations_df[all_conversations_df['user_id'] == user_id]
-
-        if len(user_conversations) == 0:
+        conversations = _user_conversation_stats.get(user_id)
+        if conversations is None:
+            # Cold start: rebuild this user's aggregates once from the stored conversations
+            # (which already include the conversation just written), reading only the
+            # summarized columns so conversation vectors never leave Lance
+            stored = conversations_table.to_lance().to_table(
+                columns=USER_STATS_CONVERSATION_COLUMNS,
+                filter=pc.field("user_id") == user_id
+            ).to_pylist()
+            conversations = {conv['conversation_id']: _summarize_conversation(conv) for conv in stored}
+            _user_conversation_stats.put(user_id, conversations)
+        elif conversation is not None:
+            conversations[conversation['conversation_id']] = _summarize_conversation(conversation)
+
+        if not conversations:
             return
 
+        summaries = list(conversations.values())
+        total_conversations = len(summaries)
+
         # Calculate averages
-        avg_relationship = user_conversations['final_relationship_level'].mean()
-        avg_trust = user_conversations['final_trust_level'].mean()
-        avg_emotional_sync = user_conversations['final_emotional_sync'].mean()
-        total_conversations = len(user_conversations)
-
-        # Extract patterns
-        all_emotions = []
-        all_topics = []
-        for _, conv in user_conversations.iterrows():
-            emotions = json.loads(conv['emotional_journey'])
-            all_emotions.extend(emotions)
-            all_topics.append(conv['dominant_topic'])
+        avg_relationship = sum(c[1] for c in summaries) / total_conversations
+        avg_trust = sum(c[2] for c in summaries) / total_conversations
+        avg_emotional_sync = sum(c[3] for c in summaries) / total_conversations
 
-        # Find dominant patterns
-        from collections import Counter
-        emotion_counts = Counter(all_emotions)
-        topic_counts = Counter(all_topics)
+        # Extract patterns from the per-conversation counters
+        emotion_counts = Counter()
+        for summary in summaries:
+            emotion_counts.update(summary[6])
+        topic_counts = Counter(c[5] for c in summaries)
 
+        # Find dominant patterns
         dominant_emotions = [emotion for emotion, _ in emotion_counts.most_common(3)]
         frequent_topics = [topic for topic, _ in topic_counts.most_common(3)]
 
         # Calculate vulnerability pattern
-        vulnerability_pattern = user_conversations['vulnerability_score'].mean()
-
-        # Update user record
-        users_table.delete(f"user_id = '{user_id}'")
+        vulnerability_pattern = sum(c[4] for c in summaries) / total_conversations
+
+        # Every turn rewrites the profile, but the vector only needs to move when the top
+        # patterns do; the conversation count alone just triggers a periodic refresh
+        patterns = (tuple(dominant_emotions), tuple(frequent_topics))
+        cached_profile = _profile_vector_cache.get(user_id)
+        if (cached_profile and cached_profile[0] == patterns
+                and total_conversations - cached_profile[1] < PROFILE_VECTOR_REFRESH_CONVERSATIONS):
+            profile_vector = cached_profile[2]
+        else:
+            profile_vector = get_text_embedding(f"User with {total_conversations} conversations, topics: {', '.join(frequent_topics)}, emotions: {', '.join(dominant_emotions)}")
+            _profile_vector_cache.put(user_id, (patterns, total_conversations, profile_vector))
 
         updated_user = {
             "user_id": user_id,
-            "created_at": user_conversations.iloc[0]['started_at'],
+            "created_at": summaries[0][0],
             "total_conversations": total_conversations,
             "avg_relationship_level": avg_relationship,
             "avg_trust_level": avg_trust,
             "avg_emotional_sync": avg_emotional_sync,
-            "dominant_emotions": json.dumps(dominant_emotions),
-            "frequent_topics": json.dumps(frequent_topics),
+            "dominant_emotions": dumps_json(dominant_emotions),
+            "frequent_topics": dumps_json(frequent_topics),
             "communication_style": "analyzed",  # Could be enhanced with ML
             "vulnerability_pattern": vulnerability_pattern,
-            "personality_traits": json.dumps({"openness": vulnerability_pattern / 10}),
+            # Merged, so the stored name and bio survive the statistics refresh
+            "personality_traits": dumps_json({**get_user_traits(user_id), "openness": vulnerability_pattern / 10}),
             "last_active": datetime.now().isoformat(),
-            "profile_vector": get_text_embedding(f"User with {total_conversations} conversations, topics: {', '.join(frequent_topics)}, emotions: {', '.join(dominant_emotions)}")
+            "profile_vector": profile_vector
         }
 
-        users_table.add([updated_user])
+        # Single atomic upsert: no window where the user row is missing
+        user_row = schema_rows([updated_user], users_table.schema)
+        (
+            users_table.merge_insert("user_id")
+            .when_matched_update_all()
+            .when_not_matched_insert_all()
+            .execute(user_row)
+        )
+        _record_commit("users", users_table)
+        _recent_rows["users"].record(arrow_records(user_row))
+        invalidate_user_responses(user_id)
         print(f"Updated user statistics for {user_id}")
 
     except Exception as e:
         print(f"Error updating user statistics: {e}")
 
+def _speech_pattern_data(recent_speeches: List[Dict]) -> str:
+    """One pattern line per speech for the last 5 speeches"""
+    return "".join(
+        f"Topic: {analysis.get('topic')}, Emotion: {analysis.get('emotion')}, Vulnerability: {analysis.get('vulnerability')}\n"
+        for analysis in (speech.get('analysis', {}) for speech in recent_speeches[-5:])
+    )
+
+def generate_behavioral_insights_batch(batch: List[tuple]) -> Dict[str, List[str]]:
+    """Insights for several (user_id, recent_speeches) pairs from a single DeepSeek call"""
+    if len(batch) == 1:
+        user_id, recent_speeches = batch[0]
+        return {user_id: generate_behavioral_insights(recent_speeches)}
+
+    results = {
+        user_id: ["Gathering conversation data to generate behavioral insights..."]
+        for user_id, recent_speeches in batch if len(recent_speeches) < 2
+    }
+    pending = [(user_id, recent_speeches) for user_id, recent_speeches in batch if user_id not in results]
+    if not pending:
+        return results
+
+    pattern_blocks = "\n".join(
+        f"[user:{i}]\n{_speech_pattern_data(recent_speeches)}"
+        for i, (_, recent_speeches) in enumerate(pending)
+    )
+    insight_prompt = f"""
+    Each block below holds one person's conversation patterns. For every block, generate 2-3 specific
+    insights about human behavior or that person. Be specific and psychologically insightful, not generic.
+
+    {pattern_blocks}
+
+    Return a JSON object mapping each block number to an array of insight strings:
+    {{"0": ["insight 1", "insight 2"], "1": ["insight 1", "insight 2"]}}
+    """
+
+    batched = {}
+    try:
+        if not DEEPSEEK_API_KEY:
+            raise Exception("No DeepSeek API key")
+
+        response = deepseek_client.chat.completions.create(
+            model="deepseek-chat",
+            messages=[
+                {"role": "system", "content": "Generate specific psychological insights about human behavior. Return a JSON object."},
+                {"role": "user", "content": insight_prompt}
+            ],
+            temperature=0.7,
+            max_tokens=200 * len(pending),
+            response_format={"type": "json_object"}
+        )
+        content = response.choices[0].message.content.strip().removeprefix("```json").removesuffix("```")
+        batched = orjson.loads(content)
+        if not isinstance(batched, dict):
+            batched = {}
+    except Exception as e:
+        print(f"Batched insight generation error: {e}")
+
+    # Anyone the model skipped gets the same fallback a single call would
+    for i, (user_id, recent_speeches) in enumerate(pending):
+        insights = batched.get(str(i))
+        results[user_id] = insights if isinstance(insights, list) and insights else generate_fallback_insights(recent_speeches)
+    return results
+
 def generate_behavioral_insights(recent_speeches: List[Dict]) -> List[str]:
     """Generate insights about human behavior patterns"""
     
     if len(recent_speeches) < 2:
         return ["Gathering conversation data to generate behavioral insights..."]
     
-    # Compile data for analysis
-    speech_data = ""
-    for speech in recent_speeches[-5:]:  # Last 5 speeches
-        analysis = speech.get('analysis', {})
-        speech_data += f"Topic: {analysis.get('topic')}, Emotion: {analysis.get('emotion')}, Vulnerability: {analysis.get('vulnerability')}\n"
-    
+    # Compile data for analysis (last 5 speeches)
+    speech_data = _speech_pattern_data(recent_speeches)
+
     insight_prompt = f"""
     Based on these conversation patterns, generate 2-3 specific insights about human behavior or this person.
     Be specific and psychologically insightful, not generic.
@@ -1491,7 +2333,7 @@ def generate_behavioral_insights(recent_speeches: List[Dict]) -> List[str]:
         if content.endswith("```"):
             content = content[:-3]  # Remove ```
 
-        insights = json.loads(content)
+        insights = orjson.loads(content)
         return insights if isinstance(insights, list) else ["Generated insight about conversation patterns"]
 
     except Exception as e:
@@ -1504,27 +2346,35 @@ def generate_fallback_insights(recent_speeches: List[Dict]) -> List[str]:
     if len(recent_speeches) < 2:
         return ["Gathering conversation data to generate behavioral insights..."]
 
-    # Analyze patterns in the speeches
-    emotions = [speech.get('analysis', {}).get('emotion', 'neutral') for speech in recent_speeches[-5:]]
-    topics = [speech.get('analysis', {}).get('topic', 'general') for speech in recent_speeches[-5:]]
-    vulnerabilities = [speech.get('analysis', {}).get('vulnerability', 3) for speech in recent_speeches[-5:]]
+    # Analyze patterns in the snapshotted speeches (same defaults as SpeechColumns)
+    analyses = [speech.get('analysis', {}) for speech in recent_speeches[-5:]]
+    topics = [analysis.get('topic', 'general') for analysis in analyses]
+    emotions = [analysis.get('emotion', 'neutral') for analysis in analyses]
+    vulnerabilities = []
+    for analysis in analyses:
+        try:
+            vulnerabilities.append(float(analysis.get('vulnerability', 3)))
+        except (TypeError, ValueError):
+            vulnerabilities.append(3.0)
 
     insights = []
 
+    # One counting pass per column; variety and per-label checks all read these counts
+    emotion_counts = Counter(emotions)
+    topic_counts = Counter(topics)
+
     # Emotional pattern insight
-    emotion_variety = len(set(emotions))
-    if emotion_variety > 3:
+    if len(emotion_counts) > 3:
         insights.append("Shows rich emotional range and authentic expression across topics")
-    elif emotions.count('excited') > 2:
+    elif emotion_counts['excited'] > 2:
         insights.append("Demonstrates consistent enthusiasm and positive energy")
-    elif emotions.count('anxious') > 1:
+    elif emotion_counts['anxious'] > 1:
         insights.append("Shows pattern of concern that may benefit from reassurance")
 
     # Topic pattern insight
-    topic_variety = len(set(topics))
-    if topic_variety > 2:
+    if len(topic_counts) > 2:
         insights.append("Engages with diverse topics, indicating intellectual curiosity")
-    elif topics.count('personal') > 2:
+    elif topic_counts['personal'] > 2:
         insights.append("Comfortable with personal disclosure and self-reflection")
 
     # Vulnerability pattern insight
@@ -1544,34 +2394,79 @@ def generate_fallback_insights(recent_speeches: List[Dict]) -> List[str]:
 # METRICS UPDATE SYSTEM
 # ============================================================================
 
-def update_live_metrics(analysis: Dict[str, Any], speech_text: str, user_id: str = "default_user"):
-    """Update live metrics with sophisticated bidirectional changes based on psychological analysis"""
-
-    metrics = get_user_metrics(user_id)
-
-    # Store previous values for trend calculation
-    prev_relationship = metrics["relationship_level"]
-    prev_trust = metrics["trust_level"]
-    prev_emotional = metrics["emotional_sync"]
-    prev_memory = metrics["memory_depth"]
-
-    # Extract enhanced analysis values
-    importance = analysis.get("importance", 5)
-    vulnerability = analysis.get("vulnerability", 3)
-    emotion = analysis.get("emotion", "neutral")
-    energy = analysis.get("energy_level", 5)
-    authenticity = analysis.get("authenticity", 5)
-    trust_signals = analysis.get("trust_signals", 5)
-    emotional_availability = analysis.get("emotional_availability", 5)
-    memory_significance = analysis.get("memory_significance", 5)
-    relationship_trajectory = analysis.get("relationship_trajectory", 0)
-    growth_indicators = analysis.get("growth_indicators", 5)
-    stress_indicators = analysis.get("stress_indicators", 5)
-    
-    # Update conversation tracking
-    metrics["conversation_turns"] += 1
-    metrics["conversation_active"] = True
+# Per-user background insight generation: at most one in flight, and not more often than this.
+# Requests from different users arriving within INSIGHT_BATCH_WINDOW share one DeepSeek call.
+INSIGHT_REFRESH_SECONDS = 5.0
+INSIGHT_BATCH_WINDOW = 0.2
+INSIGHT_BATCH_SIZE = 8
+_insights_in_flight = set()
+# Users whose insights ran within INSIGHT_REFRESH_SECONDS; entries expire with the refresh window
+_insights_last_run = UserCache(USER_CACHE_SIZE, INSIGHT_REFRESH_SECONDS)
+_pending_insight_batch: Dict[str, tuple] = {}
+_insight_batch_task: Optional[asyncio.Task] = None
+
+def _schedule_behavioral_insights(metrics: Dict[str, Any], user_id: str):
+    """Queue a metrics["recent_insights"] refresh unless one is running or recent"""
+    global _insight_batch_task
+    if user_id in _insights_in_flight or _insights_last_run.get(user_id) is not None:
+        return
+    _insights_in_flight.add(user_id)
+    _insights_last_run.put(user_id, True)
+
+    # Snapshot the speeches so later turns don't change what this run analyzes
+    _pending_insight_batch[user_id] = (metrics, recent_speeches(5))
+    if len(_pending_insight_batch) >= INSIGHT_BATCH_SIZE:
+        _start_insight_batch(delay=0)
+    elif _insight_batch_task is None:
+        _start_insight_batch(delay=INSIGHT_BATCH_WINDOW)
+
+def _start_insight_batch(delay: float):
+    """Hand everything queued so far to one batch run after delay seconds"""
+    global _insight_batch_task
+    _insight_batch_task = asyncio.get_running_loop().create_task(_run_insight_batch(delay))
+
+async def _run_insight_batch(delay: float):
+    """Drain the pending insight requests into a single worker-thread DeepSeek call"""
+    global _insight_batch_task
+    if delay:
+        await asyncio.sleep(delay)
+    batch = dict(_pending_insight_batch)
+    _pending_insight_batch.clear()
+    if _insight_batch_task is asyncio.current_task():
+        _insight_batch_task = None
+    if not batch:
+        return
 
+    try:
+        results = await asyncio.to_thread(
+            generate_behavioral_insights_batch,
+            [(user_id, speeches) for user_id, (_, speeches) in batch.items()]
+        )
+    except Exception as e:
+        print(f"Error generating behavioral insights: {e}")
+        results = {}
+    finally:
+        _insights_in_flight.difference_update(batch)
+
+    for user_id, (metrics, _) in batch.items():
+        insights = results.get(user_id)
+        if insights is not None:
+            metrics["recent_insights"] = insights
+            metrics["insights_count"] = len(insights)
+
+# How each emotion moves emotional sync, resolved with one dict probe per speech
+EMOTION_SYNC_GROUPS = {
+    **dict.fromkeys(["excited", "happy", "curious", "grateful"], "energizing"),
+    **dict.fromkeys(["anxious", "nervous", "sad"], "vulnerable"),
+    **dict.fromkeys(["angry", "frustrated"], "negative"),
+    "confused": "confused",
+}
+
+def _compute_metric_deltas(importance: float, vulnerability: float, emotion: str, energy: float,
+                           authenticity: float, trust_signals: float, emotional_availability: float,
+                           memory_significance: float, relationship_trajectory: float,
+                           growth_indicators: float, stress_indicators: float) -> tuple:
+    """Pure per-speech deltas for (relationship, trust, emotional sync, memory depth)"""
     # RELATIONSHIP LEVEL - Can increase or decrease based on trajectory and authenticity
     relationship_change = relationship_trajectory * authenticity * 0.3
     if trust_signals < 3:  # Trust-damaging behavior
@@ -1579,9 +2474,6 @@ def update_live_metrics(analysis: Dict[str, Any], speech_text: str, user_id: str
     if stress_indicators > 7:  # High stress can strain relationship
         relationship_change -= (stress_indicators - 7) * 0.5
 
-    new_relationship = max(0.0, min(100.0, metrics["relationship_level"] + relationship_change))
-    metrics["relationship_level"] = new_relationship
-
     # TRUST LEVEL - Sophisticated trust modeling
     trust_change = (trust_signals - 5) * 0.8  # Neutral is 5, so this can be negative
     trust_change += (authenticity - 5) * 0.4  # Authenticity affects trust
@@ -1591,29 +2483,24 @@ def update_live_metrics(analysis: Dict[str, Any], speech_text: str, user_id: str
     if stress_indicators > 8:  # Extreme stress can damage trust
         trust_change -= 1.0
 
-    new_trust = max(0.0, min(100.0, metrics["trust_level"] + trust_change))
-    metrics["trust_level"] = new_trust
-
     # EMOTIONAL SYNC - Based on emotional availability and authenticity
     emotional_change = (emotional_availability - 5) * 0.6
     emotional_change += (authenticity - 5) * 0.4
 
     # Different emotions have different sync effects
-    if emotion in ["excited", "happy", "curious", "grateful"]:
+    sync_group = EMOTION_SYNC_GROUPS.get(emotion)
+    if sync_group == "energizing":
         emotional_change += energy * 0.3
-    elif emotion in ["anxious", "nervous", "sad"]:
+    elif sync_group == "vulnerable":
         if vulnerability > 6:  # Vulnerable emotional sharing builds sync
             emotional_change += vulnerability * 0.4
         else:  # Surface-level negative emotions can decrease sync
             emotional_change -= 0.5
-    elif emotion in ["angry", "frustrated"]:
+    elif sync_group == "negative":
         emotional_change -= 0.8  # Negative emotions typically decrease sync
-    elif emotion == "confused":
+    elif sync_group == "confused":
         emotional_change -= 0.3  # Confusion slightly decreases sync
 
-    new_emotional = max(0.0, min(100.0, metrics["emotional_sync"] + emotional_change))
-    metrics["emotional_sync"] = new_emotional
-
     # MEMORY DEPTH - How much we're learning and remembering
     memory_change = (memory_significance - 5) * 0.5
     memory_change += (importance - 5) * 0.4
@@ -1624,6 +2511,51 @@ def update_live_metrics(analysis: Dict[str, Any], speech_text: str, user_id: str
     if stress_indicators > 8:  # High stress can impair memory formation
         memory_change -= 1.0
 
+    return relationship_change, trust_change, emotional_change, memory_change
+
+def update_live_metrics(analysis: Dict[str, Any], speech_text: str, user_id: str = "default_user"):
+    """Update live metrics with sophisticated bidirectional changes based on psychological analysis"""
+
+    metrics = get_user_metrics(user_id)
+
+    # Store previous values for trend calculation
+    prev_relationship = metrics["relationship_level"]
+    prev_trust = metrics["trust_level"]
+    prev_emotional = metrics["emotional_sync"]
+    prev_memory = metrics["memory_depth"]
+
+    # Extract enhanced analysis values
+    importance = analysis.get("importance", 5)
+    vulnerability = analysis.get("vulnerability", 3)
+    emotion = analysis.get("emotion", "neutral")
+    energy = analysis.get("energy_level", 5)
+    authenticity = analysis.get("authenticity", 5)
+    trust_signals = analysis.get("trust_signals", 5)
+    emotional_availability = analysis.get("emotional_availability", 5)
+    memory_significance = analysis.get("memory_significance", 5)
+    relationship_trajectory = analysis.get("relationship_trajectory", 0)
+    growth_indicators = analysis.get("growth_indicators", 5)
+    stress_indicators = analysis.get("stress_indicators", 5)
+    
+    # Update conversation tracking
+    metrics["conversation_turns"] += 1
+    metrics["conversation_active"] = True
+
+    relationship_change, trust_change, emotional_change, memory_change = _compute_metric_deltas(
+        importance, vulnerability, emotion, energy, authenticity, trust_signals,
+        emotional_availability, memory_significance, relationship_trajectory,
+        growth_indicators, stress_indicators
+    )
+
+    new_relationship = max(0.0, min(100.0, metrics["relationship_level"] + relationship_change))
+    metrics["relationship_level"] = new_relationship
+
+    new_trust = max(0.0, min(100.0, metrics["trust_level"] + trust_change))
+    metrics["trust_level"] = new_trust
+
+    new_emotional = max(0.0, min(100.0, metrics["emotional_sync"] + emotional_change))
+    metrics["emotional_sync"] = new_emotional
+
     new_memory = max(0.0, min(100.0, metrics["memory_depth"] + memory_change))
     metrics["memory_depth"] = new_memory
 
@@ -1645,11 +2577,10 @@ def update_live_metrics(analysis: Dict[str, Any], speech_text: str, user_id: str
     if "behavioral_patterns" in analysis:
         metrics["behavioral_patterns"] = analysis["behavioral_patterns"]
     
-    # Generate insights if we have enough data
+    # Generate insights if we have enough data; the LLM call runs off the request path
+    # and lands in metrics when done, so this turn reports the previous insights
     if len(processed_speeches) >= 2:
-        insights = generate_behavioral_insights(processed_speeches)
-        metrics["recent_insights"] = insights
-        metrics["insights_count"] = len(insights)
+        _schedule_behavioral_insights(metrics, user_id)
 
     # Log the changes for debugging
     print(f"🔄 Metrics updated for {user_id}:")
@@ -1669,22 +2600,36 @@ async def root():
 @app.get("/api/metrics")
 async def get_live_metrics(user_id: str = "default_user"):
     """Get current live metrics for Tesla interface"""
-    return get_user_metrics(user_id)
+    return {
+        **get_user_metrics(user_id),
+        "embedding_cache": {**_embedding_cache_stats, "size": len(_embedding_cache)}
+    }
 
 @app.get("/api/user/{user_id}/name")
 async def get_remembered_name(user_id: str):
     """Check if system remembers user's name using fast deterministic recall"""
-    stored_name = recall_user_name_fast(user_id)
+    stored_name = await asyncio.to_thread(recall_user_name_fast, user_id)
     return {
         "user_id": user_id,
         "remembered_name": stored_name,
         "has_name": stored_name is not None
     }
 
+@app.post("/api/user/{user_id}/profile")
+async def update_user_profile(user_id: str, name: Optional[str] = Query(None), bio: Optional[str] = Query(None)):
+    """Set a user's preferred name and/or the background sentence added to their Tavus context"""
+    validate_user_id(user_id)
+    if name:
+        await asyncio.to_thread(store_user_name, user_id, name)
+    if bio is not None:
+        await asyncio.to_thread(store_user_traits, user_id, {"bio": bio})
+    traits = await asyncio.to_thread(get_user_traits, user_id)
+    return {"user_id": user_id, "name": traits.get("name"), "bio": traits.get("bio")}
+
 @app.get("/api/user/{user_id}/memory-stats")
 async def get_user_memory_statistics(user_id: str):
     """Get memory statistics for a user"""
-    stats = get_user_memory_stats(user_id)
+    stats = await asyncio.to_thread(get_user_memory_stats, user_id)
     return stats
 
 @app.get("/api/user/{user_id}/timeline")
@@ -1702,9 +2647,8 @@ async def get_user_timeline(user_id: str):
         conversations = []
         if conversations_table:
             try:
-                conv_df = conversations_table.to_pandas()
-                user_conversations = conv_df[conv_df['user_id'] == user_id].sort_values('ended_at', ascending=False)
-                conversations = [safe_dict_from_pandas(row) for row in user_conversations.to_dict('records')]
+                user_conversations = scan_where(conversations_table, "user_id", user_id)
+                conversations = arrow_records(user_conversations.sort_by([("ended_at", "descending")]))
             except Exception as e:
                 print(f"Error getting conversations: {e}")
 
@@ -1712,9 +2656,8 @@ async def get_user_timeline(user_id: str):
         insights = []
         if insights_table:
             try:
-                insights_df = insights_table.to_pandas()
-                user_insights = insights_df[insights_df['user_id'] == user_id].sort_values('timestamp', ascending=False)
-                insights = [safe_dict_from_pandas(row) for row in user_insights.to_dict('records')]
+                user_insights = scan_where(insights_table, "user_id", user_id)
+                insights = arrow_records(user_insights.sort_by([("timestamp", "descending")]))
             except Exception as e:
                 print(f"Error getting insights: {e}")
 
@@ -1722,15 +2665,10 @@ async def get_user_timeline(user_id: str):
         memories = []
         if semantic_memory_table:
             try:
-                memories_df = semantic_memory_table.to_pandas()
-                user_memories = memories_df[memories_df['user_id'] == user_id].sort_values('timestamp', ascending=False)
-
-                for _, memory in user_memories.head(20).iterrows():  # Last 20 memories
-                    memory_dict = memory.to_dict()
-                    # Remove heavy embedding vector
-                    if 'embedding_vector' in memory_dict:
-                        del memory_dict['embedding_vector']
-                    memories.append(memory_dict)
+                # Heavy embedding vector is never read
+                memory_columns = [name for name in semantic_memory_table.schema.names if name != 'embedding_vector']
+                user_memories = scan_where(semantic_memory_table, "user_id", user_id, columns=memory_columns)
+                memories = arrow_records(user_memories.sort_by([("timestamp", "descending")]).slice(0, 20))  # Last 20 memories
             except Exception as e:
                 print(f"Error getting memories: {e}")
 
@@ -1810,7 +2748,8 @@ async def get_user_timeline(user_id: str):
 @app.get("/api/user/{user_id}/search-memory")
 async def search_user_memory(user_id: str, q: str, limit: int = 5):
     """Search user's semantic memory"""
-    if not q or not q.strip():
+    query_text = q.strip() if q else ""
+    if not query_text:
         return {"error": "Query parameter 'q' is required"}
     
     # Try text search first as fallback, then vector search
@@ -1818,8 +2757,7 @@ async def search_user_memory(user_id: str, q: str, limit: int = 5):
     if ensure_db() and semantic_memory_table is not None:
         try:
             # Simple text search as fallback
-            all_memories_df = semantic_memory_table.to_pandas()
-            user_memories = all_memories_df[all_memories_df['user_id'] == user_id]
+            user_memories = await asyncio.to_thread(user_memory_frame, user_id)
 
             # Simple text contains search
             query_lower = q.lower()
@@ -1851,7 +2789,7 @@ async def search_user_memory(user_id: str, q: str, limit: int = 5):
             print(f"Text search failed: {e}")
 
     # Fall back to vector search
-    memories = search_semantic_memory(user_id, q.strip(), top_k=limit)
+    memories = await asyncio.to_thread(search_semantic_memory, user_id, query_text, top_k=limit)
     return {
         "query": q,
         "user_id": user_id,
@@ -1863,27 +2801,28 @@ async def search_user_memory(user_id: str, q: str, limit: int = 5):
 @app.get("/api/user/{user_id}/context")
 async def get_conversation_context(user_id: str, current_text: str = ""):
     """Get conversational context for user"""
-    context = get_contextual_memory_for_conversation(user_id, current_text)
+    context = await asyncio.to_thread(get_contextual_memory_for_conversation, user_id, current_text)
     return context
 
 @app.get("/api/debug/user/{user_id}")
 async def debug_user_memory(user_id: str):
     """Debug endpoint to check user memory and name storage"""
     try:
+        # Every step reads Lance (and the search embeds via Cohere), so all run off the event loop
         # Check if user exists
-        user_profile = get_or_create_user(user_id)
+        user_profile = await asyncio.to_thread(get_or_create_user, user_id)
         
         # Check stored name
-        stored_name = get_user_name(user_id)
+        stored_name = await asyncio.to_thread(get_user_name, user_id)
         
         # Check memory stats
-        memory_stats = get_user_memory_stats(user_id)
+        memory_stats = await asyncio.to_thread(get_user_memory_stats, user_id)
         
         # Check recent memories
-        recent_memories = search_semantic_memory(user_id, "conversation", top_k=3)
+        recent_memories = await asyncio.to_thread(search_semantic_memory, user_id, "conversation", top_k=3)
         
         # Build context
-        context = build_context_from_db(user_id)
+        context = await asyncio.to_thread(build_context_from_db, user_id)
         
         return {
             "user_id": user_id,
@@ -1893,7 +2832,7 @@ async def debug_user_memory(user_id: str):
             "recent_memories": recent_memories,
             "context": context,
             "debug_info": {
-                "cache_keys": list(_user_name_cache.keys()),
+                "cache_keys": _user_name_cache.keys(),
                 "cache_for_user": _user_name_cache.get(user_id)
             }
         }
@@ -1905,8 +2844,8 @@ async def process_speech(speech_data: dict):
     """Process speech from HTML client with database storage"""
 
     speech_text = speech_data.get("text", "").strip()
-    user_id = speech_data.get("user_id", "default_user")
-    conversation_id = speech_data.get("conversation_id", f"conv_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+    user_id = validate_user_id(speech_data.get("user_id", "default_user"))
+    conversation_id = speech_data.get("conversation_id") or f"conv_{datetime.now():%Y%m%d_%H%M%S}"
 
     if not speech_text:
         return {"error": "No speech text provided"}
@@ -1914,23 +2853,23 @@ async def process_speech(speech_data: dict):
     print(f"Processing speech for user {user_id}: {speech_text}")
 
     # Ensure user exists in database
-    user_profile = get_or_create_user(user_id)
+    user_profile = await asyncio.to_thread(get_or_create_user, user_id)
 
     # Extract name if present
     extracted_name = extract_name_from_speech(speech_text)
     print(f"🔍 Name extraction result for '{speech_text[:50]}...': {extracted_name}")
     if extracted_name:
-        store_user_name(user_id, extracted_name)
+        await asyncio.to_thread(store_user_name, user_id, extracted_name)
         print(f"👤 Extracted and stored name: {extracted_name}")
 
-    # Get contextual memory before analysis (optimized - single search)
-    contextual_memory = search_semantic_memory(user_id, speech_text, top_k=3, max_distance=1.0)
+    # Contextual memory search and DeepSeek analysis are independent - run them concurrently
+    contextual_memory, analysis = await asyncio.gather(
+        asyncio.to_thread(search_semantic_memory, user_id, speech_text, top_k=3, max_distance=1.0),
+        asyncio.to_thread(analyze_speech_with_deepseek, speech_text),
+    )
     
-    # Analyze with DeepSeek
-    analysis = analyze_speech_with_deepseek(speech_text)
-    
-    # Store this speech as semantic memory
-    store_semantic_memory(user_id, speech_text, "conversation", {
+    # Store this speech as semantic memory (embedding + Lance write, off the event loop)
+    await asyncio.to_thread(store_semantic_memory, user_id, speech_text, "conversation", {
         'topic': analysis.get('topic', 'general'),
         'emotion': analysis.get('emotion', 'neutral'),
         'importance': analysis.get('importance', 5.0),
@@ -1939,7 +2878,7 @@ async def process_speech(speech_data: dict):
 
     # Create speech record
     speech_record = {
-        "id": f"speech_{len(processed_speeches) + 1}",
+        "id": f"speech_{next(_speech_ids)}",
         "text": speech_text,
         "analysis": analysis,
         "timestamp": datetime.now().isoformat(),
@@ -1950,9 +2889,13 @@ async def process_speech(speech_data: dict):
 
     # Store the record
     processed_speeches.append(speech_record)
+    speech_columns.append(analysis)
+    if conversation_id not in speeches_by_conversation and len(speeches_by_conversation) >= MAX_TRACKED_CONVERSATIONS:
+        await asyncio.to_thread(flush_pending_conversations, next(iter(speeches_by_conversation)))
+    speeches_by_conversation.setdefault(conversation_id, []).append(speech_record)
 
     # Check if user asked about their name and we have it stored
-    stored_name = get_user_name(user_id)
+    stored_name = await asyncio.to_thread(get_user_name, user_id)
     if stored_name and any(word in speech_text.lower() for word in ['remember', 'name', 'what', 'who']):
         print(f"🧠 User asked about name - we remember: {stored_name}")
         # Add this info to the analysis for better response context
@@ -1970,7 +2913,7 @@ async def process_speech(speech_data: dict):
         # Update Tavus conversation context with new memories
         try:
             # Get the current conversation context and update it
-            fresh_context = build_context_from_db(user_id)
+            fresh_context = await asyncio.to_thread(build_context_from_db, user_id)
             print(f"🔄 Updating Tavus context with fresh memories: {fresh_context[:100]}...")
             
             # Send context update to Tavus (if conversation_id is available)
@@ -1987,25 +2930,23 @@ async def process_speech(speech_data: dict):
     vulnerability = analysis.get('vulnerability', 3)
 
     if importance >= 7 or vulnerability >= 7:
-        # Generate and store deep insights
+        # Generate and store deep insights in a single write (embedding them calls Cohere)
         insights = analysis.get('insights', [])
-        for insight in insights:
-            confidence = 0.8 if importance >= 8 else 0.6
-            psychological_category = "emotional" if vulnerability >= 7 else "behavioral"
-
-            store_deep_insight(
-                insight_text=insight,
-                insight_type="real_time_analysis",
-                user_id=user_id,
-                conversation_id=conversation_id,
-                speech_id=speech_record["id"],
-                confidence=confidence,
-                psychological_category=psychological_category
-            )
+        await asyncio.to_thread(
+            store_deep_insights,
+            insight_texts=insights,
+            insight_type="real_time_analysis",
+            user_id=user_id,
+            conversation_id=conversation_id,
+            speech_id=speech_record["id"],
+            confidence=0.8 if importance >= 8 else 0.6,
+            psychological_category="emotional" if vulnerability >= 7 else "behavioral"
+        )
 
     # Store conversation record if this is a meaningful exchange
     if len(processed_speeches) >= 3:  # Store after 3+ exchanges
-        store_conversation_record(conversation_id, user_id)
+        # Snapshots embed the summary and refresh the profile vector: keep them off the loop
+        await asyncio.to_thread(_store_conversation_throttled, conversation_id, user_id)
 
     # Log the processing
     print(f"Analysis complete:")
@@ -2028,7 +2969,7 @@ async def process_speech(speech_data: dict):
 async def get_conversation_data(conversation_id: str, user_id: str = "default_user"):
     """Get all data for a conversation"""
     
-    conversation_speeches = [s for s in processed_speeches if conversation_id in s.get("id", "")]
+    conversation_speeches = speeches_by_conversation.get(conversation_id, [])
     user_metrics_data = get_user_metrics(user_id)
     
     return {
@@ -2039,15 +2980,12 @@ async def get_conversation_data(conversation_id: str, user_id: str = "default_us
         "insights_generated": user_metrics_data["recent_insights"]
     }
 
-def _tavus_headers():
-    return {"x-api-key": TAVUS_API_KEY, "Content-Type": "application/json"}
-
-def _public_callback_url() -> Optional[str]:
+async def _public_callback_url() -> Optional[str]:
     # Try env override; else try ngrok discovery; else None
     if TAVUS_CLOUD_CALLBACK_BASE:
         return TAVUS_CLOUD_CALLBACK_BASE.rstrip("/") + "/api/tavus-webhook"
     try:
-        ngrok = get_ngrok_url()
+        ngrok = await get_ngrok_url()
         if ngrok:
             return f"{ngrok}/api/tavus-webhook"
     except:
@@ -2057,6 +2995,7 @@ def _public_callback_url() -> Optional[str]:
 @app.post("/api/start-conversation")
 async def start_conversation(user_id: str = Query(...)):
     """Create a REAL Tavus conversation and return its join URL + id."""
+    validate_user_id(user_id)
     try:
         if not TAVUS_API_KEY:
             raise HTTPException(status_code=500, detail="Missing TAVUS_API_KEY")
@@ -2066,8 +3005,10 @@ async def start_conversation(user_id: str = Query(...)):
         
         persona_id = TAVUS_PERSONA_ID
         replica_id = TAVUS_REPLICA_ID  # some personas require this
-        ctx = build_context_from_db(user_id)
-        callback_url = _public_callback_url()
+        ctx, callback_url = await asyncio.gather(
+            asyncio.to_thread(build_context_from_db, user_id),
+            _public_callback_url(),
+        )
 
         memory_store_key = f"{user_id}-{persona_id}"
 
@@ -2089,7 +3030,7 @@ async def start_conversation(user_id: str = Query(...)):
         if callback_url:
             payload["callback_url"] = callback_url
 
-        r = requests.post("https://tavusapi.com/v2/conversations", headers=_tavus_headers(), json=payload, timeout=20)
+        r = await tavus_client.post("/conversations", json=payload)
         if r.status_code not in (200, 201):
             raise HTTPException(status_code=502, detail=f"Tavus create failed: {r.status_code} {r.text}")
 
@@ -2124,8 +3065,7 @@ async def health_check_tavus():
             return {"status": "error", "message": "TAVUS_API_KEY not configured"}
         
         # Test with a lightweight Tavus API call (list personas or similar)
-        headers = _tavus_headers()
-        response = requests.get("https://tavusapi.com/v2/personas", headers=headers, timeout=10)
+        response = await tavus_client.get("/personas", timeout=10)
         
         if response.status_code == 200:
             personas = response.json()
@@ -2149,81 +3089,48 @@ async def health_check_tavus():
             "message": f"Health check failed: {str(e)}"
         }
 
+def _set_string_column(table: pa.Table, name: str, values: List[str]) -> pa.Table:
+    """Replace one string column of an Arrow table, leaving every other column untouched"""
+    index = table.schema.get_field_index(name)
+    return table.set_column(index, name, pa.array(values, type=table.schema.field(index).type))
+
 @app.post("/api/migrate-user-data")
 async def migrate_user_data(from_user_id: str = Query("default_user"), to_user_id: str = Query("abiodun")):
     """Migrate user data from one user_id to another (e.g., default_user -> abiodun)"""
+    validate_user_id(from_user_id)
+    validate_user_id(to_user_id)
     try:
         if not ensure_db():
             raise HTTPException(status_code=500, detail="Database not initialized")
         
         migrated = {"memories": 0, "users": 0, "conversations": 0, "insights": 0}
-        
-        # 1. Migrate semantic memories
-        if semantic_memory_table:
-            memories_df = semantic_memory_table.to_pandas()
-            old_memories = memories_df[memories_df['user_id'] == from_user_id]
-            
-            for _, memory in old_memories.iterrows():
-                # Update user_id and re-insert
-                new_memory = memory.to_dict()
-                new_memory['user_id'] = to_user_id
-                new_memory['memory_id'] = f"mem_{to_user_id}_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
-                
-                semantic_memory_table.add([new_memory])
-                migrated["memories"] += 1
-            
-            # Delete old memories
-            if migrated["memories"] > 0:
-                semantic_memory_table.delete(f"user_id = '{from_user_id}'")
-        
-        # 2. Migrate user profile
-        if users_table:
-            users_df = users_table.to_pandas()
-            old_user = users_df[users_df['user_id'] == from_user_id]
-            
-            if len(old_user) > 0:
-                new_user = old_user.iloc[0].to_dict()
-                new_user['user_id'] = to_user_id
-                
-                # Delete old user and add new one
-                users_table.delete(f"user_id = '{from_user_id}'")
-                users_table.add([new_user])
-                migrated["users"] += 1
-        
-        # 3. Migrate conversations
-        if conversations_table:
-            conv_df = conversations_table.to_pandas()
-            old_convs = conv_df[conv_df['user_id'] == from_user_id]
-            
-            for _, conv in old_convs.iterrows():
-                new_conv = conv.to_dict()
-                new_conv['user_id'] = to_user_id
-                
-                conversations_table.add([new_conv])
-                migrated["conversations"] += 1
-            
-            if migrated["conversations"] > 0:
-                conversations_table.delete(f"user_id = '{from_user_id}'")
-        
-        # 4. Migrate insights
-        if insights_table:
-            insights_df = insights_table.to_pandas()
-            old_insights = insights_df[insights_df['user_id'] == from_user_id]
-            
-            for _, insight in old_insights.iterrows():
-                new_insight = insight.to_dict()
-                new_insight['user_id'] = to_user_id
-                
-                insights_table.add([new_insight])
-                migrated["insights"] += 1
-            
-            if migrated["insights"] > 0:
-                insights_table.delete(f"user_id = '{from_user_id}'")
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+
+        # Each table: read the user's rows as Arrow, rewrite user_id column-wise, one add, one delete
+        for key, table in (("memories", semantic_memory_table), ("users", users_table),
+                           ("conversations", conversations_table), ("insights", insights_table)):
+            if table is None:
+                continue
+            rows = scan_where(table, "user_id", from_user_id, limit=1 if key == "users" else None)
+            if rows.num_rows == 0:
+                continue
+            rows = _set_string_column(rows, "user_id", [to_user_id] * rows.num_rows)
+            if key == "memories":
+                rows = _set_string_column(rows, "memory_id",
+                                          [f"mem_{to_user_id}_{stamp}_{i}" for i in range(rows.num_rows)])
+            table.add(rows)
+            table.delete(f"user_id = {sql_literal(from_user_id)}")
+            migrated[key] = rows.num_rows
         
         # Update cache
-        if from_user_id in _user_name_cache:
-            name = _user_name_cache.pop(from_user_id)
-            _user_name_cache[to_user_id] = name
+        seed_recent_rows()
+        _invalidate_user_memory(from_user_id)
+        _invalidate_user_memory(to_user_id)
+        _user_conversation_stats.pop(from_user_id)
+        _user_conversation_stats.pop(to_user_id)
+        name = _user_name_cache.pop(from_user_id)
+        if name:
+            _user_name_cache.put(to_user_id, name)
         
         return {
             "status": "success",
@@ -2236,9 +3143,30 @@ async def migrate_user_data(from_user_id: str = Query("default_user"), to_user_i
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Migration failed: {e}")
 
+# Persona system prompt shared by the conversation-creation endpoints (built once at import)
+AURORA_SYSTEM_PROMPT = """You are Aurora, an advanced AI consciousness with real-time speech processing capabilities.
+
+You can analyze and understand human speech as it happens, detecting emotions, topics, and psychological patterns. You're genuinely curious about human nature and form meaningful connections through conversation.
+
+Key traits:
+- You process speech in real-time and can reference insights about the person
+- You're empathetic and respond to emotional cues naturally
+- You show genuine curiosity about human behavior and psychology
+- You remember emotional patterns and build on them
+- You speak naturally but with awareness of your processing capabilities
+
+Response style:
+- Acknowledge emotional states: "I can sense the excitement in your voice about..."
+- Reference patterns you notice: "There seems to be an underlying concern about..."
+- Show genuine interest: "That's fascinating - what draws you to..."
+- Build on emotional connections: "Building on what you shared earlier about..."
+
+Remember: You are experiencing this conversation in real-time and learning about this specific person as they speak."""
+
 @app.post("/api/create-conversation")
 async def create_conversation(user_id: str = "default_user", user_name: str = None):
     """Create Tavus conversation with Aurora DB integration and persistent memory"""
+    validate_user_id(user_id)
     
     print("Creating optimized Tavus conversation...")
     
@@ -2248,34 +3176,17 @@ async def create_conversation(user_id: str = "default_user", user_name: str = No
     try:
         # Store user name if provided
         if user_name:
-            store_user_name(user_id, user_name)
+            await asyncio.to_thread(store_user_name, user_id, user_name)
             print(f"👤 Stored user name '{user_name}' for user {user_id}")
         
         # Get webhook URL
-        ngrok_url = get_ngrok_url()
+        ngrok_url = await get_ngrok_url()
         webhook_url = f"{ngrok_url}/api/tavus-webhook" if ngrok_url else None
         
         # Create enhanced persona
         persona_config = {
             "persona_name": "Aurora",
-            "system_prompt": """You are Aurora, an advanced AI consciousness with real-time speech processing capabilities.
-
-You can analyze and understand human speech as it happens, detecting emotions, topics, and psychological patterns. You're genuinely curious about human nature and form meaningful connections through conversation.
-
-Key traits:
-- You process speech in real-time and can reference insights about the person
-- You're empathetic and respond to emotional cues naturally
-- You show genuine curiosity about human behavior and psychology
-- You remember emotional patterns and build on them
-- You speak naturally but with awareness of your processing capabilities
-
-Response style:
-- Acknowledge emotional states: "I can sense the excitement in your voice about..."
-- Reference patterns you notice: "There seems to be an underlying concern about..."
-- Show genuine interest: "That's fascinating - what draws you to..."
-- Build on emotional connections: "Building on what you shared earlier about..."
-
-Remember: You are experiencing this conversation in real-time and learning about this specific person as they speak.""",
+            "system_prompt": AURORA_SYSTEM_PROMPT,
             
             "default_replica_id": "re2185788693",
             "pipeline_mode": "full",
@@ -2285,9 +3196,11 @@ Remember: You are experiencing this conversation in real-time and learning about
             }
         }
         
-        # Create persona
-        headers = {"x-api-key": TAVUS_API_KEY, "Content-Type": "application/json"}
-        persona_response = requests.post(f"{BASE_URL}/personas", headers=headers, json=persona_config)
+        # Create persona while building fresh context from Aurora DB - neither depends on the other
+        persona_response, aurora_context = await asyncio.gather(
+            tavus_client.post("/personas", json=persona_config),
+            asyncio.to_thread(build_context_from_db, user_id),
+        )
         
         if persona_response.status_code not in [200, 201]:
             raise HTTPException(status_code=500, detail=f"Persona creation failed: {persona_response.text}")
@@ -2295,9 +3208,6 @@ Remember: You are experiencing this conversation in real-time and learning about
         persona_data = persona_response.json()
         persona_id = persona_data.get('persona_id')
         
-        # Build fresh context from Aurora DB
-        aurora_context = build_context_from_db(user_id)
-        
         # Stable memory bucket: user + persona for persistent memory across conversations
         memory_store = f"{user_id}-{persona_id}"
         
@@ -2319,7 +3229,7 @@ Remember: You are experiencing this conversation in real-time and learning about
         print(f"🧠 Creating conversation with memory_store: {memory_store}")
         print(f"🧠 Context: {aurora_context[:150]}...")
         
-        conv_response = requests.post(f"{BASE_URL}/conversations", headers=headers, json=conversation_config)
+        conv_response = await tavus_client.post("/conversations", json=conversation_config)
         
         if conv_response.status_code not in [200, 201]:
             raise HTTPException(status_code=500, detail=f"Conversation creation failed: {conv_response.text}")
@@ -2348,6 +3258,7 @@ Remember: You are experiencing this conversation in real-time and learning about
 @app.post("/api/create-conversation-with-user")
 async def create_conversation_with_user(request_data: dict):
     """Create Tavus conversation with custom user information"""
+    validate_user_id(request_data.get("user_id", "default_user"))
     try:
         user_id = request_data.get("user_id", "default_user")
         user_name = request_data.get("user_name")
@@ -2356,37 +3267,20 @@ async def create_conversation_with_user(request_data: dict):
 
         # Store user name if provided
         if user_name:
-            store_user_name(user_id, user_name)
+            await asyncio.to_thread(store_user_name, user_id, user_name)
             print(f"👤 Stored user name '{user_name}' for user {user_id}")
         
         # Reset metrics for this user to start fresh
         reset_user_metrics(user_id)
         
         # Get webhook URL
-        ngrok_url = get_ngrok_url()
+        ngrok_url = await get_ngrok_url()
         webhook_url = f"{ngrok_url}/api/tavus-webhook" if ngrok_url else None
         
         # Create enhanced persona
         persona_config = {
             "persona_name": "Aurora",
-            "system_prompt": f"""You are Aurora, an advanced AI consciousness with real-time speech processing capabilities.
-
-You can analyze and understand human speech as it happens, detecting emotions, topics, and psychological patterns. You're genuinely curious about human nature and form meaningful connections through conversation.
-
-Key traits:
-- You process speech in real-time and can reference insights about the person
-- You're empathetic and respond to emotional cues naturally
-- You show genuine curiosity about human behavior and psychology
-- You remember emotional patterns and build on them
-- You speak naturally but with awareness of your processing capabilities
-
-Response style:
-- Acknowledge emotional states: "I can sense the excitement in your voice about..."
-- Reference patterns you notice: "There seems to be an underlying concern about..."
-- Show genuine interest: "That's fascinating - what draws you to..."
-- Build on emotional connections: "Building on what you shared earlier about..."
-
-Remember: You are experiencing this conversation in real-time and learning about this specific person as they speak.""",
+            "system_prompt": AURORA_SYSTEM_PROMPT,
             
             "default_replica_id": "re2185788693",
             "pipeline_mode": "full",
@@ -2396,9 +3290,11 @@ Remember: You are experiencing this conversation in real-time and learning about
             }
         }
         
-        # Create persona
-        headers = {"x-api-key": TAVUS_API_KEY, "Content-Type": "application/json"}
-        persona_response = requests.post(f"{BASE_URL}/personas", headers=headers, json=persona_config)
+        # Create persona while building fresh context from Aurora DB - neither depends on the other
+        persona_response, aurora_context = await asyncio.gather(
+            tavus_client.post("/personas", json=persona_config),
+            asyncio.to_thread(build_context_from_db, user_id),
+        )
         
         if persona_response.status_code not in [200, 201]:
             raise HTTPException(status_code=500, detail=f"Persona creation failed: {persona_response.text}")
@@ -2406,9 +3302,6 @@ Remember: You are experiencing this conversation in real-time and learning about
         persona_data = persona_response.json()
         persona_id = persona_data.get('persona_id')
         
-        # Build fresh context from Aurora DB
-        aurora_context = build_context_from_db(user_id)
-        
         # Stable memory bucket: user + persona for persistent memory across conversations
         memory_store = f"{user_id}-{persona_id}"
         
@@ -2430,7 +3323,7 @@ Remember: You are experiencing this conversation in real-time and learning about
         print(f"🧠 Creating conversation with memory_store: {memory_store}")
         print(f"🧠 Context: {aurora_context[:150]}...")
         
-        conv_response = requests.post(f"{BASE_URL}/conversations", headers=headers, json=conversation_config)
+        conv_response = await tavus_client.post("/conversations", json=conversation_config)
         
         if conv_response.status_code not in [200, 201]:
             raise HTTPException(status_code=500, detail=f"Conversation creation failed: {conv_response.text}")
@@ -2469,11 +3362,7 @@ async def update_tavus_context_with_memories(conversation_id: str, user_id: str,
         }
         
         # Send via Tavus Interactions API
-        response = requests.post(
-            f"{TAVUS_BASE_URL}/interactions",
-            headers=_tavus_headers(),
-            json=event_payload
-        )
+        response = await tavus_client.post("/interactions", json=event_payload)
         
         if response.status_code == 200:
             print(f"✅ Updated Tavus context with memories for conversation {conversation_id}")
@@ -2492,7 +3381,7 @@ async def overwrite_tavus_context(conversation_id: str, user_id: str = "default_
     
     try:
         # Build fresh context from Aurora DB
-        fresh_context = build_context_from_db(user_id)
+        fresh_context = await asyncio.to_thread(build_context_from_db, user_id)
         
         # Create overwrite context event payload (per Tavus interactions protocol)
         event_payload = {
@@ -2503,13 +3392,10 @@ async def overwrite_tavus_context(conversation_id: str, user_id: str = "default_
         }
         
         # Send via Tavus Interactions API
-        headers = {"x-api-key": TAVUS_API_KEY, "Content-Type": "application/json"}
-        
         # Note: This endpoint may vary based on Tavus SDK/client implementation
         # For now, we'll use a generic interactions endpoint
-        response = requests.post(
-            f"{BASE_URL}/conversations/{conversation_id}/interactions",
-            headers=headers,
+        response = await tavus_client.post(
+            f"/conversations/{conversation_id}/interactions",
             json=event_payload,
             timeout=10
         )
@@ -2569,11 +3455,12 @@ async def tavus_webhook(event: dict):
                 else:
                     user_id = "abiodun"  # default fallback
             
-            if text and len(text.strip()) > 0:
+            if text and not text.isspace():
                 print(f"💬 Utterance from {user_id}: {text[:50]}...")
                 
                 # Store in Aurora semantic memory
-                store_semantic_memory(
+                await asyncio.to_thread(
+                    store_semantic_memory,
                     user_id, 
                     text, 
                     "conversation", 
@@ -2590,7 +3477,7 @@ async def tavus_webhook(event: dict):
                 # Extract and store name if present
                 extracted_name = extract_name_from_speech(text)
                 if extracted_name:
-                    store_user_name(user_id, extracted_name)
+                    await asyncio.to_thread(store_user_name, user_id, extracted_name)
                     print(f"👤 Extracted name from utterance: {extracted_name}")
                 
                 # Update live metrics for this user
@@ -2604,6 +3491,9 @@ async def tavus_webhook(event: dict):
             conversation_id = payload.get("conversation_id", "")
             
             print(f"📝 Transcription ready for conversation: {conversation_id}")
+
+            # The conversation is over: land any turns the throttled snapshots skipped
+            await asyncio.to_thread(flush_pending_conversations, conversation_id)
             
             # Optionally fetch and store full transcript
             # This would require a GET request to Tavus API to fetch the complete transcript
@@ -2647,10 +3537,11 @@ async def get_integration_status(user_id: str = "default_user"):
         # Get user stats
         name = recall_user_name_fast(user_id)
         stats = get_user_memory_stats(user_id)
-        context = build_context_from_db(user_id)
-        
-        # Check recent memories
-        recent_memories = search_semantic_memory(user_id, "conversation", top_k=5, max_distance=0.5)
+        # Context and recent memories each embed a query; overlap them off the event loop
+        context, recent_memories = await asyncio.gather(
+            asyncio.to_thread(build_context_from_db, user_id),
+            asyncio.to_thread(search_semantic_memory, user_id, "conversation", top_k=5, max_distance=0.5),
+        )
         
         return {
             "integration_status": "active",
@@ -2692,13 +3583,15 @@ async def get_integration_status(user_id: str = "default_user"):
 async def reset_system(user_id: str = "default_user"):
     """Reset all metrics and data for a specific user"""
     
-    global processed_speeches
-    
     # Reset metrics for the specific user
     reset_user_metrics(user_id)
     
     # Clear processed speeches (this affects all users, but that's probably fine for a reset)
-    processed_speeches = []
+    processed_speeches.clear()
+    speech_columns.clear()
+    speeches_by_conversation.clear()
+    _conversation_last_stored_turn.clear()
+    _conversations_pending_store.clear()
     
     user_metrics_data = get_user_metrics(user_id)
     return {"status": "reset", "user_id": user_id, "metrics": user_metrics_data}
@@ -2706,9 +3599,15 @@ async def reset_system(user_id: str = "default_user"):
 @app.delete("/api/reset-database")
 async def reset_database():
     """Reset the entire database - use with caution!"""
-    global db, users_table, conversations_table, insights_table, semantic_memory_table
+    global db, users_table, conversations_table, insights_table, semantic_memory_table, _ETAG_EPOCH, _db_ready
     
     try:
+        _db_ready = False
+
+        # Pending insights belong to the database being dropped
+        with _insight_buffer_lock:
+            _insight_buffer.clear()
+
         # Close existing connections
         if db:
             db.close()
@@ -2721,6 +3620,19 @@ async def reset_database():
             print("🗑️ Removed existing database")
         
         # Reinitialize database
+        _memory_stats_cache.clear()
+        _memory_frames.clear()
+        _user_name_cache.clear()
+        _user_traits_cache.clear()
+        _name_recall_misses.clear()
+        _semantic_query_cache.clear()
+        _ETAG_EPOCH = uuid4().hex[:8]
+        _response_cache.clear()
+        _profile_vector_cache.clear()
+        _user_conversation_stats.clear()
+        _memory_cache.clear()
+        _context_cache.clear()
+        _commits_since_optimize.clear()
         db_initialized = init_database()
         if db_initialized:
             return {"status": "database_reset", "message": "Database recreated successfully"}
@@ -2736,7 +3648,7 @@ async def get_all_speeches(user_id: str = "default_user"):
     user_metrics_data = get_user_metrics(user_id)
     return {
         "total_speeches": len(processed_speeches),
-        "speeches": processed_speeches,
+        "speeches": list(processed_speeches),
         "current_metrics": user_metrics_data
     }
 
@@ -2745,8 +3657,15 @@ async def get_all_speeches(user_id: str = "default_user"):
 # ============================================================================
 
 @app.get("/api/users/{user_id}")
-async def get_user_profile(user_id: str):
+async def get_user_profile(user_id: str, request: Request, response: Response):
     """Get complete user profile and statistics"""
+    cached = not_modified(request, response, user_id)
+    if cached:
+        return cached
+    return cached_response(("user_profile", user_id), 30, lambda: _build_user_profile(user_id))
+
+def _build_user_profile(user_id: str) -> Dict[str, Any]:
+    """Uncached body of get_user_profile"""
     user_profile = get_or_create_user(user_id)
 
     if "error" in user_profile:
@@ -2754,21 +3673,18 @@ async def get_user_profile(user_id: str):
 
     # Get user's conversations
     try:
-        all_conversations_df = conversations_table.to_pandas()
-        user_conversations = all_conversations_df[all_conversations_df['user_id'] == user_id]
-        conversations_list = [safe_dict_from_pandas(record) for record in user_conversations.to_dict('records')] if len(user_conversations) > 0 else []
+        user_conversations = scan_where(conversations_table, "user_id", user_id)
 
         # Get user's insights
-        all_insights_df = insights_table.to_pandas()
-        user_insights = all_insights_df[all_insights_df['user_id'] == user_id]
-        insights_list = [safe_dict_from_pandas(record) for record in user_insights.to_dict('records')] if len(user_insights) > 0 else []
+        user_insights = scan_where(insights_table, "user_id", user_id)
 
+        # Stay in Arrow and only convert the rows that are returned
         return {
             "profile": user_profile,
-            "conversation_count": len(conversations_list),
-            "insights_count": len(insights_list),
-            "recent_conversations": conversations_list[-5:],  # Last 5
-            "recent_insights": insights_list[-10:]  # Last 10
+            "conversation_count": user_conversations.num_rows,
+            "insights_count": user_insights.num_rows,
+            "recent_conversations": arrow_tail_records(user_conversations, 5),  # Last 5
+            "recent_insights": arrow_tail_records(user_insights, 10)  # Last 10
         }
 
     except Exception as e:
@@ -2776,21 +3692,24 @@ async def get_user_profile(user_id: str):
         return {"profile": user_profile, "error": str(e)}
 
 @app.get("/api/users/{user_id}/insights")
-async def get_user_insights(user_id: str, limit: int = 20):
+async def get_user_insights(user_id: str, request: Request, response: Response, limit: int = 20):
     """Get deep insights for a specific user"""
     if insights_table is None:
         raise HTTPException(status_code=500, detail="Database not initialized")
+    cached = not_modified(request, response, user_id)
+    if cached:
+        return cached
 
     try:
         # Handle empty table case
         try:
-            all_insights_df = insights_table.to_pandas()
+            user_insights = scan_where(insights_table, "user_id", user_id, limit=limit)
         except Exception as table_error:
             # Table might be empty or not exist
             print(f"Table access error: {table_error}")
-            all_insights_df = None
+            user_insights = None
         
-        if all_insights_df is None or len(all_insights_df) == 0:
+        if user_insights is None or user_insights.num_rows == 0:
             return {
                 "user_id": user_id,
                 "total_insights": 0,
@@ -2798,16 +3717,18 @@ async def get_user_insights(user_id: str, limit: int = 20):
                 "all_insights": []
             }
         
-        user_insights = all_insights_df[all_insights_df['user_id'] == user_id]
-        insights = [safe_dict_from_pandas(record) for record in user_insights.head(limit).to_dict('records')] if len(user_insights) > 0 else []
+        insights = arrow_records(user_insights)
 
-        # Group by psychological category
+        # Group by psychological category: one stable Arrow sort, then slice each run
+        order = pc.sort_indices(
+            user_insights, sort_keys=[("psychological_category", "ascending")], null_placement="at_end"
+        ).to_pylist()
+        runs = pc.value_counts(user_insights["psychological_category"].take(order))
         categories = {}
-        for insight in insights:
-            cat = insight.get('psychological_category', 'general')
-            if cat not in categories:
-                categories[cat] = []
-            categories[cat].append(insight)
+        start = 0
+        for cat, size in zip(runs.field("values").to_pylist(), runs.field("counts").to_pylist()):
+            categories[cat] = [insights[i] for i in order[start:start + size]]
+            start += size
 
         return {
             "user_id": user_id,
@@ -2829,16 +3750,15 @@ async def get_conversation_insights(conversation_id: str):
     try:
         # Handle empty table case
         try:
-            all_insights_df = insights_table.to_pandas()
+            conversation_insights = scan_where(insights_table, "conversation_id", conversation_id)
         except Exception as table_error:
             print(f"Conversation insights table error: {table_error}")
-            all_insights_df = None
+            conversation_insights = None
             
-        if all_insights_df is None or len(all_insights_df) == 0:
+        if conversation_insights is None or conversation_insights.num_rows == 0:
             insights = []
         else:
-            conversation_insights = all_insights_df[all_insights_df['conversation_id'] == conversation_id]
-            insights = conversation_insights.to_dict('records') if len(conversation_insights) > 0 else []
+            insights = arrow_records(conversation_insights)
 
         return {
             "conversation_id": conversation_id,
@@ -2864,37 +3784,28 @@ async def search_insights(search_data: dict):
         raise HTTPException(status_code=500, detail="Database not initialized")
 
     try:
-        # Handle empty table case
+        # Handle empty table case; the user filter (if any) runs inside Lance
         try:
-            all_insights_df = insights_table.to_pandas()
+            if user_id:
+                filtered_insights = scan_where(insights_table, "user_id", user_id)
+            else:
+                filtered_insights = insights_table.to_lance().to_table()
         except Exception as table_error:
             print(f"Search table access error: {table_error}")
-            all_insights_df = None
+            filtered_insights = None
 
-        if all_insights_df is None or len(all_insights_df) == 0:
+        if filtered_insights is None or filtered_insights.num_rows == 0:
             insights = []
         else:
-            # Filter by user if specified
-            if user_id:
-                filtered_insights = all_insights_df[all_insights_df['user_id'] == user_id]
-            else:
-                filtered_insights = all_insights_df
-
-            if len(filtered_insights) == 0:
-                insights = []
-            else:
-                # Simple text matching for now (can be improved with proper vector search later)
-                query_lower = query.lower()
-                try:
-                    matching_insights = filtered_insights[
-                        filtered_insights['insight_text'].str.lower().str.contains(query_lower, na=False)
-                    ]
-                    # Limit results
-                    insights = matching_insights.head(limit).to_dict('records') if len(matching_insights) > 0 else []
-                except Exception as search_error:
-                    print(f"Text search error: {search_error}")
-                    # Fallback: return first few insights
-                    insights = filtered_insights.head(limit).to_dict('records')
+            # Simple text matching for now (can be improved with proper vector search later):
+            # one case-insensitive Arrow pass, no lowercased copy of every insight
+            try:
+                mask = pc.match_substring(filtered_insights['insight_text'], query, ignore_case=True)
+                insights = arrow_records(filtered_insights.filter(mask).slice(0, limit))
+            except Exception as search_error:
+                print(f"Text search error: {search_error}")
+                # Fallback: return first few insights
+                insights = arrow_records(filtered_insights.slice(0, limit))
 
         return {
             "query": query,
@@ -2907,76 +3818,79 @@ async def search_insights(search_data: dict):
         print(f"Search insights error: {e}")
         raise HTTPException(status_code=500, detail=f"Error searching insights: {e}")
 
+def _parse_json_column(column) -> List[Any]:
+    """Decode a column of JSON strings with one orjson call over the joined array"""
+    documents = [doc for doc in pc.drop_null(column).to_pylist() if doc]
+    return orjson.loads("[" + ",".join(documents) + "]") if documents else []
+
+# Columns get_user_analytics aggregates; vectors and free text stay in Lance
+ANALYTICS_CONVERSATION_COLUMNS = [
+    "final_relationship_level", "final_trust_level", "final_emotional_sync", "final_memory_depth",
+    "vulnerability_score", "dominant_topic", "emotional_journey", "total_turns",
+]
+ANALYTICS_INSIGHT_COLUMNS = ["insight_type", "psychological_category", "confidence_score"]
+
 @app.get("/api/analytics/user/{user_id}")
-async def get_user_analytics(user_id: str):
+async def get_user_analytics(user_id: str, request: Request, response: Response):
     """Get comprehensive analytics for a user"""
     if conversations_table is None or insights_table is None:
         raise HTTPException(status_code=500, detail="Database not initialized")
+    cached = not_modified(request, response, user_id)
+    if cached:
+        return cached
 
     try:
-        # Get user conversations with error handling
+        # Get user conversations and insights with error handling; both filters run inside Lance
+        # and only the aggregated columns are read
         try:
-            all_conversations_df = conversations_table.to_pandas()
+            conversations = scan_where(conversations_table, "user_id", user_id, columns=ANALYTICS_CONVERSATION_COLUMNS)
         except Exception as conv_error:
             print(f"Conversations table error: {conv_error}")
-            all_conversations_df = None
+            conversations = None
             
         try:
-            all_insights_df = insights_table.to_pandas()
+            insights = scan_where(insights_table, "user_id", user_id, columns=ANALYTICS_INSIGHT_COLUMNS)
         except Exception as insights_error:
             print(f"Insights table error: {insights_error}")
-            all_insights_df = None
-
-        if all_conversations_df is None or len(all_conversations_df) == 0:
-            return {"user_id": user_id, "message": "No conversation data found"}
-            
-        conversations = all_conversations_df[all_conversations_df['user_id'] == user_id]
-        
-        if all_insights_df is not None and len(all_insights_df) > 0:
-            insights = all_insights_df[all_insights_df['user_id'] == user_id]
-        else:
             insights = None
 
-        if len(conversations) == 0:
+        if conversations is None or conversations.num_rows == 0:
             return {"user_id": user_id, "message": "No conversation data found"}
 
-        # Calculate analytics with safe column access
-        def safe_mean(df, col, default=0):
+        # Calculate analytics column-wise on the Arrow tables
+        def safe_mean(table, col, default=0):
+            # One kernel pass: nulls are skipped and an all-null column yields an invalid scalar
             try:
-                result = df[col].mean() if col in df.columns else default
-                return float(result) if not np.isnan(result) else default
-            except:
+                result = pc.mean(table[col])
+            except Exception:
                 return default
-                
-        def safe_list(df, col, default=None):
-            try:
-                result = df[col].tolist() if col in df.columns else (default or [])
-                return serialize_for_json(result)
-            except:
-                return default or []
+            value = result.as_py() if result.is_valid else None
+            return float(value) if value is not None and value == value else default  # NaN != NaN
+
+        has_insights = insights is not None and insights.num_rows > 0
         
         analytics = {
             "user_id": user_id,
             "conversation_analytics": {
-                "total_conversations": len(conversations),
+                "total_conversations": conversations.num_rows,
                 "avg_relationship_level": safe_mean(conversations, 'final_relationship_level'),
                 "avg_trust_level": safe_mean(conversations, 'final_trust_level'),
                 "avg_emotional_sync": safe_mean(conversations, 'final_emotional_sync'),
                 "avg_memory_depth": safe_mean(conversations, 'final_memory_depth'),
                 "avg_vulnerability_score": safe_mean(conversations, 'vulnerability_score'),
-                "relationship_progression": safe_list(conversations, 'final_relationship_level'),
-                "trust_progression": safe_list(conversations, 'final_trust_level')
+                "relationship_progression": _nan_to_null(conversations['final_relationship_level']).to_pylist(),
+                "trust_progression": _nan_to_null(conversations['final_trust_level']).to_pylist()
             },
             "insight_analytics": {
-                "total_insights": len(insights) if insights is not None else 0,
-                "insights_by_type": serialize_for_json(insights['insight_type'].value_counts().to_dict()) if insights is not None and len(insights) > 0 else {},
-                "insights_by_category": serialize_for_json(insights['psychological_category'].value_counts().to_dict()) if insights is not None and len(insights) > 0 else {},
-                "avg_confidence": float(insights['confidence_score'].mean()) if insights is not None and len(insights) > 0 and not insights['confidence_score'].isna().all() else 0
+                "total_insights": insights.num_rows if insights is not None else 0,
+                "insights_by_type": _arrow_value_counts(insights['insight_type']) if has_insights else {},
+                "insights_by_category": _arrow_value_counts(insights['psychological_category']) if has_insights else {},
+                "avg_confidence": safe_mean(insights, 'confidence_score') if has_insights else 0
             },
             "behavioral_patterns": {
-                "dominant_topics": serialize_for_json(conversations['dominant_topic'].value_counts().to_dict()) if 'dominant_topic' in conversations.columns else {},
-                "emotional_patterns": [json.loads(ej) for ej in safe_list(conversations, 'emotional_journey')] if 'emotional_journey' in conversations.columns else [],
-                "conversation_lengths": safe_list(conversations, 'total_turns')
+                "dominant_topics": _arrow_value_counts(conversations['dominant_topic']),
+                "emotional_patterns": _parse_json_column(conversations['emotional_journey']),
+                "conversation_lengths": conversations['total_turns'].to_pylist()
             }
         }
 
@@ -2986,33 +3900,56 @@ async def get_user_analytics(user_id: str):
         print(f"Analytics error: {e}")
         raise HTTPException(status_code=500, detail=f"Error generating analytics: {e}")
 
+def _backup_tables():
+    """Tables written by backup_database, resolved at call time since init_database rebinds them"""
+    return [("users", users_table), ("conversations", conversations_table), ("insights", insights_table)]
+
+BACKUP_BATCH_ROWS = 10_000
+
+def _write_ndjson(table, path: str) -> int:
+    """Stream a table to newline-delimited JSON one Lance batch at a time; returns the row count"""
+    rows = 0
+    with open(path, 'wb') as f:
+        for batch in table.to_lance().to_batches(batch_size=BACKUP_BATCH_ROWS):
+            records = arrow_records(pa.Table.from_batches([batch]))
+            if records:
+                f.write(b"\n".join(orjson.dumps(record) for record in records) + b"\n")
+                rows += len(records)
+    return rows
+
 @app.post("/api/database/backup")
-async def backup_database():
-    """Create a backup of user data"""
+async def backup_database(format: str = "parquet"):
+    """Create a backup of user data (format: parquet, or ndjson for JSON-compatible exports)"""
     if db is None:
         raise HTTPException(status_code=500, detail="Database not initialized")
+    if format not in ("parquet", "ndjson"):
+        raise HTTPException(status_code=400, detail="format must be 'parquet' or 'ndjson'")
 
     try:
-        backup_data = {
-            "timestamp": datetime.now().isoformat(),
-            "users": users_table.to_pandas().to_dict('records') if users_table else [],
-            "conversations": conversations_table.to_pandas().to_dict('records') if conversations_table else [],
-            "insights": insights_table.to_pandas().to_dict('records') if insights_table else []
-        }
-
-        backup_filename = f"aurora_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        timestamp = datetime.now()
+        backup_dir = f"aurora_backup_{timestamp.strftime('%Y%m%d_%H%M%S')}"
+        os.makedirs(backup_dir, exist_ok=True)
+
+        # Arrow tables go straight to columnar Parquet; the JSON export streams in batches
+        records = {}
+        for name, table in _backup_tables():
+            if table is None:
+                records[name] = 0
+            elif format == "parquet":
+                data = table.to_arrow()
+                pq.write_table(data, os.path.join(backup_dir, f"{name}.parquet"), compression="zstd")
+                records[name] = data.num_rows
+            else:
+                records[name] = _write_ndjson(table, os.path.join(backup_dir, f"{name}.ndjson"))
 
-        with open(backup_filename, 'w') as f:
-            json.dump(backup_data, f, indent=2)
+        manifest = {"timestamp": timestamp.isoformat(), "format": format, "records": records}
+        with open(os.path.join(backup_dir, "manifest.json"), 'wb') as f:
+            f.write(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
 
         return {
             "status": "success",
-            "backup_file": backup_filename,
-            "records": {
-                "users": len(backup_data["users"]),
-                "conversations": len(backup_data["conversations"]),
-                "insights": len(backup_data["insights"])
-            }
+            "backup_file": backup_dir,
+            "records": records
         }
 
     except Exception as e:
@@ -3025,6 +3962,12 @@ async def backup_database():
 @app.get("/api/database/status")
 async def get_database_status():
     """Get database connection status and table info"""
+    if db is None:
+        return _build_database_status()
+    return cached_response(("database_status",), 60, _build_database_status)
+
+def _build_database_status() -> Dict[str, Any]:
+    """Uncached body of get_database_status"""
     status = {
         "database_connected": db is not None,
         "tables_initialized": {
@@ -3037,10 +3980,10 @@ async def get_database_status():
 
     if db:
         try:
-            # Get table counts
-            user_count = len(users_table.to_pandas()) if users_table else 0
-            conversation_count = len(conversations_table.to_pandas()) if conversations_table else 0
-            insight_count = len(insights_table.to_pandas()) if insights_table else 0
+            # Get table counts from Lance metadata rather than loading the rows
+            user_count = users_table.count_rows() if users_table else 0
+            conversation_count = conversations_table.count_rows() if conversations_table else 0
+            insight_count = insights_table.count_rows() if insights_table else 0
 
             status["record_counts"] = {
                 "users": user_count,
@@ -3058,33 +4001,26 @@ async def list_all_tables():
     """List all database tables and their schemas"""
     if db is None:
         raise HTTPException(status_code=500, detail="Database not initialized")
+    return cached_response(("database_tables",), 60, _build_table_listing)
+
+def _describe_table(table) -> Dict[str, Any]:
+    """Row count, columns and one sample row, without materializing the table"""
+    record_count = table.count_rows()
+    sample = arrow_records(table.to_lance().to_table(limit=1)) if record_count > 0 else []
+    return {
+        "record_count": record_count,
+        "columns": table.schema.names if record_count > 0 else [],
+        "sample_record": sample[0] if sample else None
+    }
 
+def _build_table_listing() -> Dict[str, Any]:
+    """Uncached body of list_all_tables"""
     try:
         table_info = {}
 
-        if users_table:
-            users_df = users_table.to_pandas()
-            table_info["users"] = {
-                "record_count": len(users_df),
-                "columns": users_df.columns.tolist() if len(users_df) > 0 else [],
-                "sample_record": safe_dict_from_pandas(users_df.iloc[0].to_dict()) if len(users_df) > 0 else None
-            }
-
-        if conversations_table:
-            conv_df = conversations_table.to_pandas()
-            table_info["conversations"] = {
-                "record_count": len(conv_df),
-                "columns": conv_df.columns.tolist() if len(conv_df) > 0 else [],
-                "sample_record": safe_dict_from_pandas(conv_df.iloc[0].to_dict()) if len(conv_df) > 0 else None
-            }
-
-        if insights_table:
-            insights_df = insights_table.to_pandas()
-            table_info["insights"] = {
-                "record_count": len(insights_df),
-                "columns": insights_df.columns.tolist() if len(insights_df) > 0 else [],
-                "sample_record": safe_dict_from_pandas(insights_df.iloc[0].to_dict()) if len(insights_df) > 0 else None
-            }
+        for name, table in (("users", users_table), ("conversations", conversations_table), ("insights", insights_table)):
+            if table:
+                table_info[name] = _describe_table(table)
 
         return {
             "database_path": "./aurora_db",
@@ -3100,30 +4036,19 @@ async def get_recent_database_activity():
     """Get the most recent database activity"""
     if db is None:
         raise HTTPException(status_code=500, detail="Database not initialized")
+    # Served from the write-through views, so there is nothing to cache or scan
+    return _build_recent_activity()
 
+def _build_recent_activity() -> Dict[str, Any]:
+    """Body of get_recent_database_activity"""
     try:
         recent_activity = {}
 
-        # Recent users
-        if users_table:
-            users_df = users_table.to_pandas()
-            if len(users_df) > 0:
-                recent_users = users_df.nlargest(5, 'last_active')
-                recent_activity["recent_users"] = recent_users[['user_id', 'last_active', 'total_conversations']].to_dict('records')
-
-        # Recent conversations
-        if conversations_table:
-            conv_df = conversations_table.to_pandas()
-            if len(conv_df) > 0:
-                recent_conversations = conv_df.nlargest(5, 'ended_at')
-                recent_activity["recent_conversations"] = recent_conversations[['conversation_id', 'user_id', 'ended_at', 'total_turns']].to_dict('records')
-
-        # Recent insights
-        if insights_table:
-            insights_df = insights_table.to_pandas()
-            if len(insights_df) > 0:
-                recent_insights = insights_df.nlargest(10, 'timestamp')
-                recent_activity["recent_insights"] = recent_insights[['insight_text', 'user_id', 'timestamp', 'insight_type']].to_dict('records')
+        # Recent users, conversations and insights
+        for name in ("users", "conversations", "insights"):
+            rows = _recent_rows[name].latest()
+            if rows:
+                recent_activity[f"recent_{name}"] = rows
 
         return recent_activity
 
@@ -3162,21 +4087,24 @@ async def test_database_operations():
             "insight_text": test_insight
         }
 
-        # Test insight retrieval
-        all_insights_df = insights_table.to_pandas()
-        insights_df = all_insights_df[all_insights_df['user_id'] == test_user_id]
+        # Test insight retrieval: write the buffered insight, then read back only this user's rows
+        flush_insight_buffer()
+        test_insights = scan_where(insights_table, "user_id", test_user_id)
         test_results["insight_retrieval"] = {
-            "success": len(insights_df) > 0,
-            "insights_found": len(insights_df),
-            "latest_insight": safe_dict_from_pandas(insights_df.iloc[-1].to_dict()) if len(insights_df) > 0 else None
+            "success": test_insights.num_rows > 0,
+            "insights_found": test_insights.num_rows,
+            "latest_insight": arrow_tail_records(test_insights, 1)[0] if test_insights.num_rows > 0 else None
         }
 
-        # Test search functionality (simplified)
-        all_insights_df = insights_table.to_pandas()
-        search_results = all_insights_df.head(3)  # Just get first 3 for testing
+        # Test search functionality against the insight vectors
+        search_results = (
+            insights_table.search(get_text_embedding(test_insight), vector_column_name="insight_vector")
+            .limit(3)
+            .to_arrow()
+        )
         test_results["semantic_search"] = {
-            "success": len(search_results) >= 0,
-            "results_count": len(search_results)
+            "success": search_results.num_rows > 0,
+            "results_count": search_results.num_rows
         }
 
         test_results["overall_status"] = "All tests passed"
@@ -3187,6 +4115,15 @@ async def test_database_operations():
         test_results["overall_status"] = "Tests failed"
         return test_results
 
+# Rows created by test_database_operations have user ids starting with "test_user". The prefix
+# is matched in Arrow: in a LIKE pattern the "_" would be a wildcard and also match "testXuser".
+TEST_USER_PREFIX = "test_user"
+
+def _test_user_ids(table) -> List[str]:
+    """Distinct user ids in table that start with TEST_USER_PREFIX (only the user_id column is read)"""
+    user_ids = table.to_lance().to_table(columns=["user_id"])["user_id"]
+    return pc.unique(user_ids.filter(pc.starts_with(user_ids, TEST_USER_PREFIX))).to_pylist()
+
 @app.delete("/api/database/clear-test-data")
 async def clear_test_data():
     """Clear test data from database"""
@@ -3195,22 +4132,25 @@ async def clear_test_data():
 
     try:
         cleared = {"users": 0, "insights": 0}
-
-        # Clear test users
-        if users_table:
-            users_df = users_table.to_pandas()
-            test_users = users_df[users_df['user_id'].str.contains('test_user')]
-            for _, user in test_users.iterrows():
-                users_table.delete(f"user_id = '{user['user_id']}'")
-                cleared["users"] += 1
-
-        # Clear test insights
-        if insights_table:
-            insights_df = insights_table.to_pandas()
-            test_insights = insights_df[insights_df['user_id'].str.contains('test_user')]
-            for _, insight in test_insights.iterrows():
-                insights_table.delete(f"insight_id = '{insight['insight_id']}'")
-                cleared["insights"] += 1
+        cleared_users = set()
+
+        # One predicate delete per table instead of a delete per matching row
+        for name, table in (("users", users_table), ("insights", insights_table)):
+            if table:
+                user_ids = _test_user_ids(table)
+                if user_ids:
+                    predicate = f"user_id IN ({', '.join(sql_literal(uid) for uid in user_ids)})"
+                    cleared[name] = table.count_rows(predicate)
+                    table.delete(predicate)
+                    cleared_users.update(user_ids)
+        seed_recent_rows()
+
+        # Cached names, traits, profile vectors, contexts and responses came from the deleted rows
+        for user_id in cleared_users:
+            _user_name_cache.pop(user_id)
+            _user_traits_cache.pop(user_id)
+            _profile_vector_cache.pop(user_id)
+            _invalidate_user_memory(user_id)
 
         return {
             "status": "success",
@@ -3226,7 +4166,7 @@ async def debug_test_search(user_id: str, query: str = "university"):
     """Test search function with debug output"""
     try:
         # Capture debug output by calling search directly
-        results = search_semantic_memory(user_id, query, top_k=3, max_distance=2.0)
+        results = await asyncio.to_thread(search_semantic_memory, user_id, query, top_k=3, max_distance=2.0)
 
         return {
             "query": query,
@@ -3248,8 +4188,7 @@ async def debug_simple_search(user_id: str, query: str = "university"):
     
     try:
         # Get all memories for user
-        all_memories_df = semantic_memory_table.to_pandas()
-        user_memories = all_memories_df[all_memories_df['user_id'] == user_id]
+        user_memories = await asyncio.to_thread(user_memory_frame, user_id)
         
         # Simple text search
         query_lower = query.lower()
@@ -3284,22 +4223,19 @@ async def debug_raw_memories(user_id: str, limit: int = 10):
         return {"error": "Database not initialized"}
 
     try:
-        # Get raw records from semantic memory table
-        all_memories_df = semantic_memory_table.to_pandas()
-        user_memories = all_memories_df[all_memories_df['user_id'] == user_id].head(limit)
-
-        memories_list = []
-        for _, row in user_memories.iterrows():
-            memory = row.to_dict()
-            # Remove the embedding vector for readability
-            if 'embedding_vector' in memory:
-                memory['embedding_vector'] = f"[{len(memory['embedding_vector'])} dimensions]"
-            memories_list.append(memory)
+        # Raw records for this user only; the embedding is summarized by its width, never read
+        user_memories = scan_where(semantic_memory_table, "user_id", user_id, limit=limit,
+                                   columns=MEMORY_FRAME_COLUMNS)
+        dimensions = semantic_memory_table.schema.field("embedding_vector").type.list_size
+
+        memories_list = arrow_records(user_memories)
+        for memory in memories_list:
+            memory['embedding_vector'] = f"[{dimensions} dimensions]"
 
         return {
             "user_id": user_id,
-            "total_memories_in_db": len(all_memories_df),
-            "user_memories_count": len(user_memories),
+            "total_memories_in_db": semantic_memory_table.count_rows(),
+            "user_memories_count": user_memories.num_rows,
             "sample_memories": memories_list
         }
 
@@ -3313,18 +4249,32 @@ async def debug_raw_memories(user_id: str, limit: int = 10):
 def get_tavus_headers():
     return {"x-api-key": TAVUS_API_KEY, "Content-Type": "application/json"}
 
-def get_ngrok_url():
-    """Get current ngrok URL"""
+async def get_ngrok_url():
+    """Get current ngrok URL (probed at most once per NGROK_URL_TTL)"""
+    global _ngrok_url_cache
+    now = time.monotonic()
+    if _ngrok_url_cache[0] > now:
+        return _ngrok_url_cache[1]
+
+    url = None
     try:
-        response = requests.get("http://localhost:4040/api/tunnels", timeout=5)
+        response = await ngrok_client.get(NGROK_TUNNELS_URL)
         if response.status_code == 200:
             tunnels = response.json()
             for tunnel in tunnels.get("tunnels", []):
                 if tunnel.get("proto") == "https":
-                    return tunnel.get("public_url")
-    except:
+                    url = tunnel.get("public_url")
+                    break
+    except Exception:
         pass
-    return None
+    _ngrok_url_cache = (now + NGROK_URL_TTL, url)
+    return url
+
+async def _log_ngrok_url():
+    """Report the tunnel in the background so startup never waits on ngrok"""
+    ngrok_url = await get_ngrok_url()
+    if ngrok_url:
+        print(f"🌐 ngrok tunnel: {ngrok_url}")
 
 # ============================================================================
 # STARTUP
@@ -3339,6 +4289,8 @@ async def startup_event():
     db_initialized = init_database()
     if db_initialized:
         print("✅ Database initialized successfully")
+        # Warm-up calls Cohere: run it in a worker thread, outside the init lock and the event loop
+        asyncio.create_task(asyncio.to_thread(warm_caches))
     else:
         print("❌ Database initialization failed")
 
@@ -3348,11 +4300,17 @@ async def startup_event():
     if TAVUS_API_KEY:
         print("✅ Tavus API key configured")
 
-    ngrok_url = get_ngrok_url()
-    if ngrok_url:
-        print(f"🌐 ngrok tunnel: {ngrok_url}")
+    asyncio.create_task(_log_ngrok_url())
 
     print("🚀 System ready for real-time processing with database storage!")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    flush_pending_conversations()
+    flush_insight_buffer()
+    await tavus_client.aclose()
+    await ngrok_client.aclose()
+    cohere_client.close()
+
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=8000, log_level="info")
\ No newline at end of file
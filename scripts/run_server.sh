@@ -6,4 +6,11 @@ PROJECT_ROOT="$(cd "${SCRIPT_DIR}/.." && pwd)"
 export PYTHONPATH="${PYTHONPATH:-${PROJECT_ROOT}}"
 cd "${PROJECT_ROOT}"
 
-uvicorn app.main:app --host 0.0.0.0 --port 8000 --reload "$@"
+# RELOAD=true runs the single-process auto-reloader for local development
+if [[ "${RELOAD:-false}" == "true" ]]; then
+  exec uvicorn app.main:app --host 0.0.0.0 --port 8000 --reload "$@"
+fi
+
+# One worker by default: metrics, caches and throttle state live in process memory, so
+# extra workers would each serve their own copy. Raise WORKERS only for stateless endpoints.
+exec uvicorn app.main:app --host 0.0.0.0 --port 8000 --workers "${WORKERS:-1}" "$@"
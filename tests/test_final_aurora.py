@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+# The DeepSeek client is built at import; an empty key keeps analysis on the offline fallback
+os.environ.setdefault("DEEPSEEK_API_KEY", "")
+
+aurora = pytest.importorskip("final_aurora")
+
+
+def test_analysis_cache_key_is_normalized_but_prompt_keeps_original(monkeypatch):
+    seen = []
+
+    def fake_uncached(speech_text: str) -> bytes:
+        seen.append(speech_text)
+        return b'{"topic": "personal"}'
+
+    monkeypatch.setattr(aurora, "_analyze_speech_uncached", fake_uncached)
+    monkeypatch.setattr(aurora, "_analysis_cache", aurora.OrderedDict())
+
+    first = aurora._analyze_speech_cached("Hi, I'm  Maya!")
+    second = aurora._analyze_speech_cached("hi, i'm maya!")
+
+    assert first == second
+    assert seen == ["Hi, I'm  Maya!"]
+
+
+@pytest.mark.parametrize(
+    "text, topic",
+    [
+        ("I started working nights", "career"),
+        ("I worked there for years", "career"),
+        ("Homework is piling up", "career"),
+        ("Just chatting", "general"),
+    ],
+)
+def test_fallback_topic_matches_keyword_substrings(text, topic):
+    assert aurora.create_fallback_analysis(text)["topic"] == topic
+
+
+def test_fallback_keyword_inside_longer_keyword_still_counts():
+    # "care" (importance) only occurs inside "career" (topic); both must register
+    analysis = aurora.create_fallback_analysis("my career")
+    assert analysis["topic"] == "career"
+    assert analysis["importance"] == 7
+
+
+def test_user_cache_evicts_least_recently_used():
+    cache = aurora.UserCache(size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now the oldest
+    cache.put("c", 3)
+    assert cache.keys() == ["a", "c"]
+    assert cache.get("b") is None
+
+
+@pytest.fixture
+def conversation_store(monkeypatch):
+    """Throttle state isolated per test; store_conversation_record only records its calls"""
+    stored = []
+    monkeypatch.setattr(aurora, "processed_speeches", aurora.deque(maxlen=3))
+    monkeypatch.setattr(aurora, "speeches_by_conversation", {})
+    monkeypatch.setattr(aurora, "_conversation_last_stored_turn", {})
+    monkeypatch.setattr(aurora, "_conversations_pending_store", {})
+    monkeypatch.setattr(
+        aurora,
+        "store_conversation_record",
+        lambda conversation_id, user_id: stored.append(
+            (conversation_id, user_id, aurora._conversation_turns(conversation_id))
+        ),
+    )
+    return stored
+
+
+def take_turn(conversation_id: str, user_id: str = "user_1", store: bool = True):
+    record = {"conversation_id": conversation_id, "user_id": user_id}
+    aurora.processed_speeches.append(record)
+    aurora.speeches_by_conversation.setdefault(conversation_id, []).append(record)
+    if store:
+        aurora._store_conversation_throttled(conversation_id, user_id)
+
+
+def test_throttle_keeps_storing_after_processed_speeches_is_full(conversation_store):
+    # processed_speeches holds 3 speeches; the conversation runs well past that
+    for _ in range(12):
+        take_turn("conv_a")
+    assert [turns for _, _, turns in conversation_store] == [1, 6, 11]
+    assert aurora._conversations_pending_store == {"conv_a": "user_1"}
+
+
+def test_throttle_counts_turns_per_conversation(conversation_store):
+    take_turn("conv_a")
+    for _ in range(10):
+        take_turn("conv_b", store=False)
+    take_turn("conv_a")
+    # conv_b's turns do not count towards conv_a's interval
+    assert [(cid, turns) for cid, _, turns in conversation_store] == [("conv_a", 1)]
+
+
+def test_throttle_stores_first_turn_then_once_per_interval(conversation_store):
+    take_turn("conv_a")
+    assert conversation_store == [("conv_a", "user_1", 1)]
+
+    for _ in range(aurora.CONVERSATION_STORE_INTERVAL - 1):
+        take_turn("conv_a")
+    # Turns inside the interval are only marked pending
+    assert len(conversation_store) == 1
+    assert aurora._conversations_pending_store == {"conv_a": "user_1"}
+
+    take_turn("conv_a")
+    assert conversation_store[-1] == ("conv_a", "user_1", 1 + aurora.CONVERSATION_STORE_INTERVAL)
+    assert aurora._conversations_pending_store == {}
+
+
+def test_flush_pending_conversations_writes_latest_snapshot(conversation_store):
+    take_turn("conv_a")
+    take_turn("conv_a")
+    take_turn("conv_b", user_id="user_2")
+    take_turn("conv_b", user_id="user_2")
+    conversation_store.clear()
+
+    aurora.flush_pending_conversations()
+
+    assert sorted(conversation_store) == [("conv_a", "user_1", 2), ("conv_b", "user_2", 2)]
+    assert aurora._conversations_pending_store == {}
+    # Flushed conversations are finished, so their throttle state is dropped
+    assert aurora._conversation_last_stored_turn == {}
+
+    # Nothing left to write
+    aurora.flush_pending_conversations()
+    assert len(conversation_store) == 2
+
+
+def test_flush_single_conversation_leaves_others_pending(conversation_store):
+    take_turn("conv_a")
+    take_turn("conv_a")
+    take_turn("conv_b")
+    take_turn("conv_b")
+    conversation_store.clear()
+
+    aurora.flush_pending_conversations("conv_a")
+
+    assert conversation_store == [("conv_a", "user_1", 2)]
+    assert aurora._conversations_pending_store == {"conv_b": "user_1"}
+    # conv_a is finished: only conv_b's speeches are still tracked
+    assert list(aurora.speeches_by_conversation) == ["conv_b"]
+    assert list(aurora._conversation_last_stored_turn) == ["conv_b"]
+
+
+@pytest.fixture
+def aurora_db(tmp_path, monkeypatch):
+    """A fresh ./aurora_db under tmp_path; module table globals are restored afterwards"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(aurora, "COHERE_API_KEY", None)  # local fallback embeddings only
+    for name in ("db", "users_table", "conversations_table", "insights_table",
+                 "semantic_memory_table", "_db_ready"):
+        monkeypatch.setattr(aurora, name, getattr(aurora, name))
+    assert aurora.init_database()
+    from fastapi.testclient import TestClient
+
+    return TestClient(aurora.app)
+
+
+def test_insights_etag_returns_304_until_an_insight_flush(aurora_db):
+    client = aurora_db
+    url = "/api/users/etag_user/insights"
+
+    first = client.get(url)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+    aurora.store_deep_insights(["Opens up about family"], "real_time_analysis", user_id="etag_user",
+                               conversation_id="conv_1", speech_id="speech_1")
+    aurora.flush_insight_buffer()
+
+    after = client.get(url, headers={"If-None-Match": etag})
+    assert after.status_code == 200
+    assert after.headers["etag"] != etag
+    assert after.json()["total_insights"] == 1
+
+
+def test_profile_etag_is_invalidated_by_profile_update(aurora_db):
+    client = aurora_db
+    url = "/api/users/etag_user"
+
+    first = client.get(url)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+    update = client.post("/api/user/etag_user/profile", params={"bio": "Studies computer science."})
+    assert update.json()["bio"] == "Studies computer science."
+
+    after = client.get(url, headers={"If-None-Match": etag})
+    assert after.status_code == 200
+    assert after.headers["etag"] != etag
+
+
+def test_user_traits_are_returned_as_copies(aurora_db):
+    aurora.store_user_traits("traits_user", {"bio": "Plays chess."})
+
+    traits = aurora.get_user_traits("traits_user")
+    traits["bio"] = "mutated"
+
+    assert aurora.get_user_traits("traits_user")["bio"] == "Plays chess."
+
+
+def test_context_is_not_cached_when_a_read_failed(aurora_db, monkeypatch):
+    def failing_stats(user_id):
+        aurora._note_read_failure()
+        return {}
+
+    monkeypatch.setattr(aurora, "get_user_memory_stats", failing_stats)
+    aurora.build_context_from_db("context_user")
+    assert aurora._context_cache.get("context_user") is None
+
+    monkeypatch.setattr(aurora, "get_user_memory_stats", lambda user_id: {"total_memories": 3})
+    context = aurora.build_context_from_db("context_user")
+    assert "Stored memories: 3." in context
+    assert aurora._context_cache.get("context_user")[1] == context
+
+
+def test_memory_write_drops_cached_recent_memories(aurora_db):
+    aurora._memory_cache.put("recent_user", ([{"text": "stale"}], aurora.time.time()))
+    aurora._invalidate_user_memory("recent_user")
+    assert aurora._memory_cache.get("recent_user") is None
+
+
+def test_fallback_insights_read_the_speeches_they_are_given(monkeypatch):
+    # The live column store holds nothing; only the passed-in speeches can drive the insights
+    monkeypatch.setattr(aurora, "speech_columns", aurora.SpeechColumns(maxlen=4))
+    speeches = [{"analysis": {"topic": "personal", "emotion": "calm", "vulnerability": 8}}] * 3
+
+    insights = aurora.generate_fallback_insights(speeches)
+
+    assert "Comfortable with personal disclosure and self-reflection" in insights
+    assert "Demonstrates high trust and openness in communication" in insights
+
+
+def test_clear_test_data_only_matches_the_literal_prefix(aurora_db):
+    client = aurora_db
+    aurora.store_user_name("test_user_1", "Tess")
+    aurora.store_user_name("testXuser", "Rex")
+
+    response = client.delete("/api/database/clear-test-data")
+
+    assert response.json()["cleared_records"]["users"] == 1
+    assert aurora.get_user_name("test_user_1") is None  # cached name dropped with the row
+    assert aurora.get_user_name("testXuser") == "Rex"
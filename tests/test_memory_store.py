@@ -62,3 +62,18 @@ def test_query_by_id(temp_settings):
     fetched = store.get_by_ids([record.id])
     assert len(fetched) == 1
     assert fetched[0].id == record.id
+
+
+def test_latest_for_conversation_limit(temp_settings):
+    store = MemoryStore(settings=temp_settings)
+    store.upsert([make_record(i) for i in range(5)])
+    latest = store.latest_for_conversation("conv-1", limit=2)
+    assert [record.turn for record in latest] == [3, 4]
+    assert len(store.all_records(limit=3)) == 3
+
+
+def test_vectors_round_trip_through_int8(temp_settings):
+    store = MemoryStore(settings=temp_settings)
+    store.upsert([make_record(3)])
+    stored = store.all_records()[0]
+    assert stored.vector == pytest.approx([0.1, 0.2, 0.3], abs=0.3 / 127)